@@ -60,7 +60,7 @@ class ActionMapController(QObject):
         # Update active behaviors display
         active_behaviors = self._model.get_active_behaviors()
         self._view.update_active_behaviors(active_behaviors)
-        self.logger.debug(f"Active behaviors updated: {active_behaviors}")
+        self.logger.debug("Active behaviors updated: %s", active_behaviors)
     
     @Slot(str, str, str)
     def on_edit_mapping_requested(self, key, behavior, kind="state"):
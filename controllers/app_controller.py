@@ -4,7 +4,7 @@ import threading
 from version import __version__
 from PySide6.QtCore import QObject, Slot, QTimer, Qt
 from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QWidget, QVBoxLayout
+from PySide6.QtWidgets import QApplication, QMessageBox, QWidget, QVBoxLayout
 
 from models.video_model import VideoModel
 from models.action_map_model import ActionMapModel
@@ -14,8 +14,8 @@ from models.annotation_model import AnnotationModel
 from models.project_model import ProjectModel
 
 from views.main_window import MainWindow
-from views.project_view import ProjectView
-from views.log_viewer_dialog import LogViewerDialog
+# ProjectView / LogViewerDialog: lazily imported in _ensure_project /
+# show_log_viewer; neither is needed until the user opens them.
 # NOTE (PR-STARTUP-02): VisualizationView / ReliabilityView are imported lazily
 # inside _ensure_visualization / _ensure_reliability so matplotlib (and the
 # reliability stats stack) do not load at startup -- Annotation-first shell.
@@ -24,7 +24,7 @@ from controllers.video_controller import VideoController
 from controllers.annotation_controller import AnnotationController
 from controllers.action_map_controller import ActionMapController
 # AnalysisController: lazily imported in _ensure_analysis (PR-STARTUP-04).
-from controllers.project_controller import ProjectController
+# ProjectController: lazily imported in _ensure_project alongside its view.
 # VisualizationController / ReliabilityController: lazily imported in
 # _ensure_visualization / _ensure_reliability (see note above).
 
@@ -36,6 +36,19 @@ from utils.app_icon import find_app_icon_path
 
 _HEAVY_IMPORT_THREAD_FACTORY = threading.Thread
 
+# Interval between automatic in-session log cleanups.
+_LOG_CLEANUP_INTERVAL_MS = 24 * 60 * 60 * 1000
+
+# Plain-text About message shown if the rich AboutDialog cannot be built.
+_ABOUT_FALLBACK_TEXT = (
+    f"RABET - Real-time Animal Behavior Event Tagger\n\n"
+    f"Version: {__version__}\n"
+    f"© 2026 Koshiro Mitsui\n"
+    "Released under the MIT License.\n"
+    "Repository: https://github.com/mi2e-K/RABET\n"
+    "DOI (all versions): https://doi.org/10.5281/zenodo.15313025"
+)
+
 class AppController(QObject):
     """
     Main application controller that coordinates other controllers.
@@ -57,17 +70,21 @@ class AppController(QObject):
         # by FileManager.
         self.config_manager = ConfigManager(self.file_manager)
 
-        # Initialize log manager
-        self.log_manager = LogManager()
+        # Log manager is only needed by the log viewer / cleanup actions, so
+        # it is built on first use (_ensure_log_manager).
+        self.log_manager = None
+        # Log viewer dialog, created on first open and reused afterwards.
+        self._log_viewer = None
+        # Set by shutdown() so a second aboutToQuit call is a no-op.
+        self._shut_down = False
 
         # Initialize theme manager
         self.theme_manager = ThemeManager()
         
-        # Schedule periodic log cleanup
-        self.log_cleanup_timer = QTimer(self)
-        self.log_cleanup_timer.setInterval(24 * 60 * 60 * 1000)  # 24 hours
-        self.log_cleanup_timer.timeout.connect(self.perform_log_cleanup)
-        self.log_cleanup_timer.start()
+        # Schedule periodic log cleanup. Each run re-arms a single-shot timer
+        # (see _perform_log_cleanup_auto) instead of keeping a repeating
+        # QTimer alive for the whole session.
+        self._schedule_log_cleanup()
 
         # Application directories are ensured in ``main.py`` before the
         # QApplication is created; no duplicate call is necessary here.
@@ -76,7 +93,6 @@ class AppController(QObject):
         self.video_model = VideoModel()
         # Stop the video decode worker thread cleanly on application exit (the
         # model runs PyAV on its own QThread, A-1).
-        from PySide6.QtWidgets import QApplication
         _app = QApplication.instance()
         if _app is not None:
             _app.aboutToQuit.connect(self.video_model.shutdown)
@@ -97,6 +113,10 @@ class AppController(QObject):
         # Initialize main window
         self.main_window = MainWindow()
         
+        # Resolved application icon; built on the first successful
+        # set_application_icon() and reused by later calls (show_main_window).
+        self._app_icon = None
+
         # Set application window icon
         self.set_application_icon()
         
@@ -107,11 +127,16 @@ class AppController(QObject):
             "Analysis", self.main_window.analysis_view, self._ensure_analysis
         )
 
-        # Initialize project view
-        self.project_view = ProjectView()
-
-        # Add the (lightweight) Project view eagerly.
-        self.main_window.add_view("Project", self.project_view)
+        # The Project view/controller are only needed once the user opens the
+        # Project tab (or binds an action map to a project), so they are built
+        # on demand in _ensure_project, like the heavy tabs below.
+        self.project_view = None
+        self.project_controller = None
+        self._project_container = QWidget()
+        QVBoxLayout(self._project_container).setContentsMargins(0, 0, 0, 0)
+        self.main_window.register_lazy_view(
+            "Project", self._project_container, self._ensure_project
+        )
 
         # Visualization and Reliability are matplotlib-backed and dominate
         # startup construction time. Build them lazily on first tab switch
@@ -142,17 +167,6 @@ class AppController(QObject):
             self.main_window,
             self.main_window.timeline_view
         )
-        # analysis_controller is built lazily in _ensure_analysis (None for now);
-        # project_controller only stores the reference and never calls it.
-        self.project_controller = ProjectController(
-            self.project_model,
-            self.project_view,
-            self.video_controller,
-            self.action_map_controller,
-            self.annotation_controller,
-            self.analysis_controller
-        )
-        
         # Visualization / Reliability controllers are created lazily alongside
         # their views (see _ensure_visualization / _ensure_reliability). The
         # analysis -> visualize bridge is wired eagerly; its handler builds the
@@ -173,7 +187,6 @@ class AppController(QObject):
         # fires only on app-level (in)activation, never on in-window focus
         # changes.
         try:
-            from PySide6.QtWidgets import QApplication
             app = QApplication.instance()
             if app is not None:
                 app.applicationStateChanged.connect(self._on_application_state_changed)
@@ -225,6 +238,11 @@ class AppController(QObject):
         # (e.g. Open Recent Video) can drive video loads without going
         # through AppController plumbing.
         self.main_window.video_controller = self.video_controller
+
+        # Drop the cross-object signal connections and back-references on
+        # exit so models/controllers are not kept alive by the window.
+        if _app is not None:
+            _app.aboutToQuit.connect(self.shutdown)
     
     def connect_action_map_to_timeline(self):
         """Connect action map changes to timeline color management."""
@@ -237,6 +255,7 @@ class AppController(QObject):
         self.logger.info("Connected action map changes to timeline color management")
 
     # Handle files dropped on visualization view
+    @Slot(list)
     def handle_visualization_files_dropped(self, file_paths):
         """
         Handle files dropped on the visualization view.
@@ -353,11 +372,41 @@ class AppController(QObject):
         )
         # project_controller kept a None placeholder; keep it consistent (it only
         # stores the reference today, never calls it).
-        if hasattr(self, "project_controller"):
+        if self.project_controller is not None:
             self.project_controller._analysis_controller = self.analysis_controller
         self.analysis_model.error_occurred.connect(self.main_window.show_error)
         self.logger.debug("Analysis tab constructed lazily")
 
+    def _ensure_project(self):
+        """Lazily construct the Project view + controller.
+
+        Idempotent: safe to call from the tab-switch builder and from menu
+        actions that need the project controller.
+        """
+        if self.project_view is not None:
+            return
+        from controllers.project_controller import ProjectController
+        from views.project_view import ProjectView
+        self.project_view = ProjectView()
+        self._project_container.layout().addWidget(self.project_view)
+        # analysis_controller may still be None (built in _ensure_analysis);
+        # project_controller only stores the reference and never calls it.
+        self.project_controller = ProjectController(
+            self.project_model,
+            self.project_view,
+            self.video_controller,
+            self.action_map_controller,
+            self.annotation_controller,
+            self.analysis_controller
+        )
+        self.logger.debug("Project tab constructed lazily")
+
+    def _ensure_log_manager(self):
+        """Return the LogManager, constructing it on first use."""
+        if self.log_manager is None:
+            self.log_manager = LogManager()
+        return self.log_manager
+
     def _ensure_visualization(self):
         """Lazily construct the Visualization view + controller (Phase 5-2).
 
@@ -403,27 +452,38 @@ class AppController(QObject):
         )
 
     def set_application_icon(self):
-        """Set the application and window icons."""
-        icon_path = find_app_icon_path()
-        
-        if not icon_path:
-            self.logger.warning("Application icon not found in any of the expected locations")
-            return
-        
-        try:
-            self.logger.debug(f"Setting application icon from: {icon_path}")
-            
-            # Create icon
-            app_icon = QIcon(icon_path)
-            
-            # Verify the icon was loaded successfully
-            if app_icon.isNull():
-                self.logger.error(f"Failed to load icon from {icon_path} - icon is null")
+        """Set the application and window icons.
+
+        The icon search stats several candidate paths, so the loaded QIcon is
+        cached on first success and reused on later calls.
+        """
+        if self._app_icon is None:
+            icon_path = find_app_icon_path()
+
+            if not icon_path:
+                self.logger.warning("Application icon not found in any of the expected locations")
+                return
+
+            try:
+                self.logger.debug(f"Setting application icon from: {icon_path}")
+
+                # Create icon
+                app_icon = QIcon(icon_path)
+
+                # Verify the icon was loaded successfully
+                if app_icon.isNull():
+                    self.logger.error(f"Failed to load icon from {icon_path} - icon is null")
+                    return
+            except Exception as e:
+                self.logger.error(f"Error setting application icon: {str(e)}")
                 return
-                
+
+            self._app_icon = app_icon
+
+        try:
             # Set the window icon
             if self.main_window:
-                self.main_window.setWindowIcon(app_icon)
+                self.main_window.setWindowIcon(self._app_icon)
                 self.logger.debug("Window icon set successfully")
         except Exception as e:
             self.logger.error(f"Error setting application icon: {str(e)}")
@@ -437,9 +497,13 @@ class AppController(QObject):
         self.main_window.center_on_screen()
         
         # Ensure the icon is properly set after the window is shown
-        # This helps with taskbar icon issues
+        # This helps with taskbar icon issues. Reuse the icon loaded in
+        # __init__; only search the disk again if that load failed.
         if self.main_window and self.main_window.windowIcon().isNull():
-            self.set_application_icon()
+            if self._app_icon is not None:
+                self.main_window.setWindowIcon(self._app_icon)
+            else:
+                self.set_application_icon()
         
         self.logger.debug("Main window shown and centered on screen")
 
@@ -460,7 +524,7 @@ class AppController(QObject):
         self.main_window.save_action_map_action.triggered.connect(self.action_map_controller.save_action_map_dialog)
         self.main_window.reset_action_map_action.triggered.connect(self.action_map_controller.reset_to_default)
         self.main_window.bind_action_map_action.triggered.connect(
-            self.project_controller.bind_current_action_map_dialog
+            self.bind_current_action_map_dialog
         )
 
         self.main_window.export_annotations_action.triggered.connect(self.annotation_controller.export_annotations_dialog)
@@ -483,13 +547,57 @@ class AppController(QObject):
         # Connect video player toggle play function to space key
         self.main_window.video_player_view.toggle_play = self.toggle_play_pause
         
-        # Connect error signals
-        self.video_model.error_occurred.connect(self.main_window.show_error)
-        self.action_map_model.error_occurred.connect(self.main_window.show_error)
-        self.annotation_model.error_occurred.connect(self.main_window.show_error)
-        # analysis_model.error_occurred is connected in _ensure_analysis (lazy).
-        self.project_model.error_occurred.connect(self.main_window.show_error)
+        # Connect error signals. analysis_model is still None here; its
+        # error_occurred is connected in _ensure_analysis (lazy).
+        show_error = self.main_window.show_error
+        for model in self._error_reporting_models():
+            model.error_occurred.connect(show_error)
+
+    def _error_reporting_models(self):
+        """Return the constructed models whose errors surface in the main window."""
+        return tuple(
+            model for model in (
+                self.video_model,
+                self.action_map_model,
+                self.annotation_model,
+                self.analysis_model,
+                self.project_model,
+            )
+            if model is not None
+        )
     
+    @Slot()
+    def shutdown(self):
+        """Release the connections and references made in __init__.
+
+        Idempotent; run on ``aboutToQuit``. Disconnects the models'
+        ``error_occurred`` signals from the main window and breaks the
+        main window's back-reference to the annotation controller.
+        """
+        if self._shut_down:
+            return
+        self._shut_down = True
+
+        show_error = self.main_window.show_error
+        for model in self._error_reporting_models():
+            try:
+                model.error_occurred.disconnect(show_error)
+            except (RuntimeError, TypeError):
+                pass
+
+        if self._log_viewer is not None:
+            self._log_viewer.refresh_timer.stop()
+
+        self.main_window.annotation_controller = None
+        self.logger.debug("AppController shut down")
+
+    @Slot()
+    def bind_current_action_map_dialog(self):
+        """Forward the bind-action-map menu action to the (lazy) project controller."""
+        self._ensure_project()
+        self.project_controller.bind_current_action_map_dialog()
+
+    @Slot()
     def toggle_play_pause(self):
         """Toggle between play and pause states."""
         if self.video_model.is_playing():
@@ -510,6 +618,7 @@ class AppController(QObject):
             except Exception:
                 self.logger.exception("on_application_inactive handler failed")
     
+    @Slot()
     def handle_exit_action(self):
         """Handle File > Exit.
 
@@ -526,8 +635,6 @@ class AppController(QObject):
         prompt about unsaved in-memory annotations, then about an unsaved
         project. Returns True to proceed with the close, False to veto it.
         """
-        from PySide6.QtWidgets import QMessageBox
-
         ac = self.annotation_controller
 
         # 1. Stop an in-progress recording. stop_timed_recording finalises all
@@ -562,7 +669,14 @@ class AppController(QObject):
         except Exception:
             self.logger.exception("confirm_application_close: annotation check failed")
 
-        # 3. Unsaved project.
+        # 3. Unsaved project. Debounced file-list saves are flushed first so
+        #    they do not count as unsaved changes.
+        try:
+            if self.project_controller is not None:
+                self.project_controller.flush_pending_save()
+        except Exception:
+            self.logger.exception("confirm_application_close: project save flush failed")
+
         try:
             if self.project_model.is_project_open() and self.project_model.is_modified():
                 result = QMessageBox.question(
@@ -584,34 +698,55 @@ class AppController(QObject):
 
         return True
     
+    def _schedule_log_cleanup(self):
+        """Arm the next automatic log cleanup, 24 hours from now."""
+        QTimer.singleShot(_LOG_CLEANUP_INTERVAL_MS, self, self._perform_log_cleanup_auto)
+
+    def _cleanup_logs(self, trigger):
+        """Run the log cleanup shared by the timer and menu slots.
+
+        Returns:
+            tuple: (deleted_old, deleted_excess)
+        """
+        deleted_old, deleted_excess = self._ensure_log_manager().cleanup_old_logs()
+        self.logger.info(f"{trigger} log cleanup: {deleted_old} old files and {deleted_excess} excess files deleted")
+        return deleted_old, deleted_excess
+
+    @Slot()
+    def _perform_log_cleanup_auto(self):
+        """Timer-driven log cleanup: no UI, always re-arms the next run."""
+        try:
+            self._cleanup_logs("Automatic")
+        except Exception as e:
+            self.logger.error(f"Error during log cleanup: {str(e)}")
+        finally:
+            self._schedule_log_cleanup()
+
+    @Slot()
     def perform_log_cleanup(self):
-        """Perform automatic log cleanup."""
+        """Perform a user-requested log cleanup and report the result."""
         try:
-            deleted_old, deleted_excess = self.log_manager.cleanup_old_logs()
-            self.logger.info(f"Automatic log cleanup: {deleted_old} old files and {deleted_excess} excess files deleted")
-            
-            # Show notification if called manually (not via timer)
-            sender = self.sender()
-            if sender and not isinstance(sender, QTimer):
-                from PySide6.QtWidgets import QMessageBox
-                QMessageBox.information(
-                    self.main_window,
-                    "Log Cleanup Complete",
-                    f"Removed {deleted_old} old log files and {deleted_excess} excess files."
-                )
+            deleted_old, deleted_excess = self._cleanup_logs("Manual")
+
+            QMessageBox.information(
+                self.main_window,
+                "Log Cleanup Complete",
+                f"Removed {deleted_old} old log files and {deleted_excess} excess files."
+            )
         except Exception as e:
             self.logger.error(f"Error during log cleanup: {str(e)}")
-            
-            # Show error if called manually
-            sender = self.sender()
-            if sender and not isinstance(sender, QTimer):
-                self.main_window.show_error(f"Error during log cleanup: {str(e)}")
+            self.main_window.show_error(f"Error during log cleanup: {str(e)}")
     
+    @Slot()
     def show_log_viewer(self):
         """Show the log viewer dialog."""
         try:
-            log_viewer = LogViewerDialog(self.log_manager, self.main_window)
-            log_viewer.exec()
+            if self._log_viewer is None:
+                from views.log_viewer_dialog import LogViewerDialog
+                self._log_viewer = LogViewerDialog(self._ensure_log_manager(), self.main_window)
+            else:
+                self._log_viewer.refresh()
+            self._log_viewer.exec()
         except Exception as e:
             self.logger.error(f"Error showing log viewer: {str(e)}")
             self.main_window.show_error(f"Error showing log viewer: {str(e)}")
@@ -639,11 +774,4 @@ class AppController(QObject):
             self.logger.error(f"Failed to open About dialog: {exc}", exc_info=True)
             # Fall back to the plain-text message box if the rich dialog
             # cannot be constructed for some reason.
-            self.main_window.show_info(
-                f"RABET - Real-time Animal Behavior Event Tagger\n\n"
-                f"Version: {__version__}\n"
-                f"© 2026 Koshiro Mitsui\n"
-                "Released under the MIT License.\n"
-                "Repository: https://github.com/mi2e-K/RABET\n"
-                "DOI (all versions): https://doi.org/10.5281/zenodo.15313025"
-            )
+            self.main_window.show_info(_ABOUT_FALLBACK_TEXT)
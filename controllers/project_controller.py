@@ -1,9 +1,25 @@
 # controllers/project_controller.py - Updated for enhanced video management and annotation workflow
 import logging
 import os
-from PySide6.QtCore import QObject, Slot
+import platform
+import subprocess
+from PySide6.QtCore import QObject, Slot, QTimer
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 
+
+# Opener for "open with the default application", resolved once at import:
+# platform.system() is not free (it may shell out to uname).
+_PLATFORM_SYSTEM = platform.system()
+if _PLATFORM_SYSTEM == 'Windows':
+    _open_path_with_default_app = os.startfile
+elif _PLATFORM_SYSTEM == 'Darwin':  # macOS
+    def _open_path_with_default_app(path):
+        subprocess.run(['open', path], check=True)
+else:  # Linux
+    def _open_path_with_default_app(path):
+        subprocess.run(['xdg-open', path], check=True)
+
+
 class ProjectController(QObject):
     """
     Controller for managing research projects.
@@ -27,6 +43,27 @@ class ProjectController(QObject):
         self._annotation_controller = annotation_controller
         self._analysis_controller = analysis_controller
         self._suppress_next_saved_message = False
+
+        # file_type -> handler for the Project view's add/open requests.
+        self._add_file_handlers = {
+            "videos": self._model.add_video,
+            "annotations": self._model.add_annotation,
+            "action_maps": self._model.add_action_map,
+            "analyses": self._model.add_analysis,
+        }
+        self._open_file_handlers = {
+            "videos": self._open_video,
+            "annotations": self._open_annotation,
+            "action_maps": self._open_action_map,
+            "analyses": self._open_analysis,
+        }
+
+        # File additions/removals mark the project dirty and persist it once
+        # the burst settles, instead of rewriting project.json on every file.
+        self._save_debounce = QTimer(self)
+        self._save_debounce.setSingleShot(True)
+        self._save_debounce.setInterval(500)
+        self._save_debounce.timeout.connect(self._save_project_silently)
         
         # Connect model signals
         self._connect_model_signals()
@@ -52,6 +89,7 @@ class ProjectController(QObject):
         self._view.description_changed.connect(self.on_description_changed)
         
         self._view.add_file_requested.connect(self.on_add_file_requested)
+        self._view.add_files_requested.connect(self.on_add_files_requested)
         self._view.remove_file_requested.connect(self.on_remove_file_requested)
         self._view.open_file_requested.connect(self.on_open_file_requested)
         
@@ -409,17 +447,9 @@ class ProjectController(QObject):
         if hasattr(self._annotation_controller, 'clear_project_context'):
             self._annotation_controller.clear_project_context()
         
-        # Update view to show no project
-        self._view.set_project_name("")
-        self._view.set_project_path("")
-        self._view.set_project_description("")
-        self._view.set_project_dates("", "")
-        
-        # Clear file lists
-        self._view.update_videos([])
-        self._view.update_annotations([])
-        self._view.update_action_maps([])
-        self._view.update_analyses([])
+        # Update view to show no project and clear the file lists
+        self._view.set_project_metadata("", "", "", "", "")
+        self._view.update_all_files({})
     
     @Slot(str)
     def on_error(self, error_message):
@@ -438,6 +468,17 @@ class ProjectController(QObject):
             error_message
         )
 
+    def flush_pending_save(self):
+        """Write a debounced file-list save immediately, if one is pending.
+
+        Called before the project is closed (and on application exit) so the
+        last additions/removals are not left unsaved.
+        """
+        if self._save_debounce.isActive():
+            self._save_debounce.stop()
+            self._save_project_silently()
+
+    @Slot()
     def _save_project_silently(self):
         """Persist project changes without showing a transient success popup."""
         self._suppress_next_saved_message = True
@@ -471,6 +512,7 @@ class ProjectController(QObject):
                 return
             
             # Close current project
+            self.flush_pending_save()
             self._model.close_project()
         
         # Create new project
@@ -499,6 +541,7 @@ class ProjectController(QObject):
                 return
             
             # Close current project
+            self.flush_pending_save()
             self._model.close_project()
         
         # Load project
@@ -516,6 +559,10 @@ class ProjectController(QObject):
     def on_close_project_requested(self):
         """Handle close project requested event."""
         self.logger.debug("Close project requested")
+
+        # File-list edits are saved automatically; land any pending one so
+        # only genuinely unsaved changes trigger the prompt below.
+        self.flush_pending_save()
         
         # Check if project has unsaved changes
         if self._model.is_modified():
@@ -563,25 +610,46 @@ class ProjectController(QObject):
         self.logger.debug(f"Add {file_type} requested: {file_path} (copy={copy_to_project})")
         
         # Add file based on type
-        if file_type == "videos":
-            success = self._model.add_video(file_path, copy_to_project)
-        elif file_type == "annotations":
-            success = self._model.add_annotation(file_path, copy_to_project)
-        elif file_type == "action_maps":
-            success = self._model.add_action_map(file_path, copy_to_project)
-        elif file_type == "analyses":
-            success = self._model.add_analysis(file_path, copy_to_project)
-        else:
+        add_file = self._add_file_handlers.get(file_type)
+        if add_file is None:
             self.logger.error(f"Invalid file type: {file_type}")
             return
         
-        if success:
+        if add_file(file_path, copy_to_project):
             # Update view with new file lists
             self._update_file_lists()
             
-            # Save project to persist changes
-            self._save_project_silently()
+            # Persist once the burst of additions settles
+            self._save_debounce.start()
     
+    @Slot(str, list, bool)
+    def on_add_files_requested(self, file_type, file_paths, copy_to_project=False):
+        """
+        Handle a request to add several files of one type.
+
+        The file lists are refreshed once for the whole selection instead of
+        once per file.
+
+        Args:
+            file_type (str): Type of file (videos, annotations, action_maps, analyses)
+            file_paths (list): Paths to the files
+            copy_to_project (bool): Whether to copy the files to the project directory
+        """
+        self.logger.debug(
+            "Add %d %s requested (copy=%s)", len(file_paths), file_type, copy_to_project
+        )
+
+        if file_type not in self._add_file_handlers:
+            self.logger.error(f"Invalid file type: {file_type}")
+            return
+
+        if any(self._model.add_files(file_paths, file_type, copy_to_project)):
+            # Update view with new file lists
+            self._update_file_lists()
+
+            # Persist once the burst of additions settles
+            self._save_debounce.start()
+
     @Slot(str, str)
     def on_remove_file_requested(self, file_type, file_path):
         """
@@ -598,8 +666,8 @@ class ProjectController(QObject):
             # Update view with new file lists
             self._update_file_lists()
             
-            # Save project to persist changes
-            self._save_project_silently()
+            # Persist once the burst of removals settles
+            self._save_debounce.start()
     
     @Slot(str, str)
     def on_open_file_requested(self, file_type, file_path):
@@ -611,6 +679,11 @@ class ProjectController(QObject):
             file_path (str): Path to the file
         """
         self.logger.debug(f"Open {file_type} requested: {file_path}")
+
+        open_file = self._open_file_handlers.get(file_type)
+        if open_file is None:
+            self.logger.error(f"Invalid file type: {file_type}")
+            return
         
         # Resolve path if it's relative
         resolved_path = self._model.resolve_path(file_path)
@@ -624,16 +697,7 @@ class ProjectController(QObject):
             return
         
         # Open file based on type
-        if file_type == "videos":
-            self._open_video(resolved_path)
-        elif file_type == "annotations":
-            self._open_annotation(resolved_path)
-        elif file_type == "action_maps":
-            self._open_action_map(resolved_path)
-        elif file_type == "analyses":
-            self._open_analysis(resolved_path)
-        else:
-            self.logger.error(f"Invalid file type: {file_type}")
+        open_file(resolved_path)
     
     @Slot(str)
     def on_annotate_video_requested(self, video_path):
@@ -798,16 +862,8 @@ class ProjectController(QObject):
         Args:
             file_path (str): Path to the file
         """
-        import subprocess
-        import platform
-        
         try:
-            if platform.system() == 'Windows':
-                os.startfile(file_path)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', file_path], check=True)
-            else:  # Linux
-                subprocess.run(['xdg-open', file_path], check=True)
+            _open_path_with_default_app(file_path)
         except Exception as e:
             self.logger.error(f"Failed to open file with default application: {str(e)}")
             QMessageBox.warning(
@@ -818,15 +874,15 @@ class ProjectController(QObject):
     
     def _update_view_with_project_info(self):
         """Update view with current project information."""
-        # Update project info
-        self._view.set_project_name(self._model.get_project_name())
-        self._view.set_project_path(self._model.get_project_path())
-        self._view.set_project_description(self._model.get_project_description())
-        
-        # Update dates
-        self._view.set_project_dates(
-            self._model.get_project_creation_date(),
-            self._model.get_project_modification_date()
+        model = self._model
+
+        # Update project info and dates
+        self._view.set_project_metadata(
+            model.get_project_name(),
+            model.get_project_path(),
+            model.get_project_description(),
+            model.get_project_creation_date(),
+            model.get_project_modification_date()
         )
         
         # Name the active action map scope in the annotation panel (1.4.2).
@@ -846,11 +902,18 @@ class ProjectController(QObject):
     
     def _update_file_lists(self):
         """Update view with current file lists."""
+        model = self._model
+
         # Get annotation status for videos
-        annotation_status = self._model.get_video_annotation_status()
+        annotation_status = model.get_video_annotation_status()
         
         # Update file lists
-        self._view.update_videos(self._model.get_videos(), annotation_status)
-        self._view.update_annotations(self._model.get_annotations())
-        self._view.update_action_maps(self._model.get_action_maps())
-        self._view.update_analyses(self._model.get_analyses())
+        self._view.update_all_files(
+            {
+                "videos": model.get_videos(),
+                "annotations": model.get_annotations(),
+                "action_maps": model.get_action_maps(),
+                "analyses": model.get_analyses(),
+            },
+            annotation_status,
+        )
@@ -2,6 +2,7 @@
 import logging
 import os
 import json
+import pandas as pd
 from PySide6.QtCore import QObject, Slot
 from PySide6.QtWidgets import QMessageBox
 from utils.annotation_csv_parser import load_event_dataframe
@@ -390,7 +391,11 @@ class VisualizationController(QObject):
             raw_data = {}
             if hasattr(analysis_model, '_raw_data'):
                 for file_path, df in analysis_model._raw_data.items():
-                    raw_data[file_path] = df.copy()
+                    if df is None:
+                        # Summary-only file: no events, but keep its row.
+                        raw_data[file_path] = pd.DataFrame(columns=['Event', 'Onset', 'Offset'])
+                    else:
+                        raw_data[file_path] = df.copy()
             
             if raw_data:
                 self._visualization_data.update(raw_data)
@@ -1,10 +1,20 @@
 # models/action_map_model.py
 import json
 import logging
+import sys
+import types
+from contextlib import contextmanager
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal, QTimer
 from utils.config_path_manager import ConfigPathManager  # Import the new class
 from utils.defaults import default_action_map
+from utils.file_manager import atomic_write_text
+
+# Behaviour kinds understood by the model (1.4.0).
+_VALID_KINDS = frozenset(("state", "point"))
+
+# Default for ``dict.pop`` when a key may be absent.
+_MISSING = object()
 
 class ActionMapModel(QObject):
     """
@@ -14,11 +24,15 @@ class ActionMapModel(QObject):
         map_changed: Emitted when the action map changes
         active_behaviors_changed: Emitted when active behaviors change
         error_occurred: Emitted when an error occurs
+        state_changed: Emitted alongside each of the three above with a tag
+            ("map", "active" or "error") and payload (the error message, else
+            None), for consumers that want a single connection
     """
     
     map_changed = Signal()
     active_behaviors_changed = Signal()  # New signal for active behavior changes
     error_occurred = Signal(str)
+    state_changed = Signal(str, object)
 
     mapping_added = Signal(str, str)
     mapping_updated = Signal(str, str)
@@ -42,6 +56,12 @@ class ActionMapModel(QObject):
         # string for state, an object for point) by ``_serialize_map`` (1.4.0).
         self._behavior_kinds = {}
         self._active_behaviors = set()  # Currently active behaviors
+        # Read-only snapshot handed out by ``get_all_mappings``; rebuilt
+        # lazily after any change to ``_action_map``.
+        self._all_mappings_cache = None
+        # Same idea for ``get_active_behaviors``; also dropped whenever the
+        # active set changes.
+        self._active_cache = None
         
         # Setup auto-save timer
         self._auto_save_timer = QTimer()
@@ -49,6 +69,19 @@ class ActionMapModel(QObject):
         self._auto_save_timer.timeout.connect(self._auto_save)
         self._auto_save_pending = False
 
+        # Zero-delay timer that coalesces active_behaviors_changed: several
+        # toggles within one event-loop turn (a multi-key combo) reach the
+        # view as a single emission.
+        self._active_emit_timer = QTimer(self)
+        self._active_emit_timer.setSingleShot(True)
+        self._active_emit_timer.setInterval(0)
+        self._active_emit_timer.timeout.connect(self.active_behaviors_changed)
+
+        # Nesting depth of ``batch()`` blocks; while non-zero, map_changed is
+        # held back and emitted once when the outermost block exits.
+        self._batch_depth = 0
+        self._map_changed_pending = False
+
         # Project scope (1.4.2). When a project with a bound action map is
         # open this holds that map's absolute path, and every auto-save is
         # redirected to it instead of user_action_map.json. The global map is
@@ -56,6 +89,11 @@ class ActionMapModel(QObject):
         # during the project belong to the project. ``None`` = global scope.
         self._project_map_path = None
 
+        # Mirror the individual signals onto state_changed.
+        self.map_changed.connect(self._forward_map_changed)
+        self.active_behaviors_changed.connect(self._forward_active_behaviors_changed)
+        self.error_occurred.connect(self._forward_error_occurred)
+
         # Flag to track if we've loaded successfully
         self._loaded_successfully = False
         
@@ -122,6 +160,7 @@ class ActionMapModel(QObject):
 
             self._action_map = default_map
             self._behavior_kinds = {}  # bundled defaults are all state
+            self._invalidate_map_caches()
             self._loaded_successfully = True
 
             # Don't emit signal during initialization
@@ -157,43 +196,18 @@ class ActionMapModel(QObject):
             # Action maps are meant to be shared and hand-edited, so they can
             # arrive as UTF-8 (with or without a BOM) rather than the ASCII
             # this model writes. Reading them with the platform codepage
-            # rejected Japanese behaviour labels outright.
-            with open(json_path, 'r', encoding='utf-8-sig') as f:
-                data = json.load(f)
+            # rejected Japanese behaviour labels outright. Reading the raw
+            # bytes in one call and handing them to ``json.loads`` lets it
+            # detect the encoding (BOM included) without a text-mode decode
+            # pass.
+            with open(json_path, 'rb') as f:
+                data = json.loads(f.read())
             
-            # Validate format
-            if not isinstance(data, dict):
-                raise ValueError("Action map must be a dictionary")
-
-            # Parse the union value form (1.4.0): a value is either a bare
-            # behaviour-name string (kind "state") or an object
-            # ``{"behavior": <name>, "kind": "state"|"point"}``. Names land in
-            # ``_action_map`` and kinds in ``_behavior_kinds`` so the rest of
-            # the model still sees a plain ``{key: name}`` map.
-            parsed_map = {}
-            parsed_kinds = {}
-            for key, value in data.items():
-                if not isinstance(key, str) or len(key) != 1:
-                    raise ValueError(f"Invalid key format: {key}")
-                if isinstance(value, dict):
-                    name = value.get("behavior")
-                    kind = value.get("kind", "state")
-                else:
-                    name = value
-                    kind = "state"
-                if not isinstance(name, str) or not name.strip():
-                    raise ValueError(f"Invalid behavior label for key {key}: {value}")
-                if kind not in ("state", "point"):
-                    self.logger.warning(
-                        "Unknown behaviour kind %r for key '%s'; defaulting to 'state'",
-                        kind, key,
-                    )
-                    kind = "state"
-                parsed_map[key] = name
-                parsed_kinds[key] = kind
+            parsed_map, parsed_kinds = self._parse_map_data(data)
 
             self._action_map = parsed_map
             self._behavior_kinds = parsed_kinds
+            self._invalidate_map_caches()
 
             # Tolerate (but warn about) duplicate behaviour names on load for
             # backward compatibility (§16-2): older maps may map two keys to
@@ -201,7 +215,7 @@ class ActionMapModel(QObject):
             self._warn_duplicate_behaviors()
 
             if emit_signal:
-                self.map_changed.emit()
+                self._emit_map_changed()
             
             # Save as user map if auto_save is enabled (for manual loads)
             if auto_save:
@@ -214,6 +228,57 @@ class ActionMapModel(QObject):
             self.error_occurred.emit(error_msg)
             return False
     
+    def _parse_map_data(self, data):
+        """Validate decoded action-map JSON and split it into names and kinds.
+
+        Kept apart from the file I/O so every check on the on-disk format
+        lives in one place.
+
+        Returns:
+            tuple: ``({key: name}, {key: kind})``
+
+        Raises:
+            ValueError: If ``data`` is not a valid action map.
+        """
+        if type(data) is not dict:
+            raise ValueError("Action map must be a dictionary")
+
+        # Parse the union value form (1.4.0): a value is either a bare
+        # behaviour-name string (kind "state") or an object
+        # ``{"behavior": <name>, "kind": "state"|"point"}``. Names land in
+        # ``_action_map`` and kinds in ``_behavior_kinds`` so the rest of
+        # the model still sees a plain ``{key: name}`` map.
+        parsed_map = {}
+        parsed_kinds = {}
+        # JSON object keys and strings decode to exact ``str``, so the
+        # checks below use ``type(...) is`` rather than ``isinstance``.
+        for key, value in data.items():
+            if len(key) != 1:
+                raise ValueError(f"Invalid key format: {key}")
+            if type(value) is str:
+                name = value
+                kind = "state"
+            elif type(value) is dict:
+                name = value.get("behavior")
+                kind = value.get("kind", "state")
+            else:
+                raise ValueError(f"Invalid behavior label for key {key}: {value}")
+            if type(name) is not str or not name.strip():
+                raise ValueError(f"Invalid behavior label for key {key}: {value}")
+            if type(kind) is not str or kind not in _VALID_KINDS:
+                self.logger.warning(
+                    "Unknown behaviour kind %r for key '%s'; defaulting to 'state'",
+                    kind, key,
+                )
+                kind = "state"
+            # Keys are interned so the map, the kind table and the
+            # active set share one object per key character.
+            key = sys.intern(key)
+            parsed_map[key] = name
+            parsed_kinds[key] = kind
+
+        return parsed_map, parsed_kinds
+
     def save_to_json(self, json_path):
         """
         Save action map to a JSON file.
@@ -229,8 +294,11 @@ class ActionMapModel(QObject):
             # Ensure parent directory exists
             Path(json_path).parent.mkdir(parents=True, exist_ok=True)
             
-            with open(json_path, 'w') as f:
-                json.dump(self._serialize_map(), f, indent=2)
+            # Encode up front and write once; ``json.dump`` issues a write per
+            # token. The output is ASCII (``ensure_ascii``) either way. The
+            # write is atomic, so a failed auto-save cannot truncate the map.
+            payload = json.dumps(self._serialize_map(), indent=2)
+            atomic_write_text(json_path, payload)
             return True
         except Exception as e:
             error_msg = f"Failed to save action map: {str(e)}"
@@ -254,12 +322,70 @@ class ActionMapModel(QObject):
                 out[key] = name
         return out
 
+    def _invalidate_map_caches(self):
+        """Drop the snapshots derived from ``_action_map`` after it changes."""
+        self._all_mappings_cache = None
+        self._active_cache = None
+
+    @contextmanager
+    def batch(self):
+        """Group several edits so ``map_changed`` is emitted at most once.
+
+        Example::
+
+            with model.batch():
+                for key, behavior in rows:
+                    model.add_mapping(key, behavior)
+
+        Per-key signals (``mapping_added`` etc.) are still emitted as usual.
+        Blocks may be nested; the signal fires when the outermost one exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._map_changed_pending:
+                self._map_changed_pending = False
+                self.map_changed.emit()
+
+    def _emit_map_changed(self):
+        """Emit map_changed now, or defer it to the end of a ``batch()``."""
+        if self._batch_depth:
+            self._map_changed_pending = True
+        else:
+            self.map_changed.emit()
+
+    def _forward_map_changed(self):
+        self.state_changed.emit("map", None)
+
+    def _forward_active_behaviors_changed(self):
+        self.state_changed.emit("active", None)
+
+    def _forward_error_occurred(self, message):
+        self.state_changed.emit("error", message)
+
+    def _emit_active_behaviors_changed(self, coalesce=True):
+        """Emit active_behaviors_changed, by default on the next event-loop turn.
+
+        With ``coalesce=False`` the signal is emitted immediately and any
+        pending coalesced emission is dropped, since it would be redundant.
+        """
+        if coalesce:
+            if not self._active_emit_timer.isActive():
+                self._active_emit_timer.start()
+        else:
+            self._active_emit_timer.stop()
+            self.active_behaviors_changed.emit()
+
     def _schedule_auto_save(self):
-        """Schedule an auto-save operation."""
-        if not self._auto_save_pending:
-            self._auto_save_pending = True
-            self._auto_save_timer.stop()
-            self._auto_save_timer.start(500)  # Save after 500ms of inactivity
+        """Schedule an auto-save operation.
+
+        Every call restarts the timer, so a burst of edits is written once,
+        500ms after the last one rather than the first.
+        """
+        self._auto_save_pending = True
+        self._auto_save_timer.start(500)  # Save after 500ms of inactivity
     
     def _auto_save(self):
         """Automatically save the current action map to its scope's storage.
@@ -346,7 +472,7 @@ class ActionMapModel(QObject):
                 self.logger.error("Failed to write action map to %s", map_path)
                 return False
             self.logger.info("Bound current action map to project: %s", map_path)
-            self.map_changed.emit()
+            self._emit_map_changed()
             return True
 
         if Path(map_path).exists():
@@ -372,7 +498,7 @@ class ActionMapModel(QObject):
         else:
             return False
 
-        self.map_changed.emit()
+        self._emit_map_changed()
         return True
 
     def exit_project_scope(self):
@@ -393,7 +519,7 @@ class ActionMapModel(QObject):
         # Reload the global map from disk. It was never overwritten while
         # scoped, so this restores exactly what the user had before.
         self._load_action_map()
-        self.map_changed.emit()
+        self._emit_map_changed()
         self.logger.info("Left project action map scope (was %s)", previous)
         return True
 
@@ -411,26 +537,94 @@ class ActionMapModel(QObject):
         Returns:
             bool: True if added successfully, False otherwise
         """
+        resolved_kind = self._validate_mapping(key, behavior, kind, self._action_map)
+        if resolved_kind is None:
+            return False
+
+        key = sys.intern(key)
+        self.logger.debug("Adding mapping: %s -> %s (%s)", key, behavior, resolved_kind)
+        self._action_map[key] = behavior
+        self._behavior_kinds[key] = resolved_kind
+        self._invalidate_map_caches()
+        self._emit_map_changed()
+        self.mapping_added.emit(key, behavior)
+        
+        # Schedule auto-save
+        self._schedule_auto_save()
+        
+        return True
+
+    def add_mappings(self, mappings, kind=None):
+        """
+        Add several key-to-behavior mappings in one update.
+
+        Every pair is validated exactly as :meth:`add_mapping` would (against
+        the current map plus the earlier pairs of the batch) before anything
+        is applied, so the batch is all-or-nothing. ``map_changed`` is emitted
+        once for the whole batch instead of once per key.
+
+        Args:
+            mappings (dict): Key character -> behavior label
+            kind (str, optional): Kind applied to every pair; see add_mapping.
+
+        Returns:
+            bool: True if all mappings were added, False otherwise
+        """
+        staged = dict(self._action_map)
+        resolved = {}
+        for key, behavior in mappings.items():
+            resolved_kind = self._validate_mapping(key, behavior, kind, staged)
+            if resolved_kind is None:
+                return False
+            key = sys.intern(key)
+            staged[key] = behavior
+            resolved[key] = resolved_kind
+
+        if not resolved:
+            return True
+
+        self.logger.debug("Adding %d mappings in bulk", len(resolved))
+        self._action_map = staged
+        self._behavior_kinds.update(resolved)
+        self._invalidate_map_caches()
+        self._emit_map_changed()
+        for key in resolved:
+            self.mapping_added.emit(key, staged[key])
+
+        self._schedule_auto_save()
+
+        return True
+
+    def _validate_mapping(self, key, behavior, kind, action_map):
+        """Validate a key/behavior pair against ``action_map``.
+
+        Emits ``error_occurred`` on failure.
+
+        Returns:
+            str: The resolved kind ("state"/"point"), or None if invalid.
+        """
+        # Exact ``str`` checks: keys and labels come from Qt (which hands out
+        # plain ``str``) or from JSON, so subclasses are not accepted.
         # Validate key
-        if not isinstance(key, str) or len(key) != 1:
+        if type(key) is not str or len(key) != 1:
             error_msg = f"Invalid key format: {key}"
             self.logger.error(error_msg)
             self.error_occurred.emit(error_msg)
-            return False
+            return None
         
         # Validate behavior
-        if not isinstance(behavior, str) or not behavior.strip():
+        if type(behavior) is not str or not behavior.strip():
             error_msg = f"Invalid behavior label: {behavior}"
             self.logger.error(error_msg)
             self.error_occurred.emit(error_msg)
-            return False
+            return None
 
         # Reject a behaviour name already mapped to a DIFFERENT key (§16-2 /
         # BUG-011). Each behaviour must have a single key so CSV import can
         # resolve the key unambiguously. Re-assigning the same key (an edit) or
         # re-confirming the same pair is allowed.
         behavior_cf = behavior.strip().casefold()
-        for existing_key, existing_behavior in self._action_map.items():
+        for existing_key, existing_behavior in action_map.items():
             if existing_key != key and str(existing_behavior).strip().casefold() == behavior_cf:
                 error_msg = (
                     f"Behavior '{behavior}' is already mapped to key "
@@ -438,29 +632,17 @@ class ActionMapModel(QObject):
                 )
                 self.logger.warning(error_msg)
                 self.error_occurred.emit(error_msg)
-                return False
+                return None
 
         # Resolve the kind: explicit value wins; otherwise keep the key's
         # current kind (preserves a point on a same-key edit / re-confirm),
         # falling back to "state".
         if kind is None:
-            resolved_kind = self._behavior_kinds.get(key, "state")
-        elif kind in ("state", "point"):
-            resolved_kind = kind
-        else:
-            self.logger.warning("Unknown behaviour kind %r; using 'state'", kind)
-            resolved_kind = "state"
-
-        self.logger.debug(f"Adding mapping: {key} -> {behavior} ({resolved_kind})")
-        self._action_map[key] = behavior
-        self._behavior_kinds[key] = resolved_kind
-        self.map_changed.emit()
-        self.mapping_added.emit(key, behavior)
-        
-        # Schedule auto-save
-        self._schedule_auto_save()
-        
-        return True
+            return self._behavior_kinds.get(key, "state")
+        if kind in _VALID_KINDS:
+            return kind
+        self.logger.warning("Unknown behaviour kind %r; using 'state'", kind)
+        return "state"
     
     def remove_mapping(self, key):
         """
@@ -472,29 +654,29 @@ class ActionMapModel(QObject):
         Returns:
             bool: True if removed successfully, False otherwise
         """
-        if key in self._action_map:  # Use correct attribute name
-            behavior = self._action_map[key]  # Get behavior before deletion
-            self.logger.debug(f"Removing mapping for key: {key} -> {behavior}")
-            was_active = key in self._active_behaviors
-            
-            del self._action_map[key]
-            self._behavior_kinds.pop(key, None)
-            self._active_behaviors.discard(key)
-            
-            # Emit both signals for compatibility
-            self.map_changed.emit()  # Keep existing signal
-            self.mapping_removed.emit(behavior)  # Add new signal for timeline
-            if was_active:
-                self.active_behaviors_changed.emit()
-            
-            # Schedule auto-save
-            self._schedule_auto_save()
-            
-            self.logger.info(f"Removed mapping: {key} -> {behavior}")
-            return True
-        else:
-            self.logger.warning(f"Key not found in action map: {key}")
+        # A single pop both tests for and removes the key.
+        behavior = self._action_map.pop(key, _MISSING)
+        if behavior is _MISSING:
+            self.logger.warning("Key not found in action map: %s", key)
             return False
+
+        self.logger.debug("Removing mapping for key: %s -> %s", key, behavior)
+        self._behavior_kinds.pop(key, None)
+        was_active = key in self._active_behaviors
+        self._active_behaviors.discard(key)
+        self._invalidate_map_caches()
+
+        # Emit both signals for compatibility
+        self._emit_map_changed()  # Keep existing signal
+        self.mapping_removed.emit(behavior)  # Add new signal for timeline
+        if was_active:
+            self._emit_active_behaviors_changed()
+
+        # Schedule auto-save
+        self._schedule_auto_save()
+
+        self.logger.info("Removed mapping: %s -> %s", key, behavior)
+        return True
     
     def _warn_duplicate_behaviors(self):
         """Log a warning if any behaviour name is mapped to more than one key.
@@ -555,21 +737,31 @@ class ActionMapModel(QObject):
     def get_all_mappings(self):
         """
         Get all key-to-behavior mappings.
+
+        The same read-only snapshot is returned until the map changes, so
+        repeated reads from the views do not copy the map each time. Use
+        ``dict(...)`` on the result if a mutable copy is needed.
         
         Returns:
-            dict: Dictionary of key-to-behavior mappings
+            Mapping: Read-only view of the key-to-behavior mappings
         """
-        return self._action_map.copy()
+        if self._all_mappings_cache is None:
+            self._all_mappings_cache = types.MappingProxyType(dict(self._action_map))
+        return self._all_mappings_cache
     
-    def set_behavior_active(self, key, active=True):
+    def set_behavior_active(self, key, active=True, coalesce=True):
         """
         Set a behavior as active or inactive.
         
         Args:
             key (str): Key character
             active (bool): True to set active, False to set inactive
+            coalesce (bool): Defer active_behaviors_changed to the next
+                event-loop turn so toggles in the same turn emit once. Pass
+                False to emit synchronously.
         """
-        behavior = self.get_behavior(key)
+        # Read the map directly: this runs on every key press/release.
+        behavior = self._action_map.get(key)
         if behavior:
             # Track the previous state to detect changes
             was_active = key in self._active_behaviors
@@ -578,14 +770,16 @@ class ActionMapModel(QObject):
                 self._active_behaviors.add(key)
                 # Only emit if the state actually changed
                 if not was_active:
-                    self.logger.debug(f"Behavior '{behavior}' activated")
-                    self.active_behaviors_changed.emit()
+                    self._active_cache = None
+                    self.logger.debug("Behavior '%s' activated", behavior)
+                    self._emit_active_behaviors_changed(coalesce)
             else:
                 self._active_behaviors.discard(key)
                 # Only emit if the state actually changed
                 if was_active:
-                    self.logger.debug(f"Behavior '{behavior}' deactivated")
-                    self.active_behaviors_changed.emit()
+                    self._active_cache = None
+                    self.logger.debug("Behavior '%s' deactivated", behavior)
+                    self._emit_active_behaviors_changed(coalesce)
     
     def is_behavior_active(self, key):
         """
@@ -602,17 +796,25 @@ class ActionMapModel(QObject):
     def get_active_behaviors(self):
         """
         Get all currently active behaviors.
+
+        Like :meth:`get_all_mappings`, the read-only result is reused until
+        the active set or the map changes.
         
         Returns:
-            dict: Dictionary of active key-to-behavior mappings
+            Mapping: Read-only view of the active key-to-behavior mappings
         """
-        return {k: self._action_map[k] for k in self._active_behaviors if k in self._action_map}
+        if self._active_cache is None:
+            self._active_cache = types.MappingProxyType(
+                {k: self._action_map[k] for k in self._active_behaviors if k in self._action_map}
+            )
+        return self._active_cache
     
     def clear_active_behaviors(self):
         """Clear all active behaviors."""
         if self._active_behaviors:
             self._active_behaviors.clear()
-            self.active_behaviors_changed.emit()
+            self._active_cache = None
+            self._emit_active_behaviors_changed()
     
     def is_loaded(self):
         """
@@ -629,7 +831,7 @@ class ActionMapModel(QObject):
         This should be called after all signal connections are established.
         """
         if self._action_map:
-            self.map_changed.emit()
+            self._emit_map_changed()
             self.logger.debug("Triggered initial view update")
     
     def reset_to_default(self):
@@ -651,8 +853,9 @@ class ActionMapModel(QObject):
             # If default doesn't exist, use the centralised fallback.
             self._action_map = default_action_map()
             self._behavior_kinds = {}  # all state
+            self._invalidate_map_caches()
 
-            self.map_changed.emit()
+            self._emit_map_changed()
             self._schedule_auto_save()
             
             self.logger.info("Reset action map to hardcoded default")
@@ -2,12 +2,16 @@
 import csv
 import logging
 import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 import re
 from PySide6.QtCore import QObject, Signal
 from models.analysis_config import AnalysisMetricsConfig
-from utils.annotation_csv_parser import extract_event_dataframe
+from utils.annotation_csv_parser import extract_event_dataframe_from_lines
 from utils.csv_safety import SafeCsvWriter
 
 from version import __version__ as RABET_VERSION
@@ -15,6 +19,67 @@ from version import __version__ as RABET_VERSION
 # Schema version stamped into the exported summary CSVs.
 SUMMARY_CSV_SCHEMA = "v1"
 
+# Maximum number of parsed files kept by AnalysisModel's load cache.
+_PARSE_CACHE_MAX_ENTRIES = 256
+
+# Metadata row holding the test duration. The tag is located with a plain
+# substring search; only the number after it goes through a regex.
+_TEST_DURATION_TAG = 'Test Duration (seconds),'
+_TEST_DURATION_VALUE_RE = re.compile(r'\s*(\d+\.?\d*)')
+
+# Event labels that never name a behavior to analyze.
+_NON_BEHAVIOR_EVENTS = frozenset({'RecordingStart', 'Behavior', '', None})
+
+
+def _float_values(column):
+    """Return a timestamp column as a float array, non-numeric values as NaN.
+
+    Columns that are already plain numeric (what the event parser produces)
+    skip ``pd.to_numeric``. The result may share memory with ``column``, so
+    callers must not write to it.
+    """
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+        return column.to_numpy(dtype=float)
+    return pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+
+
+def _nanmin(values):
+    """Return the smallest non-NaN value in ``values``, or NaN if there is none."""
+    present = values[~np.isnan(values)]
+    return present.min() if present.size else np.nan
+
+
+def _covered_length(onsets, offsets):
+    """Return the total length covered by the ``[onset, offset]`` intervals.
+
+    Overlapping and touching intervals are merged. The arrays must be
+    non-empty and free of NaN and inverted intervals.
+    """
+    # Fast path: annotations are usually recorded in order without
+    # overlap. If every event starts after the previous one ended, the
+    # input is already sorted and disjoint, so each event is its own
+    # block and no sort or merge is needed.
+    if np.all(onsets[1:] > offsets[:-1]):
+        return float(np.sum(offsets - onsets))
+
+    # Sweep line to account for overlaps - fully vectorised. With the
+    # intervals sorted by onset, the running maximum of the offsets is
+    # the end of the merged block so far; an interval starting after
+    # it opens a new block. Touching intervals merge.
+    order = np.argsort(onsets, kind='stable')
+    onsets = onsets[order]
+    running_end = np.maximum.accumulate(offsets[order])
+
+    opens_block = np.empty(onsets.size, dtype=bool)
+    opens_block[0] = True
+    opens_block[1:] = onsets[1:] > running_end[:-1]
+    block_starts = np.flatnonzero(opens_block)
+    block_ends = np.append(block_starts[1:] - 1, onsets.size - 1)
+
+    return float(np.sum(running_end[block_ends] - onsets[block_starts]))
+
+
 class AnalysisModel(QObject):
     """
     Model for analyzing multiple annotation files and generating summary statistics.
@@ -43,6 +108,16 @@ class AnalysisModel(QObject):
         # File path -> set of total-time metric names that are approximate
         # because the input was summary-only (§16-4 / BUG-023).
         self._approximate_metrics = {}
+
+        # (path, mtime_ns, size) -> parsed file, most recently used last.
+        # Reloading an unchanged file skips the disk read and CSV parse.
+        self._parse_cache = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+
+        # File path -> (analysis context, settings signature, results,
+        # interval results, approximate metrics) from the last run. Reused
+        # while the stored inputs and settings are unchanged.
+        self._analysis_memo = {}
         
         # Interval analysis settings
         self._interval_enabled = False  # Whether to use time intervals for analysis
@@ -55,8 +130,15 @@ class AnalysisModel(QObject):
             "Social contact", "Self-grooming", "Locomotion", "Rearing"
         ]
         
-        # Initialize behaviors list with defaults (will be extended with custom behaviors)
-        self._behaviors = self._default_behaviors.copy()
+        self._default_behavior_set = frozenset(self._default_behaviors)
+
+        # Behavior -> ("<behavior>_duration", "<behavior>_count") result keys,
+        # formatted once and reused by every file and interval.
+        self._result_key_cache = {}
+
+        # Behaviors to analyze, defaults first (will be extended with custom
+        # behaviors). Kept as a tuple; it is only replaced, never mutated.
+        self._behaviors = tuple(self._default_behaviors)
         
         # Dictionary to track all custom behaviors found across files
         self._custom_behaviors = set()
@@ -98,7 +180,7 @@ class AnalysisModel(QObject):
             enabled (bool): Whether to enable interval-based analysis
             interval_seconds (int, optional): Size of each interval in seconds
         """
-        self.logger.info(f"Setting interval analysis: enabled={enabled}, interval={interval_seconds} seconds")
+        self.logger.info("Setting interval analysis: enabled=%s, interval=%s seconds", enabled, interval_seconds)
         self._interval_enabled = enabled
         self._interval_seconds = max(1, interval_seconds)  # Ensure minimum 1 second
         
@@ -113,25 +195,23 @@ class AnalysisModel(QObject):
         Store the exact inputs needed to reproduce an analysis run.
 
         Args:
-            df (pd.DataFrame): Raw event data (may be empty)
+            df (pd.DataFrame or None): Raw event data, or None for a
+                summary-only file
             summary_data (dict or None): Parsed summary table if available
             test_duration (float): Session duration in seconds
 
         Returns:
             dict: Serializable-in-memory analysis context
         """
-        if df is None:
-            df = pd.DataFrame(columns=['Event', 'Onset', 'Offset'])
-
         return {
-            "dataframe": df.copy(deep=True),
+            "dataframe": df.copy(deep=True) if df is not None else None,
             "summary_data": summary_data.copy() if summary_data is not None else None,
             "test_duration": test_duration,
         }
 
     def _rebuild_behavior_catalog(self):
         """Rebuild the behavior catalog from the stored analysis inputs."""
-        self._behaviors = self._default_behaviors.copy()
+        self._behaviors = tuple(self._default_behaviors)
         self._custom_behaviors = set()
 
         for context in self._analysis_inputs.values():
@@ -140,9 +220,9 @@ class AnalysisModel(QObject):
                 self._extract_behaviors_from_data(df)
 
             summary_data = context.get("summary_data") or {}
-            for behavior in summary_data.keys():
-                if behavior and behavior not in self._default_behaviors:
-                    self._custom_behaviors.add(behavior)
+            self._custom_behaviors.update(
+                set(summary_data) - self._default_behavior_set - {''}
+            )
 
         self._update_behaviors_list()
 
@@ -161,24 +241,75 @@ class AnalysisModel(QObject):
         self._interval_results = {}
         self._approximate_metrics = {}
         self._rebuild_behavior_catalog()
+        signature = self._analysis_signature()
 
         analysis_order = self._file_paths or list(self._analysis_inputs.keys())
+        memo = {}
         for file_path in analysis_order:
             context = self._analysis_inputs.get(file_path)
             if context is None:
                 continue
 
-            df = context["dataframe"].copy(deep=True)
+            cached = self._analysis_memo.get(file_path)
+            if cached is not None and cached[0] is context and cached[1] == signature:
+                self._restore_memoized_results(file_path, cached)
+                memo[file_path] = cached
+                continue
+
+            df = context["dataframe"]
+            if df is not None:
+                df = df.copy(deep=True)
             summary_data = context.get("summary_data")
             test_duration = context.get("test_duration", 300)
 
             if summary_data is not None:
-                self._analyze_file_with_summary(file_path, df, summary_data, test_duration)
+                analyzed = self._analyze_file_with_summary(file_path, df, summary_data, test_duration)
             else:
-                self._analyze_file(file_path, df, test_duration)
+                analyzed = self._analyze_file(file_path, df, test_duration)
+
+            if analyzed:
+                memo[file_path] = (
+                    context,
+                    signature,
+                    dict(self._results.get(file_path, {})),
+                    self._copy_interval_results(self._interval_results.get(file_path)),
+                    set(self._approximate_metrics.get(file_path, ())),
+                )
 
+        self._analysis_memo = memo
         return True
 
+    def _analysis_signature(self):
+        """
+        Describe every setting that affects per-file results.
+
+        Returns:
+            tuple: Hashable snapshot of behaviors, interval and metric settings
+        """
+        return (
+            self._behaviors,
+            self._interval_enabled,
+            self._interval_seconds,
+            repr(self._metrics_config.get_enabled_latency_metrics()),
+            repr(self._metrics_config.get_enabled_total_time_metrics()),
+        )
+
+    @staticmethod
+    def _copy_interval_results(interval_results):
+        """Copy a file's interval rows so callers cannot alter the memo."""
+        if interval_results is None:
+            return None
+        return [dict(row) for row in interval_results]
+
+    def _restore_memoized_results(self, file_path, cached):
+        """Publish a memoized analysis for ``file_path``."""
+        _, _, results, interval_results, approximate = cached
+        self._results[file_path] = dict(results)
+        if interval_results is not None:
+            self._interval_results[file_path] = self._copy_interval_results(interval_results)
+        if approximate:
+            self._approximate_metrics[file_path] = set(approximate)
+
     def get_interval_settings(self):
         """
         Get current interval analysis settings.
@@ -198,7 +329,7 @@ class AnalysisModel(QObject):
         Returns:
             bool: True if files were loaded successfully, False otherwise
         """
-        self.logger.info(f"Loading {len(file_paths)} file(s)")
+        self.logger.info("Loading %s file(s)", len(file_paths))
         
         # Reset data
         self._file_paths = []
@@ -207,16 +338,27 @@ class AnalysisModel(QObject):
         self._results = {}
         self._interval_results = {}
         self._approximate_metrics = {}
+        self._analysis_memo = {}
         successful_loads = 0
         
         # Reset behaviors to defaults and clear custom behaviors
-        self._behaviors = self._default_behaviors.copy()
+        self._behaviors = tuple(self._default_behaviors)
         self._custom_behaviors = set()
         
-        for file_path in file_paths:
-            if self.load_file(file_path):
-                successful_loads += 1
-                self._file_paths.append(file_path)
+        # Files are independent, so read and parse them concurrently; the
+        # results are folded into the model one by one, in the given order,
+        # on this thread (signals included).
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(file_paths), os.cpu_count() or 1))
+        ) as pool:
+            pending = [
+                (file_path, pool.submit(self._read_annotation_file_cached, file_path))
+                for file_path in file_paths
+            ]
+            for file_path, future in pending:
+                if self._load_parsed_file(file_path, future):
+                    successful_loads += 1
+                    self._file_paths.append(file_path)
         
         if successful_loads > 0:
             # Update behaviors list with any custom behaviors found
@@ -246,117 +388,197 @@ class AnalysisModel(QObject):
         Returns:
             bool: True if file was loaded successfully, False otherwise
         """
+        return self._load_parsed_file(file_path)
+
+    def _read_annotation_file_cached(self, file_path):
+        """
+        Return :meth:`_read_annotation_file` output, reusing an earlier parse.
+
+        Entries are keyed by path, modification time and size, so an edited
+        file is always re-read. Callers get their own copies because the
+        analysis converts the event table in place.
+        """
         try:
-            self.logger.debug(f"Loading file: {file_path}")
-            
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"File not found: {file_path}")
-            
-            # First read the file as text to inspect its structure
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Detect the producing RABET version and schema if present.
-            # Older files (pre-1.2.0) have no such rows; that's fine, just log.
-            version_match = re.search(r'RABET Version\s*,\s*([^\r\n,]+)', content)
-            schema_match = re.search(r'Format Schema\s*,\s*([^\r\n,]+)', content)
-            if version_match:
-                producing_version = version_match.group(1).strip()
-                self.logger.info(
-                    f"CSV produced by RABET {producing_version} (current: {RABET_VERSION})"
+            stat = os.stat(file_path)
+        except OSError:
+            # Let the regular read path report the problem.
+            return self._read_annotation_file(file_path)
+
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        with self._parse_cache_lock:
+            parsed = self._parse_cache.get(key)
+            if parsed is not None:
+                self._parse_cache.move_to_end(key)
+        if parsed is None:
+            parsed = self._read_annotation_file(file_path)
+            with self._parse_cache_lock:
+                self._parse_cache[key] = parsed
+                while len(self._parse_cache) > _PARSE_CACHE_MAX_ENTRIES:
+                    self._parse_cache.popitem(last=False)
+        else:
+            self.logger.debug("Reusing parsed contents of unchanged file: %s", file_path)
+
+        summary_data, df, test_duration = parsed
+        return (
+            dict(summary_data),
+            df.copy() if df is not None else None,
+            test_duration,
+        )
+
+    def _read_annotation_file(self, file_path):
+        """
+        Read and parse one annotation CSV without touching model state.
+
+        Only logs, so :meth:`load_files` can run it on worker threads.
+
+        Args:
+            file_path (str): Path to the CSV file
+
+        Returns:
+            tuple: ``(summary_data, df, test_duration)`` where ``df`` is the
+            raw event table or None for a summary-only file, and
+            ``test_duration`` is None when the metadata has no duration.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file has neither event data nor a summary
+        """
+        self.logger.debug("Loading file: %s", file_path)
+        
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        # First read the file as text to inspect its structure. It is split
+        # into lines once here; both section parsers work on that list.
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        lines = content.splitlines()
+            
+        # Detect the producing RABET version and schema if present.
+        # Older files (pre-1.2.0) have no such rows; that's fine, just log.
+        version_match = re.search(r'RABET Version\s*,\s*([^\r\n,]+)', content)
+        schema_match = re.search(r'Format Schema\s*,\s*([^\r\n,]+)', content)
+        if version_match:
+            producing_version = version_match.group(1).strip()
+            self.logger.info(
+                "CSV produced by RABET %s (current: %s)", producing_version, RABET_VERSION
+            )
+        else:
+            self.logger.debug("CSV has no RABET version row (pre-1.2.0 format)")
+        if schema_match:
+            schema_id = schema_match.group(1).strip()
+            if schema_id != SUMMARY_CSV_SCHEMA:
+                self.logger.warning(
+                    "CSV schema '%s' differs from this RABET's '%s' - "
+                    "parsing will continue but consider updating the tool",
+                    schema_id,
+                    SUMMARY_CSV_SCHEMA,
                 )
+
+        # Extract test duration from metadata section if present. Keep
+        # ``None`` when absent so raw-event-only imports can still infer a
+        # duration from the event log instead of blindly using 300 s.
+        test_duration = None
+        metadata_match = None
+        tag_index = content.find(_TEST_DURATION_TAG)
+        if tag_index >= 0:
+            metadata_match = _TEST_DURATION_VALUE_RE.match(
+                content, tag_index + len(_TEST_DURATION_TAG)
+            )
+        if metadata_match:
+            try:
+                test_duration = float(metadata_match.group(1))
+                self.logger.debug("Extracted test duration from metadata: %s seconds", test_duration)
+            except ValueError:
+                self.logger.warning("Failed to parse test duration from metadata: %s", metadata_match.group(1))
+        
+        # Check if this file contains pre-calculated summary data
+        summary_data = {}
+        has_summary = "Behavior,Duration,Frequency" in content
+        if has_summary:
+            self.logger.info("Detected summary section in file: %s", file_path)
+            summary_data = self._extract_summary_data(lines)
+            
+            # Log the extracted summary data
+            for behavior, metrics in summary_data.items():
+                self.logger.debug("Summary data: %s - Duration: %s, Frequency: %s", behavior, metrics['duration'], metrics['frequency'])
+        
+        # Check if this file contains raw event data
+        df = None
+        if "Event,Onset,Offset" in content:
+            self.logger.info("Detected raw event data in file: %s", file_path)
+            df = self._extract_raw_event_data(lines)
+        elif not summary_data:
+            raise ValueError(f"Unrecognized file format in {file_path} - no event data or summary found")
+
+        return summary_data, df, test_duration
+
+    def _load_parsed_file(self, file_path, pending=None):
+        """
+        Add one file to the model and analyze it.
+
+        Args:
+            file_path (str): Path to the CSV file
+            pending (concurrent.futures.Future, optional): A future running
+                :meth:`_read_annotation_file_cached` for ``file_path``. When omitted
+                the file is read here.
+
+        Returns:
+            bool: True if file was loaded successfully, False otherwise
+        """
+        try:
+            if pending is not None:
+                summary_data, df, test_duration = pending.result()
             else:
-                self.logger.debug("CSV has no RABET version row (pre-1.2.0 format)")
-            if schema_match:
-                schema_id = schema_match.group(1).strip()
-                if schema_id != SUMMARY_CSV_SCHEMA:
-                    self.logger.warning(
-                        f"CSV schema '{schema_id}' differs from this RABET's '{SUMMARY_CSV_SCHEMA}' - "
-                        "parsing will continue but consider updating the tool"
-                    )
+                summary_data, df, test_duration = self._read_annotation_file_cached(file_path)
 
-            # Extract test duration from metadata section if present. Keep
-            # ``None`` when absent so raw-event-only imports can still infer a
-            # duration from the event log instead of blindly using 300 s.
-            test_duration = None
-            metadata_match = re.search(r'Test Duration \(seconds\),\s*(\d+\.?\d*)', content)
-            if metadata_match:
-                try:
-                    test_duration = float(metadata_match.group(1))
-                    self.logger.debug(f"Extracted test duration from metadata: {test_duration} seconds")
-                except ValueError:
-                    self.logger.warning(f"Failed to parse test duration from metadata: {metadata_match.group(1)}")
-            
-            # Check if this file contains pre-calculated summary data
-            summary_data = {}
-            has_summary = "Behavior,Duration,Frequency" in content
-            if has_summary:
-                self.logger.info(f"Detected summary section in file: {file_path}")
-                summary_data = self._extract_summary_data(content)
-                
-                # Log the extracted summary data
-                for behavior, metrics in summary_data.items():
-                    self.logger.debug(f"Summary data: {behavior} - Duration: {metrics['duration']}, Frequency: {metrics['frequency']}")
-            
-            # Check if this file contains raw event data
-            has_raw_events = "Event,Onset,Offset" in content
-            if has_raw_events:
-                self.logger.info(f"Detected raw event data in file: {file_path}")
-                
-                # Process the raw event data
-                df = self._extract_raw_event_data(content)
-                
+            if df is not None:
                 # Store raw data
                 self._raw_data[file_path] = df
                 
                 # Extract all unique behaviors from the file and add to custom behaviors set
                 self._extract_behaviors_from_data(df)
                 
-                # If we have summary data, validate it against raw events but
-                # keep raw events as the source of truth for primary metrics.
-                if summary_data:
-                    self._analyze_file_with_summary(file_path, df, summary_data, test_duration)
-                else:
-                    # Otherwise analyze from raw events
-                    self._analyze_file(file_path, df, test_duration)
-
-                resolved_duration = self._results.get(file_path, {}).get("test_duration")
-                if resolved_duration is None:
-                    resolved_duration = test_duration if test_duration is not None else 300
-
-                self._analysis_inputs[file_path] = self._create_analysis_context(
-                    df,
-                    summary_data if summary_data else None,
-                    resolved_duration,
-                )
-
-                return True
-            elif summary_data:
-                # If we only have summary data (no raw events), process it directly
-                self.logger.info(f"Processing file with only summary data: {file_path}")
-
-                # Also extract behavior names from summary data
-                for behavior in summary_data.keys():
-                    if behavior not in self._default_behaviors:
-                        self._custom_behaviors.add(behavior)
-
-                # Create placeholder dataframe for consistency
-                df = pd.DataFrame(columns=['Event', 'Onset', 'Offset'])
-                self._raw_data[file_path] = df
-
-                # Process the summary data directly
-                summary_duration = test_duration if test_duration is not None else 300
-                self._analyze_file_with_summary(file_path, df, summary_data, summary_duration)
-
-                self._analysis_inputs[file_path] = self._create_analysis_context(
-                    df,
-                    summary_data,
-                    summary_duration,
-                )
-                
+                # If we have summary data, validate it against raw events but
+                # keep raw events as the source of truth for primary metrics.
+                if summary_data:
+                    self._analyze_file_with_summary(file_path, df, summary_data, test_duration)
+                else:
+                    # Otherwise analyze from raw events
+                    self._analyze_file(file_path, df, test_duration)
+
+                resolved_duration = self._results.get(file_path, {}).get("test_duration")
+                if resolved_duration is None:
+                    resolved_duration = test_duration if test_duration is not None else 300
+
+                self._analysis_inputs[file_path] = self._create_analysis_context(
+                    df,
+                    summary_data if summary_data else None,
+                    resolved_duration,
+                )
+
                 return True
             else:
-                raise ValueError(f"Unrecognized file format in {file_path} - no event data or summary found")
+                # If we only have summary data (no raw events), process it directly
+                self.logger.info("Processing file with only summary data: %s", file_path)
+
+                # Also extract behavior names from summary data
+                self._custom_behaviors.update(set(summary_data) - self._default_behavior_set)
+
+                # No raw events: None marks the file as summary-only.
+                self._raw_data[file_path] = None
+
+                # Process the summary data directly
+                summary_duration = test_duration if test_duration is not None else 300
+                self._analyze_file_with_summary(file_path, None, summary_data, summary_duration)
+
+                self._analysis_inputs[file_path] = self._create_analysis_context(
+                    None,
+                    summary_data,
+                    summary_duration,
+                )
+                
+                return True
             
         except Exception as e:
             error_msg = f"Failed to load file {file_path}: {str(e)}"
@@ -369,35 +591,45 @@ class AnalysisModel(QObject):
         Extract raw event data from file content.
         
         Args:
-            content (str): File content as string
+            content (str or list): File content as a string, or already
+                split into lines
             
         Returns:
             pd.DataFrame: Dataframe containing event data
+
+        Raises:
+            Exception: Whatever the CSV parser raised. The caller reports it
+                through ``error_occurred``; the content is never re-parsed.
         """
+        lines = content.splitlines() if isinstance(content, str) else content
         try:
-            df = extract_event_dataframe(content, logger=self.logger)
-            self.logger.debug(f"Extracted raw event data - {len(df)} rows")
-
-            if 'Event' in df.columns:
-                rs_events = df[df['Event'] == 'RecordingStart']
-                if not rs_events.empty:
-                    self.logger.debug(f"Found RecordingStart at {rs_events['Onset'].iloc[0]}s")
-
-                attack_events = df[df['Event'] == 'Attack bites']
-                if not attack_events.empty:
-                    self.logger.debug(f"Found first Attack bites at {attack_events['Onset'].min()}s")
-
-            return df
-        except Exception as e:
-            self.logger.warning(f"Error extracting raw event data: {str(e)}")
-            return extract_event_dataframe(content, logger=self.logger)
+            df = extract_event_dataframe_from_lines(lines, logger=self.logger)
+        except Exception:
+            self.logger.warning("Error extracting raw event data", exc_info=True)
+            raise
+        self.logger.debug("Extracted raw event data - %s rows", len(df))
+
+        # These lookups exist only for the debug log; skip the Event
+        # column scans entirely when DEBUG is off.
+        if 'Event' in df.columns and self.logger.isEnabledFor(logging.DEBUG):
+            positions = df.groupby('Event', sort=False).indices
+            if 'RecordingStart' in positions:
+                first = df['Onset'].iloc[positions['RecordingStart'][0]]
+                self.logger.debug("Found RecordingStart at %ss", first)
+
+            if 'Attack bites' in positions:
+                first = df['Onset'].iloc[positions['Attack bites']].min()
+                self.logger.debug("Found first Attack bites at %ss", first)
+
+        return df
     
     def _extract_summary_data(self, content):
         """
         Extract summary data (behavior duration and frequency) from file content.
         
         Args:
-            content (str): File content as string
+            content (str or list): File content as a string, or already
+                split into lines
             
         Returns:
             dict: Dictionary of behavior -> {'duration': float, 'frequency': int}
@@ -406,7 +638,7 @@ class AnalysisModel(QObject):
         
         try:
             # Find the line with the summary header
-            lines = content.split('\n')
+            lines = content.splitlines() if isinstance(content, str) else content
             summary_start = -1
             
             for i, line in enumerate(lines):
@@ -418,23 +650,25 @@ class AnalysisModel(QObject):
                 self.logger.warning("Could not find summary section header")
                 return summary_data
             
+            # The section ends at the first blank line.
+            summary_end = summary_start + 1
+            while summary_end < len(lines) and lines[summary_end].strip():
+                summary_end += 1
+
             # Process the summary data lines. Parse with ``csv.reader`` rather
             # than ``str.split(',')`` so a behaviour name that itself contains
             # a comma (exported quoted, e.g. ``"Investigate, object"``) is read
             # as a single field instead of being torn into two columns
-            # (BUG-015).
-            for i in range(summary_start + 1, len(lines)):
-                line = lines[i].strip()
-                if not line:
-                    break  # End of summary section
-
-                parts = next(iter(csv.reader([lines[i]])), [])
+            # (BUG-015). One reader tokenizes the whole block.
+            block = lines[summary_start + 1:summary_end]
+            for raw_line, parts in zip(block, csv.reader(block), strict=False):
+                line = raw_line.strip()
                 if len(parts) >= 3:
                     behavior = parts[0].strip()
 
                     # FIX: Skip empty behavior names to prevent "nan" columns
                     if not behavior:
-                        self.logger.warning(f"Skipping empty behavior name in summary data line: {line}")
+                        self.logger.warning("Skipping empty behavior name in summary data line: %s", line)
                         continue
 
                     try:
@@ -454,14 +688,14 @@ class AnalysisModel(QObject):
                             'frequency': frequency
                         }
                         
-                        self.logger.debug(f"Extracted summary: {behavior} - Duration: {duration}, Frequency: {frequency}")
+                        self.logger.debug("Extracted summary: %s - Duration: %s, Frequency: %s", behavior, duration, frequency)
                     except (ValueError, IndexError) as e:
-                        self.logger.warning(f"Error parsing summary line: {line}, error: {e}")
+                        self.logger.warning("Error parsing summary line: %s, error: %s", line, e)
                         continue
             
             return summary_data
         except Exception as e:
-            self.logger.warning(f"Error extracting summary data: {str(e)}")
+            self.logger.warning("Error extracting summary data: %s", e)
             return summary_data
     
     def _extract_behaviors_from_data(self, df):
@@ -477,40 +711,45 @@ class AnalysisModel(QObject):
                 unique_behaviors = set(df['Event'].unique())
                 
                 # FIX: Filter out invalid behavior names
-                invalid_behaviors = {'RecordingStart', 'Behavior', '', None}
-                
-                # Remove invalid behaviors and log them
-                for invalid in invalid_behaviors:
-                    if invalid in unique_behaviors:
-                        unique_behaviors.remove(invalid)
-                        if invalid and invalid != 'RecordingStart':
-                            self.logger.warning(f"Found invalid behavior '{invalid}' - this is likely an error in the CSV parsing")
+                if 'Behavior' in unique_behaviors:
+                    self.logger.warning("Found invalid behavior 'Behavior' - this is likely an error in the CSV parsing")
+                unique_behaviors -= _NON_BEHAVIOR_EVENTS
                 
                 # Additional check for NaN values
                 unique_behaviors = {b for b in unique_behaviors if pd.notna(b) and str(b).strip()}
                 
                 # Add any behaviors not in the default list to the custom behaviors set
-                for behavior in unique_behaviors:
-                    if behavior not in self._default_behaviors:
-                        self._custom_behaviors.add(behavior)
-                        self.logger.debug(f"Found custom behavior: {behavior}")
+                new_behaviors = unique_behaviors - self._default_behavior_set - self._custom_behaviors
+                if new_behaviors:
+                    self._custom_behaviors |= new_behaviors
+                    self.logger.debug("Found custom behaviors: %s", sorted(new_behaviors, key=str))
         except Exception as e:
-            self.logger.warning(f"Error extracting behaviors from data: {str(e)}")
+            self.logger.warning("Error extracting behaviors from data: %s", e)
     
     def _update_behaviors_list(self):
         """
         Update the behaviors list to include all custom behaviors found across files.
         """
         # Start with default behaviors
-        self._behaviors = self._default_behaviors.copy()
+        self._behaviors = tuple(self._default_behaviors)
 
         # Add any custom behaviors
-        if self._custom_behaviors:
-            # Sort custom behaviors alphabetically for consistency
-            sorted_custom_behaviors = sorted(self._custom_behaviors)
-            self._behaviors.extend(sorted_custom_behaviors)
+        if self._custom_behaviors:
+            # Sort custom behaviors alphabetically for consistency. Names are
+            # interned so the many dict lookups keyed by them (results, result
+            # keys, per-behavior arrays) can short-circuit on identity.
+            sorted_custom_behaviors = [sys.intern(b) for b in sorted(self._custom_behaviors)]
+            self._behaviors += tuple(sorted_custom_behaviors)
 
-            self.logger.info(f"Added {len(self._custom_behaviors)} custom behaviors to analysis: {sorted_custom_behaviors}")
+            self.logger.info("Added %s custom behaviors to analysis: %s", len(self._custom_behaviors), sorted_custom_behaviors)
+
+    def _result_keys(self, behavior):
+        """Return the ``(duration_key, count_key)`` result keys for a behavior."""
+        keys = self._result_key_cache.get(behavior)
+        if keys is None:
+            keys = (f"{behavior}_duration", f"{behavior}_count")
+            self._result_key_cache[behavior] = keys
+        return keys
 
     @staticmethod
     def _is_valid_behavior_name(behavior):
@@ -561,49 +800,60 @@ class AnalysisModel(QObject):
 
     def _union_duration(self, onsets, offsets, behavior=None, file_path=None):
         """Return overlap-collapsed duration for one behavior."""
-        intervals = [
-            (float(on), float(off))
-            for on, off in zip(onsets, offsets, strict=False)
-            if np.isfinite(on) and np.isfinite(off) and off > on
-        ]
-        if not intervals:
+        onsets = np.asarray(onsets, dtype=float)
+        offsets = np.asarray(offsets, dtype=float)
+        keep = np.isfinite(onsets) & np.isfinite(offsets) & (offsets > onsets)
+        if not keep.any():
             return 0.0
+        onsets = onsets[keep]
+        offsets = offsets[keep]
 
-        intervals.sort(key=lambda pair: (pair[0], pair[1]))
-        total = 0.0
-        current_start, current_end = intervals[0]
-        saw_overlap = False
-
-        for start, end in intervals[1:]:
-            if start <= current_end:
-                if start < current_end:
-                    saw_overlap = True
-                current_end = max(current_end, end)
-            else:
-                total += current_end - current_start
-                current_start, current_end = start, end
-        total += current_end - current_start
+        # Events that merely touch are merged without a warning; only a
+        # start strictly inside an earlier event counts as an overlap.
+        if not np.all(onsets[1:] > offsets[:-1]):
+            order = np.argsort(onsets, kind='stable')
+            running_end = np.maximum.accumulate(offsets[order])
+            if np.any(onsets[order][1:] < running_end[:-1]):
+                source = os.path.basename(file_path) if file_path else "data"
+                self.logger.warning(
+                    "Detected overlapping '%s' events in %s; using union duration",
+                    behavior,
+                    source,
+                )
+        return _covered_length(onsets, offsets)
 
-        if saw_overlap:
-            source = os.path.basename(file_path) if file_path else "data"
-            self.logger.warning(
-                "Detected overlapping '%s' events in %s; using union duration",
-                behavior,
-                source,
-            )
-        return float(total)
+    def _event_arrays_by_behavior(self, df):
+        """Return ``{behavior: (onsets, offsets)}`` float arrays for ``df``.
 
-    def _calculate_behavior_duration_count(self, df, behavior, file_path=None):
-        """Return ``(union_duration_seconds, valid_event_count)`` for a behavior."""
+        The timestamp columns are coerced once and split with a single
+        ``groupby`` pass, so per-behavior metrics do not each rescan the
+        Event column with a boolean mask.
+        """
         if df is None or df.empty or 'Event' not in df.columns:
-            return 0.0, 0
+            return {}
+
+        onsets = _float_values(df['Onset'])
+        offsets = _float_values(df['Offset'])
+        return {
+            behavior: (onsets[positions], offsets[positions])
+            for behavior, positions in df.groupby('Event', sort=False).indices.items()
+        }
 
-        behavior_df = df[df['Event'] == behavior]
-        if behavior_df.empty:
+    def _calculate_behavior_duration_count(
+        self, df, behavior, file_path=None, event_arrays=None,
+    ):
+        """Return ``(union_duration_seconds, valid_event_count)`` for a behavior.
+
+        ``event_arrays`` is the output of :meth:`_event_arrays_by_behavior`;
+        pass it when computing several behaviors over the same ``df``.
+        """
+        if event_arrays is None:
+            event_arrays = self._event_arrays_by_behavior(df)
+        arrays = event_arrays.get(behavior)
+        if arrays is None:
             return 0.0, 0
 
-        onsets = pd.to_numeric(behavior_df['Onset'], errors='coerce').to_numpy(dtype=float)
-        offsets = pd.to_numeric(behavior_df['Offset'], errors='coerce').to_numpy(dtype=float)
+        onsets, offsets = arrays
         valid_mask = np.isfinite(onsets) & np.isfinite(offsets) & (offsets >= onsets)
         invalid_count = int((~valid_mask).sum())
         if invalid_count:
@@ -656,12 +906,13 @@ class AnalysisModel(QObject):
         
         Args:
             file_path (str): Path to the source file
-            df (pd.DataFrame): Raw event data (may be empty)
+            df (pd.DataFrame or None): Raw event data; None or empty for a
+                summary-only file
             summary_data (dict): Pre-calculated behavior metrics
             test_duration (float, optional): Test duration in seconds
         """
         try:
-            self.logger.info(f"Analyzing file with summary data: {file_path}")
+            self.logger.info("Analyzing file with summary data: %s", file_path)
             
             test_duration = self._resolve_test_duration(df, test_duration)
             behavior_names = self._analysis_behavior_names(df, summary_data)
@@ -673,10 +924,12 @@ class AnalysisModel(QObject):
 
             # If we have raw event data, raw events are the source of truth.
             # The summary section is retained as a consistency check only.
-            if not df.empty:
+            has_events = df is not None and not df.empty
+            if has_events:
+                event_arrays = self._event_arrays_by_behavior(df)
                 for behavior in behavior_names:
                     duration, count = self._calculate_behavior_duration_count(
-                        df, behavior, file_path,
+                        df, behavior, file_path, event_arrays,
                     )
                     if behavior in summary_data:
                         self._warn_if_summary_mismatch(
@@ -686,8 +939,9 @@ class AnalysisModel(QObject):
                             duration,
                             count,
                         )
-                    results[f"{behavior}_duration"] = float(duration)
-                    results[f"{behavior}_count"] = int(count)
+                    duration_key, count_key = self._result_keys(behavior)
+                    results[duration_key] = float(duration)
+                    results[count_key] = int(count)
                     self.logger.debug(
                         "Using raw data: %s - Duration: %.6f, Frequency: %d",
                         behavior,
@@ -704,9 +958,11 @@ class AnalysisModel(QObject):
                     behavior = metric["behavior"]
                     
                     # Calculate latency for this behavior
-                    latency = self._calculate_behavior_latency(df, behavior, test_duration)
+                    latency = self._calculate_behavior_latency(
+                        df, behavior, test_duration, event_arrays,
+                    )
                     results[f"{metric_name.lower().replace(' ', '_')}"] = latency
-                    self.logger.debug(f"{metric_name}: {latency:.2f}s")
+                    self.logger.debug("%s: %.2fs", metric_name, latency)
                 
                 # Get enabled total time metrics from configuration
                 total_time_metrics = self._metrics_config.get_enabled_total_time_metrics()
@@ -717,15 +973,15 @@ class AnalysisModel(QObject):
                     behaviors = metric["behaviors"]
                     
                     # Calculate total time for these behaviors
-                    total_time = self._calculate_total_aggression(df, behaviors)
+                    total_time = self._calculate_total_aggression(df, behaviors, event_arrays)
                     results[f"{metric_name.lower().replace(' ', '_')}"] = total_time
-                    self.logger.debug(f"{metric_name}: {total_time:.2f}s")
+                    self.logger.debug("%s: %.2fs", metric_name, total_time)
                 
                 # If interval analysis is enabled, perform interval-based analysis
-                if self._interval_enabled and not df.empty:
+                if self._interval_enabled and has_events:
                     interval_results = self._analyze_intervals(df, test_duration)
                     self._interval_results[file_path] = interval_results
-                    self.logger.debug(f"Completed interval analysis with {len(interval_results)} intervals")
+                    self.logger.debug("Completed interval analysis with %s intervals", len(interval_results))
             else:
                 # No raw event data: use the summary section for metrics that
                 # are identifiable from totals, and leave timing-dependent
@@ -737,8 +993,9 @@ class AnalysisModel(QObject):
                         continue
 
                     # Store duration and frequency directly from summary data
-                    results[f"{behavior}_duration"] = metrics['duration']
-                    results[f"{behavior}_count"] = metrics['frequency']
+                    duration_key, count_key = self._result_keys(behavior)
+                    results[duration_key] = metrics['duration']
+                    results[count_key] = metrics['frequency']
 
                     self.logger.debug(
                         "Using summary data: %s - Duration: %s, Frequency: %s",
@@ -749,9 +1006,9 @@ class AnalysisModel(QObject):
 
                 # Fill in any missing behaviors with zeros
                 for behavior in behavior_names:
-                    if f"{behavior}_duration" not in results:
-                        results[f"{behavior}_duration"] = 0.0
-                        results[f"{behavior}_count"] = 0
+                    duration_key, count_key = self._result_keys(behavior)
+                    results.setdefault(duration_key, 0.0)
+                    results.setdefault(count_key, 0)
 
                 # Handle latency metrics
                 latency_metrics = self._metrics_config.get_enabled_latency_metrics()
@@ -795,17 +1052,17 @@ class AnalysisModel(QObject):
                 
                 # We can't do interval analysis without raw event data
                 if self._interval_enabled:
-                    self.logger.warning(f"Interval analysis requested but no raw event data available for {file_path}")
+                    self.logger.warning("Interval analysis requested but no raw event data available for %s", file_path)
                     # Create empty interval results to maintain consistency
                     self._interval_results[file_path] = []
             
             # Store results
             self._results[file_path] = results
             
-            # Detailed calculated metrics are useful only during diagnostics.
-            self.logger.debug(f"Analysis summary for {file_path}:")
-            for k, v in sorted(results.items()):
-                self.logger.debug(f"  {k}: {v}")
+            # Detailed calculated metrics are useful only during diagnostics;
+            # skip the sort entirely when DEBUG is off.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Analysis summary for %s: %s", file_path, dict(sorted(results.items())))
             
             return True
         except Exception as e:
@@ -824,60 +1081,57 @@ class AnalysisModel(QObject):
             test_duration (float, optional): Test duration in seconds, default is 300 (5 minutes)
         """
         try:
-            self.logger.info(f"Analyzing file from raw event data: {file_path}")
+            self.logger.info("Analyzing file from raw event data: %s", file_path)
             
             # Log detailed information about the dataset only at debug level.
-            self.logger.debug(f"DataFrame info for {file_path}:")
-            self.logger.debug(f"  Shape: {df.shape}")
-            self.logger.debug(f"  Columns: {df.columns.tolist()}")
-            self.logger.debug(f"  Data types: {df.dtypes}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("DataFrame info for %s:", file_path)
+                self.logger.debug("  Shape: %s", df.shape)
+                self.logger.debug("  Columns: %s", df.columns.tolist())
+                self.logger.debug("  Data types: %s", df.dtypes)
             
             # Check for RecordingStart and Attack bites events
-            rs_events = df[df['Event'] == 'RecordingStart']
-            attack_events = df[df['Event'] == 'Attack bites']
-            
-            self.logger.debug("Data validation:")
-            self.logger.debug(f"  Found {len(rs_events)} RecordingStart events")
-            self.logger.debug(f"  Found {len(attack_events)} Attack bites events")
-
-            if not rs_events.empty:
-                rs_onsets = pd.to_numeric(rs_events['Onset'], errors='coerce').dropna()
-                if not rs_onsets.empty:
-                    self.logger.debug(f"  RecordingStart time: {rs_onsets.min()}")
+            # Group once up front; the per-behavior arrays serve both these
+            # checks and the metric calculations below.
+            event_arrays = self._event_arrays_by_behavior(df)
+            rs_onsets = event_arrays.get('RecordingStart', (np.empty(0),))[0]
+            attack_onsets = event_arrays.get('Attack bites', (np.empty(0),))[0]
+
+            self.logger.debug("Data validation:")
+            self.logger.debug("  Found %s RecordingStart events", len(rs_onsets))
+            self.logger.debug("  Found %s Attack bites events", len(attack_onsets))
+
+            if rs_onsets.size:
+                rs_onsets = rs_onsets[~np.isnan(rs_onsets)]
+                if rs_onsets.size:
+                    self.logger.debug("  RecordingStart time: %s", rs_onsets.min())
                 else:
                     self.logger.warning("  RecordingStart events have no valid numeric onset")
-            if not attack_events.empty:
-                attack_onsets = pd.to_numeric(attack_events['Onset'], errors='coerce').dropna()
-                if not attack_onsets.empty:
-                    self.logger.debug(f"  First Attack bites time: {attack_onsets.min()}")
+            if attack_onsets.size:
+                attack_onsets = attack_onsets[~np.isnan(attack_onsets)]
+                if attack_onsets.size:
+                    self.logger.debug("  First Attack bites time: %s", attack_onsets.min())
                 else:
                     self.logger.warning("  Attack bites events have no valid numeric onset")
             
-            # First, ensure all values are properly converted to numeric
-            try:
-                # Explicitly convert to float type for precise calculations
-                df['Onset'] = df['Onset'].astype(float)
-                df['Offset'] = df['Offset'].astype(float)
-                
-                self.logger.debug(f"  Column types after conversion: {df.dtypes}")
-                
-                # Check for invalid values
-                nan_rows = df[df['Onset'].isna() | df['Offset'].isna()]
-                if not nan_rows.empty:
-                    self.logger.warning(f"Found {len(nan_rows)} rows with non-numeric values in Onset/Offset columns")
-                    # Drop these rows to prevent calculation errors
-                    df = df.dropna(subset=['Onset', 'Offset'])
-            except Exception as e:
-                self.logger.warning(f"Error converting timestamp columns to numeric: {str(e)}")
-                # Fall back to pandas to_numeric with coercion
-                df['Onset'] = pd.to_numeric(df['Onset'], errors='coerce')
-                df['Offset'] = pd.to_numeric(df['Offset'], errors='coerce')
+            # Convert both timestamp columns to float in one pass; anything
+            # non-numeric becomes NaN and is dropped below.
+            df['Onset'] = pd.to_numeric(df['Onset'], errors='coerce')
+            df['Offset'] = pd.to_numeric(df['Offset'], errors='coerce')
+            self.logger.debug("  Column types after conversion: %s", df.dtypes)
+
+            # Check for invalid values
+            nan_count = int((df['Onset'].isna() | df['Offset'].isna()).sum())
+            if nan_count:
+                self.logger.warning("Found %s rows with non-numeric values in Onset/Offset columns", nan_count)
+                # Drop these rows to prevent calculation errors
                 df = df.dropna(subset=['Onset', 'Offset'])
+                event_arrays = self._event_arrays_by_behavior(df)
             
-            # Prefer explicit metadata duration; infer from raw events only
+            # Prefer explicit metadata duration; infer from raw events only
             # when metadata was unavailable.
             test_duration = self._resolve_test_duration(df, test_duration)
-            self.logger.debug(f"Using test duration: {test_duration} seconds")
+            self.logger.debug("Using test duration: %s seconds", test_duration)
             
             # Initialize results dictionary
             results = {
@@ -886,10 +1140,10 @@ class AnalysisModel(QObject):
             
             # For each behavior, calculate duration and count
             # Use the combined list of default and custom behaviors
-            for behavior in self._analysis_behavior_names(df):
-                duration, count = self._calculate_behavior_duration_count(
-                    df, behavior, file_path,
-                )
+            for behavior in self._analysis_behavior_names(df):
+                duration, count = self._calculate_behavior_duration_count(
+                    df, behavior, file_path, event_arrays,
+                )
                 self.logger.debug(
                     "Behavior '%s': %d occurrences, %.2fs total duration",
                     behavior,
@@ -898,8 +1152,9 @@ class AnalysisModel(QObject):
                 )
 
                 # Store in results - ensure both duration and count are correctly stored
-                results[f"{behavior}_duration"] = float(duration)  # Ensure it's a float
-                results[f"{behavior}_count"] = int(count)  # Ensure it's an integer
+                duration_key, count_key = self._result_keys(behavior)
+                results[duration_key] = float(duration)  # Ensure it's a float
+                results[count_key] = int(count)  # Ensure it's an integer
 
             # Get enabled latency metrics from configuration
             latency_metrics = self._metrics_config.get_enabled_latency_metrics()
@@ -910,9 +1165,11 @@ class AnalysisModel(QObject):
                 behavior = metric["behavior"]
                 
                 # Calculate latency for this behavior
-                latency = self._calculate_behavior_latency(df, behavior, test_duration)
+                latency = self._calculate_behavior_latency(
+                    df, behavior, test_duration, event_arrays,
+                )
                 results[f"{metric_name.lower().replace(' ', '_')}"] = latency
-                self.logger.debug(f"{metric_name}: {latency:.2f}s")
+                self.logger.debug("%s: %.2fs", metric_name, latency)
             
             # Get enabled total time metrics from configuration
             total_time_metrics = self._metrics_config.get_enabled_total_time_metrics()
@@ -923,9 +1180,9 @@ class AnalysisModel(QObject):
                 behaviors = metric["behaviors"]
                 
                 # Calculate total time for these behaviors
-                total_time = self._calculate_total_aggression(df, behaviors)
+                total_time = self._calculate_total_aggression(df, behaviors, event_arrays)
                 results[f"{metric_name.lower().replace(' ', '_')}"] = total_time
-                self.logger.debug(f"{metric_name}: {total_time:.2f}s")
+                self.logger.debug("%s: %.2fs", metric_name, total_time)
             
             # Store results
             self._results[file_path] = results
@@ -934,12 +1191,12 @@ class AnalysisModel(QObject):
             if self._interval_enabled:
                 interval_results = self._analyze_intervals(df, test_duration)
                 self._interval_results[file_path] = interval_results
-                self.logger.debug(f"Completed interval analysis with {len(interval_results)} intervals")
+                self.logger.debug("Completed interval analysis with %s intervals", len(interval_results))
             
-            # Detailed calculated metrics are useful only during diagnostics.
-            self.logger.debug(f"Analysis summary for {file_path}:")
-            for k, v in sorted(results.items()):
-                self.logger.debug(f"  {k}: {v}")
+            # Detailed calculated metrics are useful only during diagnostics;
+            # skip the sort entirely when DEBUG is off.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Analysis summary for %s: %s", file_path, dict(sorted(results.items())))
             
             return True
             
@@ -960,21 +1217,27 @@ class AnalysisModel(QObject):
         Returns:
             list: List of dictionaries with interval metrics
         """
-        self.logger.debug(f"Performing interval analysis with {self._interval_seconds} second intervals")
+        self.logger.debug("Performing interval analysis with %s second intervals", self._interval_seconds)
         
+        # Group the events once; the same arrays give the RecordingStart time
+        # and feed the per-behavior interval metrics below.
+        event_arrays = self._event_arrays_by_behavior(df)
+
         # FIX: Find the RecordingStart time - intervals should start from here, not from 0
         recording_start_time = 0
-        recording_starts = df[df['Event'] == 'RecordingStart'].sort_values('Onset')
+        recording_starts = event_arrays.get('RecordingStart', (np.empty(0),))[0]
         
-        if not recording_starts.empty:
-            # Use the first RecordingStart as the analysis start point
-            recording_start_time = float(recording_starts['Onset'].iloc[0])
-            self.logger.debug(f"Found RecordingStart at {recording_start_time}s - intervals will start from this time")
+        if recording_starts.size:
+            # Use the first RecordingStart as the analysis start point. Only
+            # the minimum is needed, so there is nothing to sort.
+            valid_starts = recording_starts[~np.isnan(recording_starts)]
+            recording_start_time = float(valid_starts.min()) if valid_starts.size else float('nan')
+            self.logger.debug("Found RecordingStart at %ss - intervals will start from this time", recording_start_time)
         else:
             # Fallback: use the earliest event time
             if not df.empty:
                 recording_start_time = float(df['Onset'].min())
-                self.logger.warning(f"No RecordingStart found - using earliest event time: {recording_start_time}s")
+                self.logger.warning("No RecordingStart found - using earliest event time: %ss", recording_start_time)
             else:
                 recording_start_time = 0
                 self.logger.warning("Empty dataframe - using time 0 as start")
@@ -985,8 +1248,8 @@ class AnalysisModel(QObject):
         # Calculate the number of intervals from RecordingStart
         num_intervals = int(np.ceil(test_duration / self._interval_seconds))
         
-        self.logger.debug(f"Analysis period: {recording_start_time}s to {analysis_end_time}s ({test_duration}s duration)")
-        self.logger.debug(f"Will create {num_intervals} intervals of {self._interval_seconds}s each")
+        self.logger.debug("Analysis period: %ss to %ss (%ss duration)", recording_start_time, analysis_end_time, test_duration)
+        self.logger.debug("Will create %s intervals of %ss each", num_intervals, self._interval_seconds)
         
         # Initialize results for each interval
         interval_results = []
@@ -997,10 +1260,8 @@ class AnalysisModel(QObject):
         # (interval x behavior x iterrows) loop with vectorised numpy math.
         behavior_arrays = {}
         for behavior in self._behaviors:
-            behavior_df = df[df['Event'] == behavior]
-            if not behavior_df.empty:
-                onsets = pd.to_numeric(behavior_df['Onset'], errors='coerce').to_numpy(dtype=float)
-                offsets = pd.to_numeric(behavior_df['Offset'], errors='coerce').to_numpy(dtype=float)
+            if behavior in event_arrays:
+                onsets, offsets = event_arrays[behavior]
                 valid_mask = np.isfinite(onsets) & np.isfinite(offsets) & (offsets >= onsets)
                 if np.any(~valid_mask):
                     self.logger.warning(
@@ -1011,12 +1272,28 @@ class AnalysisModel(QObject):
                 if np.any(valid_mask):
                     behavior_arrays[behavior] = (onsets[valid_mask], offsets[valid_mask])
 
+        # Likewise gather each total-time metric's valid events once, instead
+        # of filtering a copy of the whole frame for every interval.
+        total_time_metrics = self._metrics_config.get_enabled_total_time_metrics()
+        metric_arrays = []
+        for metric in total_time_metrics:
+            groups = [
+                event_arrays[behavior]
+                for behavior in dict.fromkeys(metric["behaviors"])
+                if behavior in event_arrays
+            ]
+            onsets = np.concatenate([g[0] for g in groups]) if groups else np.empty(0)
+            offsets = np.concatenate([g[1] for g in groups]) if groups else np.empty(0)
+            valid_mask = np.isfinite(onsets) & np.isfinite(offsets) & (offsets >= onsets)
+            metric_key = f"{metric['name'].lower().replace(' ', '_')}"
+            metric_arrays.append((metric_key, onsets[valid_mask], offsets[valid_mask]))
+
         # Process each interval starting from RecordingStart
         for i in range(num_intervals):
             start_time = recording_start_time + (i * self._interval_seconds)
             end_time = min(recording_start_time + ((i + 1) * self._interval_seconds), analysis_end_time)
 
-            self.logger.debug(f"Interval {i+1}: {start_time}s to {end_time}s")
+            self.logger.debug("Interval %s: %ss to %ss", i + 1, start_time, end_time)
 
             interval_metrics = {
                 "interval_number": i + 1,
@@ -1026,81 +1303,42 @@ class AnalysisModel(QObject):
             }
 
             for behavior in self._behaviors:
+                duration_key, count_key = self._result_keys(behavior)
                 if behavior in behavior_arrays:
                     onsets, offsets = behavior_arrays[behavior]
                     overlap_start = np.maximum(onsets, start_time)
                     overlap_end = np.minimum(offsets, end_time)
                     overlap_duration = np.maximum(0.0, overlap_end - overlap_start)
-                    interval_metrics[f"{behavior}_duration"] = float(overlap_duration.sum())
+                    interval_metrics[duration_key] = float(overlap_duration.sum())
                     # Duration is based on overlap with the interval, while
                     # Frequency is based on event onsets inside the interval.
                     onset_in_interval = (onsets >= start_time) & (onsets < end_time)
-                    interval_metrics[f"{behavior}_count"] = int(onset_in_interval.sum())
+                    interval_metrics[count_key] = int(onset_in_interval.sum())
                 else:
-                    interval_metrics[f"{behavior}_duration"] = 0.0
-                    interval_metrics[f"{behavior}_count"] = 0
-            
-            # Calculate custom metrics for this interval
-            interval_df = self._filter_events_for_interval(df, start_time, end_time)
-            
-            # Get total time metrics from configuration
-            total_time_metrics = self._metrics_config.get_enabled_total_time_metrics()
-            
-            # Calculate each configured total time metric for this interval
-            for metric in total_time_metrics:
-                metric_name = metric["name"]
-                behaviors = metric["behaviors"]
-                
-                # Calculate total time for these behaviors in this interval
-                total_time = self._calculate_total_aggression(interval_df, behaviors)
-                interval_metrics[f"{metric_name.lower().replace(' ', '_')}"] = total_time
+                    interval_metrics[duration_key] = 0.0
+                    interval_metrics[count_key] = 0
+            
+            # Calculate each configured total time metric for this interval:
+            # the union of its events clipped to the interval bounds.
+            for metric_key, onsets, offsets in metric_arrays:
+                overlapping = (onsets < end_time) & (offsets > start_time)
+                if overlapping.any():
+                    interval_metrics[metric_key] = _covered_length(
+                        np.maximum(onsets[overlapping], start_time),
+                        np.minimum(offsets[overlapping], end_time),
+                    )
+                else:
+                    interval_metrics[metric_key] = 0
             
             # Add to interval results
             interval_results.append(interval_metrics)
             
-            self.logger.debug(f"Interval {i+1}: {start_time}s - {end_time}s processed")
+            self.logger.debug("Interval %s: %ss - %ss processed", i + 1, start_time, end_time)
         
-        self.logger.debug(f"Created {len(interval_results)} intervals covering {recording_start_time}s to {analysis_end_time}s")
+        self.logger.debug("Created %s intervals covering %ss to %ss", len(interval_results), recording_start_time, analysis_end_time)
         
         return interval_results
     
-    def _filter_events_for_interval(self, df, start_time, end_time):
-        """
-        Filter events that overlap with a specific time interval.
-        
-        Args:
-            df (pd.DataFrame): Raw event data
-            start_time (float): Interval start time in seconds
-            end_time (float): Interval end time in seconds
-            
-        Returns:
-            pd.DataFrame: Filtered dataframe with events that overlap with the interval
-        """
-        # Make a copy to avoid SettingWithCopyWarning
-        filtered_df = df.copy()
-
-        # Column-replacement assignment (filtered_df is already a copy) so a
-        # string/object source column can become float. pandas 2.1+ rejects
-        # ``.loc[:, col] = <float>`` into a str-dtype column ("Invalid value
-        # ... for dtype 'str'").
-        filtered_df['Onset'] = pd.to_numeric(filtered_df['Onset'], errors='coerce')
-        filtered_df['Offset'] = pd.to_numeric(filtered_df['Offset'], errors='coerce')
-        filtered_df = filtered_df.dropna(subset=['Onset', 'Offset'])
-        filtered_df = filtered_df[filtered_df['Offset'] >= filtered_df['Onset']]
-        
-        # For our calculation, we need to clip event boundaries to the interval
-        # But first, filter to only events that overlap with the interval
-        mask = ((filtered_df['Onset'] < end_time) & (filtered_df['Offset'] > start_time))
-        interval_df = filtered_df[mask].copy()
-        
-        # Adjust onset and offset times to fit within the interval
-        interval_df.loc[:, 'Original_Onset'] = interval_df['Onset'].copy()
-        interval_df.loc[:, 'Original_Offset'] = interval_df['Offset'].copy()
-        interval_df.loc[:, 'Onset'] = interval_df['Onset'].clip(lower=start_time)
-        interval_df.loc[:, 'Offset'] = interval_df['Offset'].clip(upper=end_time)
-        
-        return interval_df
-    
     def _get_test_duration(self, df):
         """
         Determine the test duration from the annotation data.
@@ -1112,39 +1350,41 @@ class AnalysisModel(QObject):
             float: Test duration in seconds
         """
         try:
+            # Both columns are converted once; non-finite values are dropped
+            # wherever they are used.
+            all_onsets = _float_values(df['Onset'])
+            all_offsets = _float_values(df['Offset'])
+
             # First, look for a RecordingStart event
-            recording_start = df[df['Event'] == 'RecordingStart']
+            is_recording_start = (df['Event'] == 'RecordingStart').to_numpy()
 
-            if not recording_start.empty:
-                onset_values = pd.to_numeric(recording_start['Onset'], errors='coerce').dropna()
+            if is_recording_start.any():
+                onset_values = all_onsets[is_recording_start]
                 onset_values = onset_values[np.isfinite(onset_values)]
-                if not onset_values.empty:
+                if onset_values.size:
                     start_time = float(onset_values.min())
-                    self.logger.debug(f"Found RecordingStart event at time: {start_time}")
+                    self.logger.debug("Found RecordingStart event at time: %s", start_time)
 
                     # Get the last offset time of any event
-                    offset_values = pd.to_numeric(df['Offset'], errors='coerce').dropna()
-                    offset_values = offset_values[np.isfinite(offset_values)]
-                    if not offset_values.empty:
+                    offset_values = all_offsets[np.isfinite(all_offsets)]
+                    if offset_values.size:
                         last_time = float(offset_values.max())
                         duration = last_time - start_time
                         if duration > 0:
-                            self.logger.debug(f"Test duration from RecordingStart to last offset: {duration}s")
+                            self.logger.debug("Test duration from RecordingStart to last offset: %ss", duration)
                             return duration
 
             # Fallback: Use the range from the first Onset to the last Offset
-            if not df.empty and 'Onset' in df.columns and 'Offset' in df.columns:
-                onset_values = pd.to_numeric(df['Onset'], errors='coerce').dropna()
-                offset_values = pd.to_numeric(df['Offset'], errors='coerce').dropna()
-                onset_values = onset_values[np.isfinite(onset_values)]
-                offset_values = offset_values[np.isfinite(offset_values)]
+            if not df.empty:
+                onset_values = all_onsets[np.isfinite(all_onsets)]
+                offset_values = all_offsets[np.isfinite(all_offsets)]
 
-                if not onset_values.empty and not offset_values.empty:
+                if onset_values.size and offset_values.size:
                     min_time = float(onset_values.min())
                     max_time = float(offset_values.max())
                     duration = max_time - min_time
                     if duration > 0:
-                        self.logger.debug(f"Test duration from first onset to last offset: {duration}s")
+                        self.logger.debug("Test duration from first onset to last offset: %ss", duration)
                         return duration
             
             # Default assumption: 5 minutes (300 seconds)
@@ -1152,10 +1392,12 @@ class AnalysisModel(QObject):
             return 300
             
         except Exception as e:
-            self.logger.warning(f"Exception in _get_test_duration: {str(e)}")
+            self.logger.warning("Exception in _get_test_duration: %s", e)
             return 300  # Default to 5 minutes
     
-    def _calculate_behavior_latency(self, df, target_behavior, test_duration):
+    def _calculate_behavior_latency(
+        self, df, target_behavior, test_duration, event_arrays=None,
+    ):
         """
         Calculate the latency to first occurrence of a specific behavior.
         If the behavior is not observed, returns the test duration.
@@ -1164,6 +1406,9 @@ class AnalysisModel(QObject):
             df (pd.DataFrame): Annotation data
             target_behavior (str): Target behavior to measure latency for
             test_duration (float): Test duration in seconds
+            event_arrays (dict, optional): Output of
+                :meth:`_event_arrays_by_behavior` for ``df``; avoids
+                rescanning the Event column for each metric
             
         Returns:
             float: Behavior latency in seconds
@@ -1171,97 +1416,69 @@ class AnalysisModel(QObject):
         try:
             # Ensure df is not empty
             if df.empty:
-                self.logger.debug(f"Empty dataframe, using test duration as {target_behavior} latency: {test_duration}s")
+                self.logger.debug("Empty dataframe, using test duration as %s latency: %ss", target_behavior, test_duration)
                 return test_duration
 
-            # Operate on a private copy so the numeric coercion below cannot
-            # mutate the caller's DataFrame. The same df is reused for other
-            # metrics in the same analysis pass, so an in-place
-            # ``df['Onset'] = pd.to_numeric(...)`` previously leaked side
-            # effects (and spurious "Converted ... to numeric" log noise)
-            # into subsequent metric calculations (cross-cut B / read-only df).
-            df = df.copy()
+            # Work from coerced per-behavior onset arrays so the caller's
+            # DataFrame is never mutated. The same df is reused for other
+            # metrics in the same analysis pass (cross-cut B / read-only df).
+            # No frame copy or per-call sort is needed: both reference points
+            # are minima.
+            if event_arrays is None:
+                event_arrays = self._event_arrays_by_behavior(df)
+            no_events = (np.empty(0),)
 
-            # Verify data types of time columns - critical for accurate calculation
-            try:
-                # Log column types for debugging
-                self.logger.debug(f"Column dtypes before numeric conversion: {df.dtypes}")
-
-                # Ensure Onset and Offset are numeric
-                if pd.api.types.is_object_dtype(df['Onset']):
-                    df['Onset'] = pd.to_numeric(df['Onset'], errors='coerce')
-                    self.logger.debug("Converted Onset to numeric")
-                if pd.api.types.is_object_dtype(df['Offset']):
-                    df['Offset'] = pd.to_numeric(df['Offset'], errors='coerce')
-                    self.logger.debug("Converted Offset to numeric")
-                
-                # Log column types after conversion
-                self.logger.debug(f"Column dtypes after numeric conversion: {df.dtypes}")
-            except Exception as e:
-                self.logger.warning(f"Error converting time columns to numeric: {str(e)}")
-            
-            # Find all RecordingStart events and sort by onset time
-            recording_starts = df[df['Event'] == 'RecordingStart'].sort_values('Onset')
-            
-            # Find target behavior events and sort by onset time
-            behavior_events = df[df['Event'] == target_behavior].sort_values('Onset')
+            # Find target behavior events
+            behavior_onsets = event_arrays.get(target_behavior, no_events)[0]
             
             # If the behavior is not found, return test duration
-            if behavior_events.empty:
-                self.logger.debug(f"No {target_behavior} found, using test duration: {test_duration}s")
+            if not behavior_onsets.size:
+                self.logger.debug("No %s found, using test duration: %ss", target_behavior, test_duration)
                 return test_duration
-            
-            # Log all RecordingStart events for debugging.
-            self.logger.debug(f"LATENCY CALCULATION DETAILS for {target_behavior}:")
-            self.logger.debug(f"  Found {len(behavior_events)} {target_behavior} events")
-            self.logger.debug(f"  Found {len(recording_starts)} RecordingStart events")
-
-            if not recording_starts.empty:
-                for i, rs in recording_starts.iterrows():
-                    self.logger.debug(f"  RecordingStart #{i}: {rs['Onset']}s")
-
-            if not behavior_events.empty:
-                self.logger.debug(f"  All {target_behavior} onsets: {list(behavior_events['Onset'])}")
-                min_behavior_time = behavior_events['Onset'].min()
-                self.logger.debug(f"  First {target_behavior} onset: {min_behavior_time}s (type: {type(min_behavior_time)})")
+
+            recording_start_onsets = event_arrays.get('RecordingStart', no_events)[0]
+            self.logger.debug(
+                "Latency for %s: %d event(s), %d RecordingStart event(s)",
+                target_behavior, len(behavior_onsets), len(recording_start_onsets),
+            )
             
             # One CSV = one session (§16-1): the recorder now enforces a single
             # RecordingStart per file, so latency keys off the FIRST one. Older
             # or hand-edited files may still contain several; in that case we
             # use the first and warn rather than guessing a "best" match.
-            if not recording_starts.empty:
-                if len(recording_starts) > 1:
+            if recording_start_onsets.size:
+                if len(recording_start_onsets) > 1:
                     self.logger.warning(
                         "  %d RecordingStart events in this file; using the "
                         "first (one-session model). Re-export to normalise.",
-                        len(recording_starts),
+                        len(recording_start_onsets),
                     )
-                start_time = float(recording_starts['Onset'].iloc[0])
-                self.logger.debug(f"  Using RecordingStart at {start_time}s")
-            else:
-                # No RecordingStart found - fall back to earliest event time
-                start_time = float(df['Onset'].min())
-                self.logger.debug(f"  No RecordingStart events; using earliest event time: {start_time}s")
+                start_time = _nanmin(recording_start_onsets)
+                self.logger.debug("  Using RecordingStart at %ss", start_time)
+            else:
+                # No RecordingStart found - fall back to earliest event time
+                start_time = _nanmin(_float_values(df['Onset']))
+                self.logger.debug("  No RecordingStart events; using earliest event time: %ss", start_time)
             
-            # Calculate latency with explicit float conversion
-            first_behavior_time = float(behavior_events['Onset'].min())
+            # Numpy scalars throughout; converted to float once on return.
+            first_behavior_time = _nanmin(behavior_onsets)
             latency = first_behavior_time - start_time
             
-            self.logger.debug(f"  Calculation: {first_behavior_time} - {start_time} = {latency}")
+            self.logger.debug("  Calculation: %s - %s = %s", first_behavior_time, start_time, latency)
             
             # Ensure non-negative value (should not happen with proper data)
             if latency < 0:
-                self.logger.warning(f"  Calculated negative latency ({latency}s)! This suggests data ordering issues.")
+                self.logger.warning("  Calculated negative latency (%ss)! This suggests data ordering issues.", latency)
                 latency = max(0, latency)
             
-            self.logger.debug(f"FINAL {target_behavior} LATENCY: {latency}s")
-            return latency
+            self.logger.debug("FINAL %s LATENCY: %ss", target_behavior, latency)
+            return float(latency)
                 
         except Exception as e:
-            self.logger.warning(f"Error in latency calculation for {target_behavior}: {str(e)}", exc_info=True)
+            self.logger.warning("Error in latency calculation for %s: %s", target_behavior, e, exc_info=True)
             return test_duration
     
-    def _calculate_total_aggression(self, df, behaviors):
+    def _calculate_total_aggression(self, df, behaviors, event_arrays=None):
         """
         Calculate the total time for a set of behaviors, accounting for overlaps.
         Uses a timeline approach to handle overlapping behaviors.
@@ -1269,6 +1486,10 @@ class AnalysisModel(QObject):
         Args:
             df (pd.DataFrame): Annotation data
             behaviors (list): List of behaviors to include
+            event_arrays (dict, optional): Output of
+                :meth:`_event_arrays_by_behavior` for ``df``; when given the
+                behaviors' events are taken from it instead of masking the
+                Event column
             
         Returns:
             float: Total duration in seconds
@@ -1278,75 +1499,57 @@ class AnalysisModel(QObject):
             if df.empty:
                 return 0
             
-            # Filter for specified behaviors
-            behaviors_df = df[df['Event'].isin(behaviors)].copy()
-            
-            # If no specified behaviors found, return 0
-            if behaviors_df.empty:
-                return 0
+            if event_arrays is not None:
+                groups = [
+                    event_arrays[behavior]
+                    for behavior in dict.fromkeys(behaviors)
+                    if behavior in event_arrays
+                ]
+                if not groups:
+                    return 0
+                selected = None
+            else:
+                # Select the specified behaviors with a boolean mask over
+                # plain arrays; no filtered DataFrame copy is needed.
+                selected = df['Event'].isin(behaviors).to_numpy()
+                
+                # If no specified behaviors found, return 0
+                if not selected.any():
+                    return 0
             
             # Convert onset/offset to numeric to ensure proper calculations
             try:
-                # Use .loc to avoid SettingWithCopyWarning
-                # Column-replacement assignment (behaviors_df is already a
-                # copy) so a string/object source column can become float;
-                # pandas 2.1+ rejects ``.loc[:, col] = <float>`` into a
-                # str-dtype column.
-                behaviors_df['Onset'] = pd.to_numeric(behaviors_df['Onset'], errors='coerce')
-                behaviors_df['Offset'] = pd.to_numeric(behaviors_df['Offset'], errors='coerce')
+                if selected is None:
+                    onsets = np.concatenate([group[0] for group in groups])
+                    offsets = np.concatenate([group[1] for group in groups])
+                else:
+                    onsets = _float_values(df['Onset'])[selected]
+                    offsets = _float_values(df['Offset'])[selected]
                 
                 # Drop any rows with NaN values after conversion
-                behaviors_df = behaviors_df.dropna(subset=['Onset', 'Offset'])
+                present = ~(np.isnan(onsets) | np.isnan(offsets))
+                onsets = onsets[present]
+                offsets = offsets[present]
                 
                 # Validate that Offset >= Onset for each row
-                invalid_rows = behaviors_df[behaviors_df['Offset'] < behaviors_df['Onset']]
-                if not invalid_rows.empty:
-                    self.logger.warning(f"Found {len(invalid_rows)} behavior events with Offset < Onset")
+                inverted = offsets < onsets
+                if inverted.any():
+                    self.logger.warning("Found %s behavior events with Offset < Onset", int(inverted.sum()))
                     # Remove invalid rows
-                    behaviors_df = behaviors_df[behaviors_df['Offset'] >= behaviors_df['Onset']]
+                    onsets = onsets[~inverted]
+                    offsets = offsets[~inverted]
             except Exception as e:
-                self.logger.warning(f"Error converting behavior times to numeric: {str(e)}")
+                self.logger.warning("Error converting behavior times to numeric: %s", e)
                 return 0
             
             # If after cleaning we have no valid rows, return 0
-            if behaviors_df.empty:
-                return 0
-            
-            # Timeline approach to account for overlaps - fully vectorised.
-            # Build sorted arrays of (time, delta) events without iterrows.
-            onsets = behaviors_df['Onset'].to_numpy(dtype=float)
-            offsets = behaviors_df['Offset'].to_numpy(dtype=float)
-
             if onsets.size == 0:
                 return 0
-
-            times = np.concatenate([onsets, offsets])
-            deltas = np.concatenate([
-                np.ones(onsets.size, dtype=np.int64),
-                -np.ones(offsets.size, dtype=np.int64),
-            ])
-
-            # Sort primarily by time ascending; for ties, starts (+1) precede
-            # ends (-1) so half-open ranges are handled correctly. lexsort
-            # uses the LAST key as the primary, so we pass (-deltas, times).
-            order = np.lexsort((-deltas, times))
-            sorted_times = times[order]
-            sorted_deltas = deltas[order]
-
-            if sorted_times.size < 2:
-                return 0
-
-            # ``active_during[i]`` is the active behaviour count in the
-            # segment that begins at ``sorted_times[i]`` and ends at
-            # ``sorted_times[i + 1]``.
-            active_during = np.cumsum(sorted_deltas)
-            segment_lengths = np.diff(sorted_times)
-            covered_mask = active_during[:-1] > 0
-
-            return float(np.sum(segment_lengths[covered_mask]))
+            
+            return _covered_length(onsets, offsets)
             
         except Exception as e:
-            self.logger.warning(f"Error calculating total time for behaviors {behaviors}: {str(e)}")
+            self.logger.warning("Error calculating total time for behaviors %s: %s", behaviors, e)
             return 0
     
     def analyze_all_files(self):
@@ -1364,36 +1567,8 @@ class AnalysisModel(QObject):
             self._reanalyze_loaded_files()
 
             # Log summary of analysis results only for diagnostics.
-            for file_path, metrics in self._results.items():
-                file_name = os.path.basename(file_path)
-                self.logger.debug(f"Analysis results for {file_name}:")
-                
-                # Log durations and counts for each behavior
-                for behavior in self._behaviors:
-                    duration = metrics.get(f"{behavior}_duration", 0)
-                    count = metrics.get(f"{behavior}_count", 0)
-                    self.logger.debug(f"  {behavior}: {count} occurrences, {duration:.2f}s total")
-                
-                # Log custom metrics (latency)
-                latency_metrics = self._metrics_config.get_enabled_latency_metrics()
-                for metric in latency_metrics:
-                    metric_name = metric["name"]
-                    key = f"{metric_name.lower().replace(' ', '_')}"
-                    if key in metrics:
-                        self.logger.debug(f"  {metric_name}: {metrics[key]:.2f}s")
-                
-                # Log custom metrics (total time)
-                total_time_metrics = self._metrics_config.get_enabled_total_time_metrics()
-                for metric in total_time_metrics:
-                    metric_name = metric["name"]
-                    key = f"{metric_name.lower().replace(' ', '_')}"
-                    if key in metrics:
-                        self.logger.debug(f"  {metric_name}: {metrics[key]:.2f}s")
-                
-                # Log interval results if available
-                if self._interval_enabled and file_path in self._interval_results:
-                    intervals = self._interval_results[file_path]
-                    self.logger.debug(f"  Interval analysis: {len(intervals)} intervals of {self._interval_seconds} seconds each")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self._log_analysis_results()
             
             # Emit the results for UI update
             self.analysis_complete.emit(self._results)
@@ -1404,6 +1579,39 @@ class AnalysisModel(QObject):
             self.logger.error(error_msg, exc_info=True)
             self.error_occurred.emit(error_msg)
             return False
+
+    def _log_analysis_results(self):
+        """Log every file's metrics at debug level."""
+        for file_path, metrics in self._results.items():
+            file_name = os.path.basename(file_path)
+            self.logger.debug("Analysis results for %s:", file_name)
+
+            # Log durations and counts for each behavior
+            for behavior in self._behaviors:
+                duration = metrics.get(f"{behavior}_duration", 0)
+                count = metrics.get(f"{behavior}_count", 0)
+                self.logger.debug("  %s: %s occurrences, %.2fs total", behavior, count, duration)
+
+            # Log custom metrics (latency)
+            latency_metrics = self._metrics_config.get_enabled_latency_metrics()
+            for metric in latency_metrics:
+                metric_name = metric["name"]
+                key = f"{metric_name.lower().replace(' ', '_')}"
+                if key in metrics:
+                    self.logger.debug("  %s: %.2fs", metric_name, metrics[key])
+
+            # Log custom metrics (total time)
+            total_time_metrics = self._metrics_config.get_enabled_total_time_metrics()
+            for metric in total_time_metrics:
+                metric_name = metric["name"]
+                key = f"{metric_name.lower().replace(' ', '_')}"
+                if key in metrics:
+                    self.logger.debug("  %s: %.2fs", metric_name, metrics[key])
+
+            # Log interval results if available
+            if self._interval_enabled and file_path in self._interval_results:
+                intervals = self._interval_results[file_path]
+                self.logger.debug("  Interval analysis: %s intervals of %s seconds each", len(intervals), self._interval_seconds)
     
     def get_results(self):
         """
@@ -1444,17 +1652,16 @@ class AnalysisModel(QObject):
         if df is None or df.empty or 'Event' not in df.columns:
             return {}
 
+        all_onsets = _float_values(df['Onset'])
+        all_offsets = _float_values(df['Offset'])
         result = {}
-        for behavior, group in df.groupby('Event'):
+        for behavior, positions in df.groupby('Event').indices.items():
             if behavior == 'RecordingStart' or not str(behavior).strip():
                 continue
-            onsets = pd.to_numeric(group['Onset'], errors='coerce')
-            offsets = pd.to_numeric(group['Offset'], errors='coerce')
-            pairs = [
-                (float(onset), float(offset))
-                for onset, offset in zip(onsets, offsets, strict=True)
-                if pd.notna(onset) and pd.notna(offset)
-            ]
+            onsets = all_onsets[positions]
+            offsets = all_offsets[positions]
+            present = ~(np.isnan(onsets) | np.isnan(offsets))
+            pairs = list(zip(onsets[present].tolist(), offsets[present].tolist(), strict=True))
             if pairs:
                 result[str(behavior)] = pairs
         return result
@@ -1473,8 +1680,8 @@ class AnalysisModel(QObject):
         if df is None or df.empty or 'Event' not in df.columns:
             return []
 
-        onsets = pd.to_numeric(df['Onset'], errors='coerce')
-        offsets = pd.to_numeric(df['Offset'], errors='coerce')
+        onsets = _float_values(df['Onset']).tolist()
+        offsets = _float_values(df['Offset']).tolist()
         rows = []
         for behavior, onset, offset in zip(df['Event'], onsets, offsets, strict=True):
             behavior = str(behavior).strip()
@@ -1493,7 +1700,8 @@ class AnalysisModel(QObject):
         self._results = {}
         self._interval_results = {}
         self._approximate_metrics = {}
-        self._behaviors = self._default_behaviors.copy()
+        self._analysis_memo = {}
+        self._behaviors = tuple(self._default_behaviors)
         self._custom_behaviors = set()
         self._source_view_for_next_load = None
     
@@ -1525,15 +1733,13 @@ class AnalysisModel(QObject):
         Returns:
             list: List of behavior names
         """
-        return self._behaviors.copy()
+        return list(self._behaviors)
 
     @staticmethod
     def _animal_id_from_path(source_path):
         """Return the exported animal_id for a source annotation path."""
-        animal_id = os.path.splitext(os.path.basename(source_path))[0]
-        if animal_id.endswith("_annotations"):
-            animal_id = animal_id[:-12]
-        return animal_id
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        return stem.removesuffix("_annotations")
 
     @staticmethod
     def _animal_sort_key(animal_id):
@@ -1696,65 +1902,34 @@ class AnalysisModel(QObject):
                 writer.writerow(column_headers)
                 
                 # Log the structure of the summary table only for diagnostics.
-                self.logger.debug(f"Summary table structure: {len(behaviors_list)} behaviors + {len(latency_metrics)} latency metrics + {len(total_time_metrics)} total time metrics")
-                self.logger.debug(f"Behaviors included: {behaviors_list}")
+                self.logger.debug("Summary table structure: %s behaviors + %s latency metrics + %s total time metrics", len(behaviors_list), len(latency_metrics), len(total_time_metrics))
+                self.logger.debug("Behaviors included: %s", behaviors_list)
                 
-                # Write data rows and validate metrics for each file. We use
+                # Result keys are resolved once per export rather than once
+                # per file and cell.
+                duration_keys = [self._result_keys(behavior)[0] for behavior in behaviors_list]
+                count_keys = [self._result_keys(behavior)[1] for behavior in behaviors_list]
+                latency_keys = [metric["name"].lower().replace(' ', '_') for metric in latency_metrics]
+                total_time_keys = [metric["name"].lower().replace(' ', '_') for metric in total_time_metrics]
+                format_seconds = self._format_optional_seconds
+
+                # One row per file: animal_id, durations, spacer, counts,
+                # spacer, latency metrics, total time metrics. We use
                 # ``source_path`` here to avoid shadowing the ``file_path``
                 # argument of this method, which refers to the export target.
-                data_rows = []
-                for source_path, metrics in self._sorted_results_items():
-                    animal_id = self._animal_id_from_path(source_path)
-
-                    # Start with animal_id
-                    row = [animal_id]
-                    
-                    self.logger.debug(f"Metrics for {animal_id}:")
-                    
-                    # Add duration values for each behavior
-                    for behavior in behaviors_list:
-                        # Get duration and ensure it's a float
-                        duration = float(metrics.get(f"{behavior}_duration", 0))
-                        self.logger.debug(f"  {behavior} duration: {duration:.2f}s")
-                        row.append(f"{duration:.2f}")
-                    
-                    # Add empty spacer cell between Duration and Frequency
-                    row.append("")
-                    
-                    # Add frequency values for each behavior
-                    for behavior in behaviors_list:
-                        # Get count and ensure it's an integer
-                        count = int(metrics.get(f"{behavior}_count", 0))
-                        self.logger.debug(f"  {behavior} count: {count}")
-                        row.append(str(count))
-                    
-                    # Add empty spacer cell between Frequency and custom metrics
-                    row.append("")
-                    
-                    # Add latency metrics
-                    for metric in latency_metrics:
-                        metric_name = metric["name"]
-                        key = f"{metric_name.lower().replace(' ', '_')}"
-                        value_text = self._format_optional_seconds(metrics.get(key))
-                        if value_text:
-                            self.logger.debug(f"  {metric_name}: {value_text}s")
-                        else:
-                            self.logger.debug(f"  {metric_name}: unavailable")
-                        row.append(value_text)
-
-                    # Add total time metrics
-                    for metric in total_time_metrics:
-                        metric_name = metric["name"]
-                        key = f"{metric_name.lower().replace(' ', '_')}"
-                        value_text = self._format_optional_seconds(metrics.get(key, 0))
-                        if value_text:
-                            self.logger.debug(f"  {metric_name}: {value_text}s")
-                        else:
-                            self.logger.debug(f"  {metric_name}: unavailable")
-                        row.append(value_text)
-
-                    data_rows.append(row)
-                    writer.writerow(row)
+                data_rows = [
+                    [
+                        self._animal_id_from_path(source_path),
+                        *(f"{float(metrics.get(key, 0)):.2f}" for key in duration_keys),
+                        "",
+                        *(str(int(metrics.get(key, 0))) for key in count_keys),
+                        "",
+                        *(format_seconds(metrics.get(key)) for key in latency_keys),
+                        *(format_seconds(metrics.get(key, 0)) for key in total_time_keys),
+                    ]
+                    for source_path, metrics in self._sorted_results_items()
+                ]
+                writer.writerows(data_rows)
 
                 self._append_standard_summary_stats(writer, data_rows, column_headers)
 
@@ -1771,7 +1946,7 @@ class AnalysisModel(QObject):
                         "summary-only input): " + ", ".join(sorted(approx_names)),
                     ])
 
-            self.logger.info(f"Successfully exported standard summary table to {file_path}")
+            self.logger.info("Successfully exported standard summary table to %s", file_path)
             return True
         except Exception as e:
             error_msg = f"Failed to export standard summary: {str(e)}"
@@ -1893,7 +2068,7 @@ class AnalysisModel(QObject):
                     # Add an empty row between animals for readability
                     writer.writerow([])
             
-            self.logger.info(f"Successfully exported interval-based summary table to {file_path}")
+            self.logger.info("Successfully exported interval-based summary table to %s", file_path)
             return True
         except Exception as e:
             error_msg = f"Failed to export interval summary: {str(e)}"
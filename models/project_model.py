@@ -5,11 +5,37 @@ import os
 import random
 import shutil
 import uuid
+from datetime import datetime
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal
 
 from utils.content_hash import compute_partial_hash
 
+# Config keys holding the project's file lists, one per project subfolder.
+_FILE_TYPES = ("videos", "annotations", "action_maps", "analyses")
+_VALID_FILE_TYPES = frozenset(_FILE_TYPES)
+
+
+def _blank_project_config():
+    """Return an empty internal project config with fresh lists and maps."""
+    return {
+        "name": "",
+        "description": "",
+        "created_date": "",
+        "modified_date": "",
+        "videos": [],
+        "annotations": [],
+        "action_maps": [],
+        # Project-relative path of the action map bound to this project
+        # (1.4.2). Empty means "not bound" — the global user action map is
+        # used, which is how every pre-1.4.2 project behaves.
+        "action_map": "",
+        "analyses": [],
+        "video_annotation_status": {},
+        "video_annotation_files": {},
+        "video_content_hash": {},
+    }
+
 
 class ProjectModel(QObject):
     """
@@ -24,6 +50,8 @@ class ProjectModel(QObject):
         project_loaded: Emitted when a project is loaded
         project_saved: Emitted when a project is saved
         project_closed: Emitted when a project is closed
+        files_added: Emitted once per add call that listed new files
+            (file_type, count); a batch add emits it once for the batch
         error_occurred: Emitted when an error occurs
     """
     
@@ -31,6 +59,7 @@ class ProjectModel(QObject):
     project_loaded = Signal(str)   # Project path
     project_saved = Signal()
     project_closed = Signal()
+    files_added = Signal(str, int)  # file_type, number of newly listed files
     error_occurred = Signal(str)   # Error message
 
     # 1.4.2: filename used when a project's own action map is created by
@@ -48,26 +77,18 @@ class ProjectModel(QObject):
         # Project properties
         self._project_path = None
         self._project_name = None
-        self._project_config = {
-            "name": "",
-            "description": "",
-            "created_date": "",
-            "modified_date": "",
-            "videos": [],
-            "annotations": [],
-            "action_maps": [],
-            # Project-relative path of the action map bound to this project
-            # (1.4.2). Empty means "not bound" — the global user action map is
-            # used, which is how every pre-1.4.2 project behaves.
-            "action_map": "",
-            "analyses": [],
-            "video_annotation_files": {},
-        }
+        self._project_config = _blank_project_config()
         # PR-S2: stored-path -> stable video id. Populated on load/add; the id
         # is persisted in the v2 manifest (entry.id) and reused rather than
         # recomputed from the path, so it survives moving the project folder
         # (BUG-006). _get_video_id reads this map; only add_video mints new ids.
         self._video_id_by_path = {}
+        # File type -> (config list, set of its paths). Backs O(1) "already in
+        # the project?" checks; see _path_index.
+        self._path_indexes = {}
+        # (project path, {file_type: folder}, project.json path) for the open
+        # project; see _project_layout.
+        self._layout_cache = None
         self._is_modified = False
     
     def create_project(self, project_path, project_name, description=""):
@@ -83,45 +104,37 @@ class ProjectModel(QObject):
             bool: True if project was created successfully, False otherwise
         """
         try:
-            self.logger.info(f"Creating project: {project_name} at {project_path}")
+            self.logger.info("Creating project: %s at %s", project_name, project_path)
             
             # Create project directory
-            project_dir = Path(project_path) / project_name
-            if project_dir.exists():
+            project_dir = os.path.abspath(os.path.join(os.fspath(project_path), project_name))
+            if os.path.exists(project_dir):
                 error_msg = f"Project directory already exists: {project_dir}"
                 self.logger.error(error_msg)
                 self.error_occurred.emit(error_msg)
                 return False
             
             # Create project structure
-            project_dir.mkdir(parents=True)
-            (project_dir / "videos").mkdir()
-            (project_dir / "annotations").mkdir()
-            (project_dir / "action_maps").mkdir()
-            (project_dir / "analyses").mkdir()
+            os.makedirs(project_dir)
+            for file_type in _FILE_TYPES:
+                os.mkdir(os.path.join(project_dir, file_type))
             
             # Initialize project configuration
-            from datetime import datetime
             current_date = datetime.now().isoformat()
             
-            self._project_config = {
-                "name": project_name,
-                "description": description,
-                "created_date": current_date,
-                "modified_date": current_date,
-                "videos": [],
-                "annotations": [],
-                "action_maps": [],
-                # Bound on creation by ProjectController, which snapshots the
-                # active action map into action_maps/ so the project is
-                # self-contained from the start (1.4.2).
-                "action_map": "",
-                "analyses": [],
-                "video_annotation_status": {},  # New field to track annotation status
-                "video_annotation_files": {},
-                "video_content_hash": {},
-            }
+            # "action_map" stays empty here: it is bound on creation by
+            # ProjectController, which snapshots the active action map into
+            # action_maps/ so the project is self-contained from the start
+            # (1.4.2).
+            self._project_config = _blank_project_config()
+            self._project_config.update(
+                name=project_name,
+                description=description,
+                created_date=current_date,
+                modified_date=current_date,
+            )
             self._video_id_by_path = {}
+            self._path_indexes = {}
 
             # Save project configuration. If the manifest cannot be written we
             # must NOT report success or enter the "project open" state — doing
@@ -129,7 +142,7 @@ class ProjectModel(QObject):
             # (BUG-007).
             if not self._save_project_config(project_dir):
                 error_msg = (
-                    f"Failed to write project manifest at {project_dir / 'project.json'}"
+                    f"Failed to write project manifest at {os.path.join(project_dir, 'project.json')}"
                 )
                 self.logger.error(error_msg)
                 self.error_occurred.emit(error_msg)
@@ -139,12 +152,12 @@ class ProjectModel(QObject):
                     shutil.rmtree(project_dir)
                 except OSError as exc:
                     self.logger.warning(
-                        f"Could not clean up failed project dir {project_dir}: {exc}"
+                        "Could not clean up failed project dir %s: %s", project_dir, exc
                     )
                 return False
 
             # Update current project
-            self._project_path = str(project_dir)
+            self._project_path = project_dir
             self._project_name = project_name
             self._is_modified = False
 
@@ -168,14 +181,15 @@ class ProjectModel(QObject):
             bool: True if project was loaded successfully, False otherwise
         """
         try:
-            self.logger.info(f"Loading project from: {project_path}")
+            self.logger.info("Loading project from: %s", project_path)
             self._is_modified = False
             
-            project_dir = Path(project_path)
-            config_file = project_dir / "project.json"
+            project_dir = os.path.abspath(os.fspath(project_path))
+            config_file = os.path.join(project_dir, "project.json")
             
-            # Check if it's a valid project directory
-            if not project_dir.is_dir() or not config_file.exists():
+            # Check if it's a valid project directory. A regular project.json
+            # inside it implies the directory itself, so one stat covers both.
+            if not os.path.isfile(config_file):
                 error_msg = f"Invalid project directory: {project_path}"
                 self.logger.error(error_msg)
                 self.error_occurred.emit(error_msg)
@@ -191,8 +205,8 @@ class ProjectModel(QObject):
 
             # Set the project path/name early so video-id resolution works while
             # we normalise the manifest below.
-            self._project_path = str(project_dir)
-            self._project_name = self._project_config.get("name", project_dir.name)
+            self._project_path = project_dir
+            self._project_name = self._project_config.get("name", os.path.basename(project_dir))
 
             # Normalise the on-disk manifest (v1 string-list videos OR v2 object
             # videos) into the internal representation used by the rest of
@@ -291,7 +305,7 @@ class ProjectModel(QObject):
             if self._is_modified:
                 self.logger.info("Updated annotation status based on existing files")
         except Exception as e:
-            self.logger.error(f"Error updating annotation status: {str(e)}")
+            self.logger.error("Error updating annotation status: %s", e)
 
     def _migrate_video_annotation_status(self):
         """
@@ -358,7 +372,7 @@ class ProjectModel(QObject):
         reference = str(video_reference)
         videos = self._project_config.get("videos", [])
 
-        if reference in videos:
+        if reference in self._path_index("videos"):
             return reference
 
         normalized_reference = self._normalize_video_reference(reference)
@@ -424,7 +438,7 @@ class ProjectModel(QObject):
             return None
         reference = str(video_reference)
         videos = self._project_config.get("videos", [])
-        if reference in videos:
+        if reference in self._path_index("videos"):
             return reference
         if self._project_path:
             normalized_reference = self._normalize_video_reference(reference)
@@ -511,15 +525,17 @@ class ProjectModel(QObject):
         base_name = self._get_legacy_video_id(target)
         rel_path = self._make_unique_annotation_relative_path(base_name, video_id)
         legacy_hashed_rel_path = os.path.join("annotations", f"{video_id}_annotations.csv")
-        legacy_hashed_full_path = Path(self._project_path) / legacy_hashed_rel_path
-        clean_full_path = Path(self._project_path) / rel_path
+        legacy_hashed_full_path = os.path.join(self._project_path, legacy_hashed_rel_path)
+        clean_full_path = os.path.join(self._project_path, rel_path)
 
-        if legacy_hashed_full_path.exists() and not clean_full_path.exists():
+        if os.path.exists(legacy_hashed_full_path) and not os.path.exists(clean_full_path):
             try:
                 shutil.copy2(legacy_hashed_full_path, clean_full_path)
                 annotations = self._project_config.setdefault("annotations", [])
-                if rel_path not in annotations:
+                annotation_index = self._path_index("annotations")
+                if rel_path not in annotation_index:
                     annotations.append(rel_path)
+                    annotation_index.add(rel_path)
                 self.logger.info(
                     "Copied legacy hashed annotation file to readable name: %s -> %s",
                     legacy_hashed_rel_path,
@@ -571,15 +587,21 @@ class ProjectModel(QObject):
             return False
         
         try:
-            self.logger.info(f"Saving project: {self._project_name}")
+            # Nothing changed since the last load or save, so the manifest on
+            # disk is current: skip the rewrite and the modified_date bump.
+            _, config_file = self._project_layout()
+            if not self._is_modified and os.path.isfile(config_file):
+                self.logger.debug("Project unchanged; skipping save")
+                self.project_saved.emit()
+                return True
+
+            self.logger.info("Saving project: %s", self._project_name)
             
             # Update modified date
-            from datetime import datetime
             self._project_config["modified_date"] = datetime.now().isoformat()
             
             # Save project configuration
-            project_dir = Path(self._project_path)
-            success = self._save_project_config(project_dir)
+            success = self._save_project_config()
             
             if success:
                 self._is_modified = False
@@ -604,26 +626,15 @@ class ProjectModel(QObject):
             return True  # No project to close
         
         try:
-            self.logger.info(f"Closing project: {self._project_name}")
+            self.logger.info("Closing project: %s", self._project_name)
             
             # Reset project properties
             self._project_path = None
             self._project_name = None
-            self._project_config = {
-                "name": "",
-                "description": "",
-                "created_date": "",
-                "modified_date": "",
-                "videos": [],
-                "annotations": [],
-                "action_maps": [],
-                "action_map": "",
-                "analyses": [],
-                "video_annotation_status": {},
-                "video_annotation_files": {},
-                "video_content_hash": {},
-            }
+            self._project_config = _blank_project_config()
             self._video_id_by_path = {}
+            self._path_indexes = {}
+            self._layout_cache = None
             self._is_modified = False
 
             self.project_closed.emit()
@@ -635,6 +646,14 @@ class ProjectModel(QObject):
             self.error_occurred.emit(error_msg)
             return False
     
+    # File type -> name used for it in log and error messages.
+    _FILE_TYPE_LABELS = {
+        "videos": "video",
+        "annotations": "annotation",
+        "action_maps": "action map",
+        "analyses": "analysis",
+    }
+
     def add_video(self, video_path, copy_to_project=False):
         """
         Add a video to the project.
@@ -647,72 +666,27 @@ class ProjectModel(QObject):
         Returns:
             bool: True if video was added successfully, False otherwise
         """
-        if not self._project_path:
-            error_msg = "No project is currently open"
-            self.logger.error(error_msg)
-            self.error_occurred.emit(error_msg)
-            return False
-        
-        try:
-            video_path = Path(video_path)
-            
-            if not video_path.exists():
-                error_msg = f"Video file not found: {video_path}"
-                self.logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return False
-            
-            # Generate a project-relative path for the video
-            if copy_to_project:
-                # Copy video to project directory
-                project_videos_dir = Path(self._project_path) / "videos"
-                target_path = project_videos_dir / video_path.name
-                
-                if not self._file_manager.copy_file(video_path, target_path):
-                    error_msg = f"Failed to copy video to project: {video_path}"
-                    self.logger.error(error_msg)
-                    self.error_occurred.emit(error_msg)
-                    return False
-                
-                # Use relative path for storage
-                rel_path = os.path.join("videos", video_path.name)
-            else:
-                # Store absolute path
-                rel_path = str(video_path)
-            
-            # Check if video is already in the project
-            if rel_path in self._project_config["videos"]:
-                return True  # Already added
-            
-            # Add video to project
-            self._project_config["videos"].append(rel_path)
+        return self._add_and_announce(
+            [video_path], "videos", copy_to_project, self._register_added_video
+        )[0]
 
-            # Mint and register a move-stable id (PR-S2), then initialise status.
-            video_id = self._mint_video_id(rel_path)
-            self._video_id_by_path[rel_path] = video_id
-            if "video_annotation_status" not in self._project_config:
-                self._project_config["video_annotation_status"] = {}
-            self._project_config["video_annotation_status"][video_id] = "not_annotated"
+    def _register_added_video(self, video_path, rel_path):
+        """Mint the id, status and content hash of a newly added video."""
+        # Mint and register a move-stable id (PR-S2), then initialise status.
+        video_id = self._mint_video_id(rel_path)
+        self._video_id_by_path[rel_path] = video_id
+        if "video_annotation_status" not in self._project_config:
+            self._project_config["video_annotation_status"] = {}
+        self._project_config["video_annotation_status"][video_id] = "not_annotated"
 
-            # Record a partial content hash for relink matching (PR-S3). The
-            # source file equals the copied file, so hashing video_path is valid
-            # for both copied and external videos.
-            content_hash = compute_partial_hash(str(video_path))
-            if content_hash:
-                self._project_config.setdefault(
-                    "video_content_hash", {}
-                )[video_id] = content_hash
-            
-            self._is_modified = True
-            
-            self.logger.debug(f"Added video to project: {rel_path}")
-            return True
-            
-        except Exception as e:
-            error_msg = f"Failed to add video: {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
-            self.error_occurred.emit(error_msg)
-            return False
+        # Record a partial content hash for relink matching (PR-S3). The
+        # source file equals the copied file, so hashing video_path is valid
+        # for both copied and external videos.
+        content_hash = compute_partial_hash(str(video_path))
+        if content_hash:
+            self._project_config.setdefault(
+                "video_content_hash", {}
+            )[video_id] = content_hash
     
     def add_annotation(self, annotation_path, copy_to_project=True, update_status=True):
         """
@@ -726,85 +700,33 @@ class ProjectModel(QObject):
         Returns:
             bool: True if annotation was added successfully, False otherwise
         """
-        if not self._project_path:
-            error_msg = "No project is currently open"
-            self.logger.error(error_msg)
-            self.error_occurred.emit(error_msg)
-            return False
-        
-        try:
-            annotation_path = Path(annotation_path)
-            
-            if not annotation_path.exists():
-                error_msg = f"Annotation file not found: {annotation_path}"
-                self.logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return False
-            
-            # Generate a project-relative path for the annotation
-            if copy_to_project:
-                # Copy annotation to project directory
-                project_annotations_dir = Path(self._project_path) / "annotations"
-                target_path = project_annotations_dir / annotation_path.name
-                
-                if not self._file_manager.copy_file(annotation_path, target_path):
-                    error_msg = f"Failed to copy annotation to project: {annotation_path}"
-                    self.logger.error(error_msg)
-                    self.error_occurred.emit(error_msg)
-                    return False
-                
-                # Use relative path for storage
-                rel_path = os.path.join("annotations", annotation_path.name)
-            else:
-                try:
-                    project_root = Path(self._project_path).resolve()
-                    resolved_annotation = annotation_path.resolve()
-                    if os.path.commonpath([str(resolved_annotation), str(project_root)]) == str(project_root):
-                        rel_path = os.path.relpath(resolved_annotation, project_root)
-                    else:
-                        rel_path = str(annotation_path)
-                except ValueError:
-                    rel_path = str(annotation_path)
-            
-            # Check if annotation is already in the project
-            if rel_path in self._project_config["annotations"]:
-                return True  # Already added
-            
-            # Add annotation to project
-            self._project_config["annotations"].append(rel_path)
+        on_added = self._mark_annotated_video if update_status else None
+        return self._add_and_announce(
+            [annotation_path], "annotations", copy_to_project, on_added
+        )[0]
+
+    def _mark_annotated_video(self, annotation_path, rel_path):
+        """Mark the video a newly added annotation file belongs to as annotated."""
+        # Extract base filename without extension and remove "_annotations" suffix if present
+        base_name = os.path.splitext(os.path.basename(annotation_path))[0]
+        if base_name.endswith("_annotations"):
+            base_name = base_name[:-12]
+
+        matching_videos = self._find_video_matches_for_annotation_base_name(base_name)
+        if len(matching_videos) == 1:
+            self.set_video_annotation_status(matching_videos[0], "annotated")
+        elif len(matching_videos) > 1:
+            self._project_config.setdefault("video_annotation_status", {})[base_name] = "annotated"
             self._is_modified = True
-            
-            # Update annotation status if requested
-            if update_status:
-                # Extract base filename without extension and remove "_annotations" suffix if present
-                base_name = os.path.splitext(os.path.basename(annotation_path))[0]
-                if base_name.endswith("_annotations"):
-                    base_name = base_name[:-12]
-
-                matching_videos = self._find_video_matches_for_annotation_base_name(base_name)
-                if len(matching_videos) == 1:
-                    self.set_video_annotation_status(matching_videos[0], "annotated")
-                elif len(matching_videos) > 1:
-                    self._project_config.setdefault("video_annotation_status", {})[base_name] = "annotated"
-                    self._is_modified = True
-                    self.logger.warning(
-                        "Annotation '%s' matches multiple videos; preserving shared legacy status",
-                        annotation_path.name,
-                    )
-                else:
-                    self.logger.warning(
-                        "Could not match annotation '%s' to a project video",
-                        annotation_path.name,
-                    )
-             
-            self.logger.debug(f"Added annotation to project: {rel_path}")
-            return True
-            
-        except Exception as e:
-            error_msg = f"Failed to add annotation: {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
-            self.error_occurred.emit(error_msg)
-            return False
+            self.logger.warning(
+                "Annotation '%s' matches multiple videos; preserving shared legacy status",
+                annotation_path.name,
+            )
+        else:
+            self.logger.warning(
+                "Could not match annotation '%s' to a project video",
+                annotation_path.name,
+            )
     
     def add_action_map(self, action_map_path, copy_to_project=True):
         """
@@ -817,55 +739,7 @@ class ProjectModel(QObject):
         Returns:
             bool: True if action map was added successfully, False otherwise
         """
-        if not self._project_path:
-            error_msg = "No project is currently open"
-            self.logger.error(error_msg)
-            self.error_occurred.emit(error_msg)
-            return False
-        
-        try:
-            action_map_path = Path(action_map_path)
-            
-            if not action_map_path.exists():
-                error_msg = f"Action map file not found: {action_map_path}"
-                self.logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return False
-            
-            # Generate a project-relative path for the action map
-            if copy_to_project:
-                # Copy action map to project directory
-                project_maps_dir = Path(self._project_path) / "action_maps"
-                target_path = project_maps_dir / action_map_path.name
-                
-                if not self._file_manager.copy_file(action_map_path, target_path):
-                    error_msg = f"Failed to copy action map to project: {action_map_path}"
-                    self.logger.error(error_msg)
-                    self.error_occurred.emit(error_msg)
-                    return False
-                
-                # Use relative path for storage
-                rel_path = os.path.join("action_maps", action_map_path.name)
-            else:
-                # Store absolute path
-                rel_path = str(action_map_path)
-            
-            # Check if action map is already in the project
-            if rel_path in self._project_config["action_maps"]:
-                return True  # Already added
-            
-            # Add action map to project
-            self._project_config["action_maps"].append(rel_path)
-            self._is_modified = True
-            
-            self.logger.debug(f"Added action map to project: {rel_path}")
-            return True
-            
-        except Exception as e:
-            error_msg = f"Failed to add action map: {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
-            self.error_occurred.emit(error_msg)
-            return False
+        return self._add_and_announce([action_map_path], "action_maps", copy_to_project)[0]
     
     def add_analysis(self, analysis_path, copy_to_project=True):
         """
@@ -878,52 +752,150 @@ class ProjectModel(QObject):
         Returns:
             bool: True if analysis was added successfully, False otherwise
         """
+        return self._add_and_announce([analysis_path], "analyses", copy_to_project)[0]
+
+    def add_files(self, file_paths, file_type, copy_to_project=True):
+        """
+        Add several files of one type to the project.
+
+        Equivalent to calling the matching ``add_*`` method for each path,
+        for callers that import a whole selection at once.
+
+        Args:
+            file_paths (list): Paths to the files
+            file_type (str): Type of file (videos, annotations, action_maps, analyses)
+            copy_to_project (bool): Whether to copy the files to the project directory
+
+        Returns:
+            list: One bool per path, True if that file is in the project
+        """
+        if file_type not in _VALID_FILE_TYPES:
+            error_msg = f"Invalid file type: {file_type}"
+            self.logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+            return [False] * len(file_paths)
+
+        on_added = {
+            "videos": self._register_added_video,
+            "annotations": self._mark_annotated_video,
+        }.get(file_type)
+        results = self._add_and_announce(
+            file_paths, file_type, copy_to_project, on_added, log_each=False
+        )
+        self.logger.debug(
+            "Added %d of %d %s to project", sum(results), len(results), file_type
+        )
+        return results
+
+    def _add_and_announce(
+        self, file_paths, file_type, copy_to_project, on_added=None, log_each=True,
+    ):
+        """
+        Add files through :meth:`_add_file` and emit ``files_added`` once.
+
+        ``log_each`` is passed on to :meth:`_add_file`; batch callers turn it
+        off and log one summary line instead.
+
+        Returns:
+            list: One bool per path, as returned by :meth:`_add_file`
+        """
+        listed_before = len(self._project_config.get(file_type, ()))
+        add_file = self._add_file
+        results = [
+            add_file(file_path, file_type, copy_to_project, on_added, log_each)
+            for file_path in file_paths
+        ]
+        added = len(self._project_config.get(file_type, ())) - listed_before
+        if added > 0:
+            self.files_added.emit(file_type, added)
+        return results
+
+    def _add_file(self, file_path, file_type, copy_to_project, on_added=None, log_added=True):
+        """
+        Register a file under one of the project's file lists.
+
+        Shared by the ``add_*`` methods: checks the file exists, copies it
+        into the project's ``file_type`` folder if requested, and appends the
+        stored path unless it is already listed.
+
+        Args:
+            file_path (str): Path to the file
+            file_type (str): Type of file (videos, annotations, action_maps, analyses)
+            copy_to_project (bool): Whether to copy the file to the project directory
+            on_added (callable, optional): Called as ``on_added(path, rel_path)``
+                after a file is newly listed, for type-specific bookkeeping
+            log_added (bool): Whether to log a debug line for the added file
+
+        Returns:
+            bool: True if the file is in the project, False otherwise
+        """
         if not self._project_path:
             error_msg = "No project is currently open"
             self.logger.error(error_msg)
             self.error_occurred.emit(error_msg)
             return False
-        
+
+        label = self._FILE_TYPE_LABELS[file_type]
         try:
-            analysis_path = Path(analysis_path)
-            
-            if not analysis_path.exists():
-                error_msg = f"Analysis file not found: {analysis_path}"
+            file_path = Path(file_path)
+
+            # is_file() is a single stat that also rejects directories, which
+            # could be copied or listed as a project file otherwise.
+            if not file_path.is_file():
+                error_msg = f"{label.capitalize()} file not found: {file_path}"
                 self.logger.error(error_msg)
                 self.error_occurred.emit(error_msg)
                 return False
-            
-            # Generate a project-relative path for the analysis
+
+            # Generate a project-relative path for the file
             if copy_to_project:
-                # Copy analysis to project directory
-                project_analyses_dir = Path(self._project_path) / "analyses"
-                target_path = project_analyses_dir / analysis_path.name
-                
-                if not self._file_manager.copy_file(analysis_path, target_path):
-                    error_msg = f"Failed to copy analysis to project: {analysis_path}"
+                # Copy file to project directory
+                subdirs, _ = self._project_layout()
+                target_path = os.path.join(subdirs[file_type], file_path.name)
+
+                if not self._file_manager.copy_file(file_path, target_path):
+                    error_msg = f"Failed to copy {label} to project: {file_path}"
                     self.logger.error(error_msg)
                     self.error_occurred.emit(error_msg)
                     return False
-                
+
                 # Use relative path for storage
-                rel_path = os.path.join("analyses", analysis_path.name)
+                rel_path = os.path.join(file_type, file_path.name)
+            elif file_type == "annotations":
+                # External annotations inside the project folder are still
+                # stored project-relative.
+                try:
+                    project_root = Path(self._project_path).resolve()
+                    resolved_annotation = file_path.resolve()
+                    if os.path.commonpath([str(resolved_annotation), str(project_root)]) == str(project_root):
+                        rel_path = os.path.relpath(resolved_annotation, project_root)
+                    else:
+                        rel_path = str(file_path)
+                except ValueError:
+                    rel_path = str(file_path)
             else:
                 # Store absolute path
-                rel_path = str(analysis_path)
-            
-            # Check if analysis is already in the project
-            if rel_path in self._project_config["analyses"]:
+                rel_path = str(file_path)
+
+            # Check if file is already in the project
+            path_index = self._path_index(file_type)
+            if rel_path in path_index:
                 return True  # Already added
-            
-            # Add analysis to project
-            self._project_config["analyses"].append(rel_path)
+
+            # Add file to project
+            self._project_config[file_type].append(rel_path)
+            path_index.add(rel_path)
             self._is_modified = True
-            
-            self.logger.debug(f"Added analysis to project: {rel_path}")
+
+            if on_added is not None:
+                on_added(file_path, rel_path)
+
+            if log_added:
+                self.logger.debug("Added %s to project: %s", label, rel_path)
             return True
-            
+
         except Exception as e:
-            error_msg = f"Failed to add analysis: {str(e)}"
+            error_msg = f"Failed to add {label}: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
             self.error_occurred.emit(error_msg)
             return False
@@ -947,14 +919,15 @@ class ProjectModel(QObject):
         
         try:
             # Check if file type is valid
-            if file_type not in ["videos", "annotations", "action_maps", "analyses"]:
+            if file_type not in _VALID_FILE_TYPES:
                 error_msg = f"Invalid file type: {file_type}"
                 self.logger.error(error_msg)
                 self.error_occurred.emit(error_msg)
                 return False
             
             # Check if file is in project
-            if file_path not in self._project_config[file_type]:
+            path_index = self._path_index(file_type)
+            if file_path not in path_index:
                 error_msg = f"File not found in project: {file_path}"
                 self.logger.error(error_msg)
                 self.error_occurred.emit(error_msg)
@@ -962,27 +935,30 @@ class ProjectModel(QObject):
             
             # Remove file from project
             self._project_config[file_type].remove(file_path)
+            path_index.discard(file_path)
             self._is_modified = True
 
             if file_type == "videos":
                 video_id = self._get_video_id(file_path)
                 self._project_config.setdefault("video_annotation_files", {}).pop(video_id, None)
             
-            # If file is in project directory, delete it
+            # If file is in project directory, delete it. Only paths under the
+            # type's own folder were copied in by the project; absolute paths
+            # and other project-relative paths point at the user's files.
             stored_path = Path(file_path)
             if stored_path.parts and stored_path.parts[0] == file_type:
                 full_path = os.path.join(self._project_path, file_path)
                 try:
-                    Path(full_path).unlink()
-                except Exception:
+                    os.remove(full_path)
+                except OSError as exc:
                     # Don't fail if file can't be deleted
-                    self.logger.warning(f"Failed to delete file: {full_path}")
+                    self.logger.warning("Failed to delete file %s: %s", full_path, exc)
 
             if file_type in {"videos", "annotations"}:
                 self._migrate_video_annotation_status()
                 self._update_annotation_status()
              
-            self.logger.debug(f"Removed {file_type} from project: {file_path}")
+            self.logger.debug("Removed %s from project: %s", file_type, file_path)
             return True
             
         except Exception as e:
@@ -1285,7 +1261,7 @@ class ProjectModel(QObject):
             self._project_config["video_annotation_status"].pop(legacy_id, None)
         self._is_modified = True
         
-        self.logger.debug(f"Set annotation status for video {video_id} to {status}")
+        self.logger.debug("Set annotation status for video %s to %s", video_id, status)
         return True
     
     def get_video_by_id(self, video_id):
@@ -1365,17 +1341,66 @@ class ProjectModel(QObject):
         """
         return self._project_path is not None
     
-    def _save_project_config(self, project_dir):
+    def _path_index(self, file_type):
+        """
+        Return the set of stored paths for a file list in the project config.
+
+        The set mirrors ``self._project_config[file_type]`` so membership
+        checks do not scan the list. It is rebuilt whenever the list object
+        is replaced (load/create/close) or its length no longer matches,
+        e.g. after the list was edited without going through the model.
+
+        Args:
+            file_type (str): Config list key (videos, annotations, ...)
+
+        Returns:
+            set: Stored paths; callers that append to the list add to it too
+        """
+        paths = self._project_config.get(file_type)
+        if paths is None:
+            return set()
+        cached = self._path_indexes.get(file_type)
+        if cached is None or cached[0] is not paths or len(cached[1]) != len(paths):
+            cached = (paths, set(paths))
+            self._path_indexes[file_type] = cached
+        return cached[1]
+
+    def _project_layout(self):
+        """
+        Return the folder and manifest paths of the open project.
+
+        The paths are joined once per project path and reused, instead of
+        being rebuilt on every add and save.
+
+        Returns:
+            tuple: ({file_type: folder path}, project.json path) as strings
+        """
+        layout = self._layout_cache
+        if layout is None or layout[0] != self._project_path:
+            root = self._project_path
+            subdirs = {
+                file_type: os.path.join(root, file_type)
+                for file_type in _FILE_TYPES
+            }
+            layout = (root, subdirs, os.path.join(root, "project.json"))
+            self._layout_cache = layout
+        return layout[1], layout[2]
+
+    def _save_project_config(self, project_dir=None):
         """
         Save the project configuration to the project directory.
         
         Args:
-            project_dir (pathlib.Path): Project directory
+            project_dir (str or pathlib.Path, optional): Project directory;
+                defaults to the open project
             
         Returns:
             bool: True if saved successfully, False otherwise
         """
-        config_file = project_dir / "project.json"
+        if project_dir is None:
+            _, config_file = self._project_layout()
+        else:
+            config_file = os.path.join(project_dir, "project.json")
         # Serialize the internal representation to the v2 on-disk shape, then
         # write atomically (+ keep project.json.bak) so an interrupted save can
         # be recovered (BUG-019).
@@ -1559,8 +1584,11 @@ class ProjectModel(QObject):
                     return False
 
         new_stored = str(new_path)
+        video_index = self._path_index("videos")
         index = videos.index(stored)
         videos[index] = new_stored
+        video_index.discard(stored)
+        video_index.add(new_stored)
         # Move the id registration to the new stored path.
         self._video_id_by_path.pop(stored, None)
         self._video_id_by_path[new_stored] = video_id
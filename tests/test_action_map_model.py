@@ -125,3 +125,158 @@ def test_serialize_roundtrip_state_stays_string(tmp_path, model):
     assert fresh.load_from_json(str(out), auto_save=False, emit_signal=False) is True
     assert fresh.get_kind("a") == "state"
     assert fresh.get_kind("c") == "point"
+
+
+def test_add_mappings_emits_map_changed_once(model):
+    emitted = []
+    model.map_changed.connect(lambda: emitted.append(True))
+    assert model.add_mappings({"c": "Rearing", "d": "Locomotion"}) is True
+    assert model.get_behavior("c") == "Rearing"
+    assert model.get_behavior("d") == "Locomotion"
+    assert emitted == [True]
+
+
+def test_add_mappings_is_all_or_nothing(model):
+    # The second pair duplicates the first pair's behaviour inside the batch.
+    assert model.add_mappings({"c": "Rearing", "d": "rearing"}) is False
+    assert "c" not in model.get_all_mappings()
+    assert "d" not in model.get_all_mappings()
+
+
+def test_get_all_mappings_is_cached_until_map_changes(model):
+    first = model.get_all_mappings()
+    assert model.get_all_mappings() is first
+    with pytest.raises(TypeError):
+        first["z"] = "Nope"
+
+    assert model.add_mapping("c", "Rearing") is True
+    second = model.get_all_mappings()
+    assert second is not first
+    assert second["c"] == "Rearing"
+
+    assert model.remove_mapping("c") is True
+    assert "c" not in model.get_all_mappings()
+
+
+def test_get_active_behaviors_tracks_activation_and_removal(model):
+    assert dict(model.get_active_behaviors()) == {}
+    model.set_behavior_active("a", True)
+    first = model.get_active_behaviors()
+    assert dict(first) == {"a": "Attack bites"}
+    assert model.get_active_behaviors() is first
+
+    model.set_behavior_active("b", True)
+    assert dict(model.get_active_behaviors()) == {"a": "Attack bites", "b": "Chasing"}
+
+    assert model.remove_mapping("b") is True
+    assert dict(model.get_active_behaviors()) == {"a": "Attack bites"}
+
+    model.clear_active_behaviors()
+    assert dict(model.get_active_behaviors()) == {}
+
+
+def test_active_behaviors_changed_is_coalesced_per_event_loop_turn(qt_app, model):
+    emitted = []
+    model.active_behaviors_changed.connect(lambda: emitted.append(True))
+    model.set_behavior_active("a", True)
+    model.set_behavior_active("b", True)
+    assert emitted == []
+    qt_app.processEvents()
+    assert emitted == [True]
+
+    model.set_behavior_active("a", False, coalesce=False)
+    assert emitted == [True, True]
+
+
+def test_load_rejects_multi_character_key_and_non_string_label(tmp_path, model):
+    p = tmp_path / "bad_key.json"
+    p.write_text(json.dumps({"ab": "Chasing"}), encoding="utf-8")
+    assert model.load_from_json(str(p), auto_save=False, emit_signal=False) is False
+
+    p.write_text(json.dumps({"a": 3}), encoding="utf-8")
+    assert model.load_from_json(str(p), auto_save=False, emit_signal=False) is False
+    # A failed load leaves the previous map in place.
+    assert model.get_behavior("a") == "Attack bites"
+
+
+def test_auto_save_debounce_restarts_on_each_edit(qt_app, model):
+    import time
+
+    model._schedule_auto_save()
+    time.sleep(0.2)
+    model._schedule_auto_save()
+    assert model._auto_save_timer.isActive()
+    # Restarted by the second edit rather than still counting down from the first.
+    assert model._auto_save_timer.remainingTime() > 350
+    model._auto_save_timer.stop()
+    model._auto_save_pending = False
+
+
+def test_batch_emits_map_changed_once(model):
+    emitted = []
+    model.map_changed.connect(lambda: emitted.append(True))
+    with model.batch():
+        assert model.add_mapping("c", "Rearing") is True
+        with model.batch():
+            assert model.add_mapping("d", "Locomotion") is True
+        assert model.remove_mapping("b") is True
+        assert emitted == []
+    assert emitted == [True]
+    assert dict(model.get_all_mappings()) == {
+        "a": "Attack bites", "c": "Rearing", "d": "Locomotion",
+    }
+
+
+def test_batch_without_changes_emits_nothing(model):
+    emitted = []
+    model.map_changed.connect(lambda: emitted.append(True))
+    with model.batch():
+        assert model.add_mapping("c", "attack bites") is False
+    assert emitted == []
+
+
+def test_remove_mapping_unknown_key_returns_false(model):
+    removed = []
+    model.mapping_removed.connect(removed.append)
+    assert model.remove_mapping("z") is False
+    assert model.remove_mapping("a") is True
+    assert removed == ["Attack bites"]
+    assert model.get_behavior("a") is None
+
+
+def test_save_to_json_is_atomic(tmp_path, model, monkeypatch):
+    out = tmp_path / "map.json"
+    assert model.save_to_json(str(out)) is True
+    original = out.read_text(encoding="utf-8")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("utils.file_manager.os.replace", failing_replace)
+    model._action_map["c"] = "Rearing"
+    assert model.save_to_json(str(out)) is False
+
+    # The previous map is intact and no temp file was left behind.
+    assert out.read_text(encoding="utf-8") == original
+    assert [p.name for p in tmp_path.iterdir()] == ["map.json"]
+
+
+def test_state_changed_mirrors_individual_signals(qt_app, model):
+    seen = []
+    model.state_changed.connect(lambda tag, payload: seen.append((tag, payload)))
+
+    assert model.add_mapping("c", "Rearing") is True
+    model.set_behavior_active("c", True, coalesce=False)
+    assert model.add_mapping("d", "rearing") is False
+
+    assert seen[0] == ("map", None)
+    assert seen[1] == ("active", None)
+    assert seen[2][0] == "error"
+    assert "already mapped" in seen[2][1]
+
+
+def test_add_mapping_rejects_non_string_key_and_label(model):
+    assert model.add_mapping(1, "Rearing") is False
+    assert model.add_mapping("c", None) is False
+    assert model.add_mapping("cc", "Rearing") is False
+    assert "c" not in model.get_all_mappings()
@@ -195,6 +195,19 @@ def test_summary_only_latency_is_unavailable(model, tmp_path):
     assert metrics["attack_latency"] is None
 
 
+def test_summary_only_file_has_no_event_frame_and_reanalyzes(model, tmp_path):
+    p = _summary_only_csv(tmp_path)
+
+    assert model.load_files([str(p)]) is True
+    assert model._raw_data[str(p)] is None
+    assert model.get_event_tuples(str(p)) == []
+
+    assert model._reanalyze_loaded_files() is True
+    metrics = model.get_results()[str(p)]
+    assert metrics["Attack bites_duration"] == pytest.approx(2.0)
+    assert metrics["Attack bites_count"] == 3
+
+
 def test_raw_only_respects_metadata_test_duration(model, tmp_path):
     p = tmp_path / "raw_only.csv"
     p.write_text(
@@ -232,3 +245,246 @@ def test_same_behavior_overlap_uses_union_duration(model, tmp_path):
     metrics = model.get_results()[str(p)]
     assert metrics["Attack bites_duration"] == pytest.approx(15.0)
     assert metrics["Attack bites_count"] == 2
+
+
+def test_event_arrays_by_behavior_groups_in_one_pass(model):
+    df = _events_df()
+    arrays = model._event_arrays_by_behavior(df)
+
+    assert set(arrays) == {"RecordingStart", "Attack bites"}
+    onsets, offsets = arrays["Attack bites"]
+    assert list(onsets) == [5.0, 9.0]
+    assert list(offsets) == [6.0, 10.0]
+
+    # Shared arrays give the same answer as the standalone call.
+    assert model._calculate_behavior_duration_count(
+        df, "Attack bites", event_arrays=arrays,
+    ) == model._calculate_behavior_duration_count(df, "Attack bites")
+    assert model._calculate_behavior_duration_count(
+        df, "Chasing", event_arrays=arrays,
+    ) == (0.0, 0)
+
+
+def test_total_time_merges_nested_touching_and_disjoint_intervals(model):
+    df = pd.DataFrame(
+        {
+            "Event": ["Attack bites", "Chasing", "Attack bites", "Tail rattles", "Rearing"],
+            # [0,10] contains [2,4]; [10,12] touches it; [20,21] is disjoint.
+            "Onset": ["10.0", "2.0", "0.0", "20.0", "0.0"],
+            "Offset": ["12.0", "4.0", "10.0", "21.0", "50.0"],
+        }
+    )
+    total = model._calculate_total_aggression(
+        df, ["Attack bites", "Chasing", "Tail rattles"],
+    )
+    assert total == pytest.approx(13.0)
+
+
+def test_total_time_of_sequential_disjoint_events_is_plain_sum(model):
+    df = pd.DataFrame(
+        {
+            "Event": ["Attack bites", "Chasing", "Attack bites"],
+            "Onset": ["1.0", "3.0", "7.5"],
+            "Offset": ["2.0", "5.0", "8.0"],
+        }
+    )
+    total = model._calculate_total_aggression(df, ["Attack bites", "Chasing"])
+    assert total == pytest.approx(3.5)
+
+
+def test_interval_total_time_clips_merged_events_to_each_interval(model, tmp_path):
+    p = tmp_path / "animal.csv"
+    p.write_text(
+        "Metadata\n"
+        "Test Duration (seconds),20\n"
+        "\n"
+        "Event,Onset,Offset\n"
+        "RecordingStart,0.0,0.0\n"
+        "Attack bites,5.0,15.0\n"
+        "Chasing,8.0,12.0\n"
+        "Rearing,1.0,2.0\n",
+        encoding="utf-8",
+    )
+    model.set_interval_analysis(True, 10)
+    assert model.load_files([str(p)]) is True
+
+    first, second = model.get_interval_results()[str(p)]
+    assert first["total_aggression"] == pytest.approx(5.0)
+    assert second["total_aggression"] == pytest.approx(5.0)
+    assert model.get_results()[str(p)]["total_aggression"] == pytest.approx(10.0)
+
+
+def test_latency_uses_first_recording_start_and_earliest_onset(model):
+    df = pd.DataFrame(
+        {
+            "Event": ["Attack bites", "RecordingStart", "Attack bites", "RecordingStart"],
+            "Onset": ["12.0", "4.0", "7.5", "9.0"],
+            "Offset": ["13.0", "4.0", "8.0", "9.0"],
+        }
+    )
+    assert model._calculate_behavior_latency(df, "Attack bites", 300) == pytest.approx(3.5)
+    assert model._calculate_behavior_latency(df, "Chasing", 300) == 300
+
+    arrays = model._event_arrays_by_behavior(df)
+    assert model._calculate_behavior_latency(
+        df, "Attack bites", 300, arrays,
+    ) == pytest.approx(3.5)
+
+
+def test_latency_without_recording_start_uses_earliest_event(model):
+    df = pd.DataFrame(
+        {
+            "Event": ["Chasing", "Attack bites"],
+            "Onset": ["2.0", "5.0"],
+            "Offset": ["3.0", "6.0"],
+        }
+    )
+    arrays = model._event_arrays_by_behavior(df)
+    assert model._calculate_behavior_latency(
+        df, "Attack bites", 300, arrays,
+    ) == pytest.approx(3.0)
+
+
+def test_load_files_keeps_order_and_reports_bad_files(model, tmp_path):
+    paths = []
+    for index in range(4):
+        p = tmp_path / f"animal_{index}.csv"
+        if index == 2:
+            p.write_text("not,an,annotation\n", encoding="utf-8")
+        else:
+            p.write_text(
+                "Event,Onset,Offset\n"
+                "RecordingStart,0.0,0.0\n"
+                f"Attack bites,{index + 1}.0,{index + 2}.0\n",
+                encoding="utf-8",
+            )
+        paths.append(str(p))
+
+    errors = []
+    model.error_occurred.connect(errors.append)
+    assert model.load_files(paths + [str(tmp_path / "missing.csv")]) is True
+
+    assert model.get_file_paths() == [paths[0], paths[1], paths[3]]
+    assert len(errors) == 2
+    results = model.get_results()
+    assert results[paths[3]]["attack_latency"] == pytest.approx(4.0)
+
+
+def test_reloading_unchanged_file_reuses_parse(model, tmp_path, monkeypatch):
+    import os
+
+    p = tmp_path / "animal.csv"
+    p.write_text(
+        "Event,Onset,Offset\n"
+        "RecordingStart,0.0,0.0\n"
+        "Attack bites,2.0,3.0\n",
+        encoding="utf-8",
+    )
+    reads = []
+    original = model._read_annotation_file
+    monkeypatch.setattr(
+        model, "_read_annotation_file",
+        lambda path: reads.append(path) or original(path),
+    )
+
+    assert model.load_files([str(p)]) is True
+    assert model.load_files([str(p)]) is True
+    assert len(reads) == 1
+    assert model.get_results()[str(p)]["attack_latency"] == pytest.approx(2.0)
+
+    p.write_text(
+        "Event,Onset,Offset\n"
+        "RecordingStart,0.0,0.0\n"
+        "Attack bites,5.0,6.0\n",
+        encoding="utf-8",
+    )
+    stat = os.stat(p)
+    os.utime(p, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert model.load_files([str(p)]) is True
+    assert len(reads) == 2
+    assert model.get_results()[str(p)]["attack_latency"] == pytest.approx(5.0)
+
+
+def test_reanalysis_reuses_results_until_settings_change(model, tmp_path, monkeypatch):
+    p = tmp_path / "animal.csv"
+    p.write_text(
+        "Event,Onset,Offset\n"
+        "RecordingStart,0.0,0.0\n"
+        "Attack bites,2.0,3.0\n"
+        "Attack bites,70.0,72.0\n",
+        encoding="utf-8",
+    )
+    assert model.load_files([str(p)]) is True
+
+    calls = []
+    original = model._analyze_file
+    monkeypatch.setattr(
+        model, "_analyze_file",
+        lambda *args, **kwargs: calls.append(args[0]) or original(*args, **kwargs),
+    )
+
+    model.get_results()[str(p)]["attack_latency"] = -1.0
+    assert model.analyze_all_files() is True
+    assert calls == []
+    assert model.get_results()[str(p)]["attack_latency"] == pytest.approx(2.0)
+
+    model.set_interval_analysis(True, 60)
+    assert calls == [str(p)]
+    assert len(model.get_interval_results()[str(p)]) == 2
+
+    model.set_interval_analysis(True, 60)
+    assert calls == [str(p)]
+    assert len(model.get_interval_results()[str(p)]) == 2
+
+
+def test_raw_event_parse_failure_is_reported_without_retry(model, tmp_path, monkeypatch):
+    import models.analysis_model as analysis_module
+
+    calls = []
+
+    def failing_parser(lines, logger=None):
+        calls.append(lines)
+        raise ValueError("broken event table")
+
+    monkeypatch.setattr(analysis_module, "extract_event_dataframe_from_lines", failing_parser)
+    p = tmp_path / "animal.csv"
+    p.write_text("Event,Onset,Offset\nAttack bites,1.0,2.0\n", encoding="utf-8")
+
+    errors = []
+    model.error_occurred.connect(errors.append)
+    assert model.load_file(str(p)) is False
+    assert len(calls) == 1
+    assert errors and "broken event table" in errors[0]
+
+
+def test_event_parser_accepts_pre_split_lines():
+    from utils.annotation_csv_parser import (
+        extract_event_dataframe,
+        extract_event_dataframe_from_lines,
+    )
+
+    content = (
+        "﻿Event,Onset,Offset\n"
+        "Attack bites,5.0,6.0\n"
+        "\n"
+        "Behavior,Duration,Frequency\n"
+        "Attack bites,1.0,1\n"
+    )
+    from_lines = extract_event_dataframe_from_lines(content.splitlines())
+    pd.testing.assert_frame_equal(from_lines, extract_event_dataframe(content))
+    assert list(from_lines["Event"]) == ["Attack bites"]
+
+
+def test_event_parser_keeps_text_columns_and_coerces_junk_times():
+    from utils.annotation_csv_parser import extract_event_dataframe
+
+    df = extract_event_dataframe(
+        "Event,Onset,Offset,Note\n"
+        "007,1.5,2.0,01\n"
+        "Chasing,oops,3.0,x\n"
+    )
+    assert list(df["Event"]) == ["007", "Chasing"]
+    assert list(df["Note"]) == ["01", "x"]
+    assert df["Onset"].iloc[0] == pytest.approx(1.5)
+    assert pd.isna(df["Onset"].iloc[1])
+    assert df["Offset"].dtype.kind == "f"
@@ -0,0 +1,94 @@
+"""Icon / resource lookup in utils.app_icon."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from utils import app_icon
+
+
+def test_relative_candidates_keep_search_order():
+    paths = app_icon._icon_relative_paths(("RABET.png", "icon.ico"))
+    assert paths == (
+        Path("resources/RABET.png"),
+        Path("images/RABET.png"),
+        Path("RABET.png"),
+        Path("resources/icon.ico"),
+        Path("icon.ico"),
+    )
+
+
+def test_find_app_icon_path_prefers_resources_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        app_icon, "_ICON_RELATIVE_PATHS",
+        app_icon._icon_relative_paths(("RABET.ico", "icon.ico")),
+    )
+    assert app_icon.find_app_icon_path() is None
+
+    (tmp_path / "icon.ico").write_bytes(b"x")
+    assert app_icon.find_app_icon_path() == str((tmp_path / "icon.ico").resolve())
+
+    (tmp_path / "resources").mkdir()
+    (tmp_path / "resources" / "RABET.ico").write_bytes(b"x")
+    assert app_icon.find_app_icon_path() == str(
+        (tmp_path / "resources" / "RABET.ico").resolve()
+    )
+
+
+def test_find_resource_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert app_icon.find_resource_path("csvicon.png") is None
+    (tmp_path / "resources").mkdir()
+    (tmp_path / "resources" / "csvicon.png").write_bytes(b"x")
+    assert app_icon.find_resource_path("csvicon.png") == str(
+        (tmp_path / "resources" / "csvicon.png").resolve()
+    )
+
+
+def test_frozen_base_dirs_follow_the_executable(tmp_path, monkeypatch):
+    exe = tmp_path / "RABET.app" / "Contents" / "MacOS" / "RABET"
+    monkeypatch.setattr(app_icon.sys, "frozen", True, raising=False)
+    monkeypatch.setattr(app_icon.sys, "executable", str(exe))
+    monkeypatch.setattr(app_icon.sys, "_MEIPASS", str(tmp_path / "meipass"), raising=False)
+
+    macos_dir = exe.resolve().parent
+    assert app_icon._frozen_base_dirs() == (
+        macos_dir,
+        macos_dir.parent,
+        macos_dir.parent / "Resources",
+        tmp_path / "meipass",
+    )
+
+
+def test_frozen_base_dirs_empty_from_source(monkeypatch):
+    monkeypatch.delattr(app_icon.sys, "frozen", raising=False)
+    assert app_icon._frozen_base_dirs() == ()
+
+
+def test_find_resource_path_follows_filesystem_case_rules(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "resources").mkdir()
+    stored = tmp_path / "resources" / "csvicon.png"
+    stored.write_bytes(b"x")
+
+    requested = tmp_path / "resources" / "CSVIcon.png"
+    expected = str(requested.resolve()) if requested.exists() else None
+    assert app_icon.find_resource_path("CSVIcon.png") == expected
+
+
+def test_case_only_match_is_confirmed_with_the_filesystem(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "resources").mkdir()
+    (tmp_path / "resources" / "csvicon.png").write_bytes(b"x")
+    confirmed = []
+
+    def case_insensitive_exists(path):
+        confirmed.append(path.name)
+        return path.name.casefold() == "csvicon.png"
+
+    monkeypatch.setattr(app_icon.Path, "exists", case_insensitive_exists)
+    assert app_icon.find_resource_path("CSVIcon.png") == str(
+        (tmp_path / "resources" / "CSVIcon.png").resolve()
+    )
+    assert confirmed == ["CSVIcon.png"]
@@ -89,6 +89,7 @@ def _guard_with_fakes(monkeypatch, *, recording=False, dirty_ann=False,
         is_modified=lambda: project_modified,
         save_project=lambda: True,
     )
+    ctrl.project_controller = None  # Project tab never opened
     ctrl.main_window = None  # only used as QMessageBox parent
 
     button = getattr(QMessageBox.StandardButton, answer)
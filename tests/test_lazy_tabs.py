@@ -142,3 +142,43 @@ def test_warm_up_does_not_rebuild_an_open_tab(qt_app):
         assert c.visualization_view is built  # same instance, not rebuilt
     finally:
         _dispose_controller(c)
+
+
+def test_project_tab_is_lazy_until_opened(qt_app):
+    # The Project view/controller are built on first switch, through either
+    # the generic switch_to_view path or the dedicated project-mode action.
+    c = AppController()
+    try:
+        assert c.project_view is None
+        assert c.project_controller is None
+        assert c.log_manager is None
+
+        c.main_window.switch_to_project_mode()
+        assert c.project_view is not None
+        assert c.project_controller is not None
+        built = c.project_view
+
+        c.main_window.switch_to_view("Annotation")
+        c.main_window.switch_to_view("Project")
+        assert c.project_view is built  # same instance, not rebuilt
+    finally:
+        _dispose_controller(c)
+
+
+def test_shutdown_releases_error_connections(qt_app, monkeypatch):
+    from PySide6.QtWidgets import QMessageBox
+
+    shown = []
+    monkeypatch.setattr(
+        QMessageBox, "critical", staticmethod(lambda *a, **k: shown.append(a))
+    )
+    c = AppController()
+    try:
+        c.shutdown()
+        c.shutdown()  # idempotent
+        c.project_model.error_occurred.emit("boom")
+        c.video_model.error_occurred.emit("boom")
+        assert shown == []
+        assert c.main_window.annotation_controller is None
+    finally:
+        _dispose_controller(c)
@@ -0,0 +1,34 @@
+"""Automatic log cleanup re-arms itself as a single-shot timer."""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+
+from controllers.app_controller import AppController
+
+
+def _stub_controller(cleanup):
+    scheduled = []
+    c = SimpleNamespace(
+        logger=logging.getLogger("test"),
+        _ensure_log_manager=lambda: SimpleNamespace(cleanup_old_logs=cleanup),
+        _schedule_log_cleanup=lambda: scheduled.append(True),
+    )
+    c._cleanup_logs = lambda trigger: AppController._cleanup_logs(c, trigger)
+    return c, scheduled
+
+
+def test_auto_cleanup_reschedules_after_success():
+    c, scheduled = _stub_controller(lambda: (2, 1))
+    AppController._perform_log_cleanup_auto(c)
+    assert scheduled == [True]
+
+
+def test_auto_cleanup_reschedules_after_failure():
+    def _boom():
+        raise OSError("disk gone")
+
+    c, scheduled = _stub_controller(_boom)
+    AppController._perform_log_cleanup_auto(c)  # must not raise
+    assert scheduled == [True]
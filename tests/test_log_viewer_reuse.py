@@ -0,0 +1,23 @@
+"""LogViewerDialog can be hidden and re-shown (AppController reuses it)."""
+
+from __future__ import annotations
+
+from utils.log_manager import LogManager
+from views.log_viewer_dialog import LogViewerDialog
+
+
+def test_refresh_keeps_section_and_rearms_timer(qt_app):
+    dialog = LogViewerDialog(LogManager())
+    try:
+        dialog.show()
+        dialog.file_combo.setCurrentIndex(2)
+        dialog.hide()
+        assert not dialog.refresh_timer.isActive()  # stopped while hidden
+
+        dialog.refresh()
+        assert dialog.file_combo.currentIndex() == 2
+        assert dialog.file_combo.count() == 3
+        assert dialog.refresh_timer.isActive()
+    finally:
+        dialog.hide()
+        dialog.deleteLater()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -43,3 +44,171 @@ def test_create_project_succeeds_with_working_file_manager(tmp_path: Path, qt_ap
     assert ok is True
     assert model.is_project_open() is True
     assert (tmp_path / "MyProject" / "project.json").exists()
+
+
+def test_add_and_remove_keep_duplicate_checks_in_step(tmp_path: Path, qt_app):
+    model = ProjectModel(FileManager())
+    assert model.create_project(str(tmp_path), "MyProject") is True
+
+    sources = []
+    for index in range(3):
+        source = tmp_path / f"analysis_{index}.csv"
+        source.write_text("a,b\n", encoding="utf-8")
+        sources.append(source)
+        assert model.add_analysis(str(source), copy_to_project=False) is True
+    assert model.add_analysis(str(sources[0]), copy_to_project=False) is True
+    assert model.get_analyses() == [str(source) for source in sources]
+
+    assert model.remove_file(str(sources[1]), "analyses") is True
+    assert model.remove_file(str(sources[1]), "analyses") is False
+    assert model.add_analysis(str(sources[1]), copy_to_project=False) is True
+    assert model.get_analyses() == [str(sources[0]), str(sources[2]), str(sources[1])]
+
+    # A list edited without going through the model is picked up as well.
+    extra = tmp_path / "extra.csv"
+    extra.write_text("a,b\n", encoding="utf-8")
+    model._project_config["analyses"].append(str(extra))
+    assert model.add_analysis(str(extra), copy_to_project=False) is True
+    assert model.get_analyses().count(str(extra)) == 1
+
+
+def test_add_file_rejects_directories(tmp_path: Path, qt_app):
+    model = ProjectModel(FileManager())
+    assert model.create_project(str(tmp_path), "MyProject") is True
+    errors = []
+    model.error_occurred.connect(errors.append)
+
+    folder = tmp_path / "not_a_file.csv"
+    folder.mkdir()
+
+    assert model.add_analysis(str(folder), copy_to_project=False) is False
+    assert model.get_analyses() == []
+    assert errors
+
+
+class _CountingFileManager(FileManager):
+    """FileManager that counts JSON saves."""
+
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    def save_json(self, *args, **kwargs):
+        self.saves += 1
+        return super().save_json(*args, **kwargs)
+
+
+def test_save_project_skips_rewrite_when_unmodified(tmp_path: Path, qt_app):
+    file_manager = _CountingFileManager()
+    model = ProjectModel(file_manager)
+    assert model.create_project(str(tmp_path), "MyProject") is True
+    assert file_manager.saves == 1
+
+    saved = []
+    model.project_saved.connect(lambda: saved.append(True))
+
+    assert model.save_project() is True
+    assert file_manager.saves == 1
+    assert saved == [True]
+
+    assert model.set_project_description("changed") is True
+    assert model.save_project() is True
+    assert file_manager.saves == 2
+    assert model.is_modified() is False
+
+    # A manifest removed behind the model's back is written again.
+    (tmp_path / "MyProject" / "project.json").unlink()
+    assert model.save_project() is True
+    assert file_manager.saves == 3
+
+
+def test_add_files_reports_each_path(tmp_path: Path, qt_app):
+    model = ProjectModel(FileManager())
+    assert model.create_project(str(tmp_path), "MyProject") is True
+
+    present = tmp_path / "map.json"
+    present.write_text("{}", encoding="utf-8")
+    missing = tmp_path / "missing.json"
+
+    announced = []
+    model.files_added.connect(lambda file_type, count: announced.append((file_type, count)))
+    results = model.add_files([str(present), str(missing)], "action_maps")
+
+    assert results == [True, False]
+    assert announced == [("action_maps", 1)]
+    assert model.get_action_maps() == ["action_maps/map.json".replace("/", os.sep)]
+    assert (tmp_path / "MyProject" / "action_maps" / "map.json").exists()
+    assert model.add_files([str(present)], "bogus") == [False]
+
+
+def test_remove_file_deletes_only_copied_files(tmp_path: Path, qt_app):
+    model = ProjectModel(FileManager())
+    assert model.create_project(str(tmp_path), "MyProject") is True
+    project_dir = tmp_path / "MyProject"
+
+    external = tmp_path / "external.csv"
+    external.write_text("a,b\n", encoding="utf-8")
+    inside = project_dir / "exports" / "inside_annotations.csv"
+    inside.parent.mkdir()
+    inside.write_text("a,b\n", encoding="utf-8")
+
+    assert model.add_analysis(str(external), copy_to_project=True) is True
+    assert model.add_analysis(str(external), copy_to_project=False) is True
+    assert model.add_annotation(str(inside), copy_to_project=False, update_status=False) is True
+    copied = os.path.join("analyses", "external.csv")
+    stored_inside = os.path.join("exports", "inside_annotations.csv")
+    assert model.get_annotations() == [stored_inside]
+
+    assert model.remove_file(copied, "analyses") is True
+    assert not (project_dir / copied).exists()
+    assert model.remove_file(str(external), "analyses") is True
+    assert external.exists()
+    assert model.remove_file(stored_inside, "annotations") is True
+    assert inside.exists()
+
+
+def test_single_adds_announce_only_new_files(tmp_path: Path, qt_app):
+    model = ProjectModel(FileManager())
+    assert model.create_project(str(tmp_path), "MyProject") is True
+    announced = []
+    model.files_added.connect(lambda file_type, count: announced.append((file_type, count)))
+
+    source = tmp_path / "analysis.csv"
+    source.write_text("a,b\n", encoding="utf-8")
+    assert model.add_analysis(str(source), copy_to_project=False) is True
+    assert model.add_analysis(str(source), copy_to_project=False) is True
+
+    assert announced == [("analyses", 1)]
+
+
+def test_project_path_is_stored_absolute(tmp_path: Path, qt_app, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    model = ProjectModel(FileManager())
+
+    assert model.create_project("studies", "MyProject") is True
+    expected = str(tmp_path / "studies" / "MyProject")
+    assert model.get_project_path() == expected
+    for folder in ("videos", "annotations", "action_maps", "analyses"):
+        assert (tmp_path / "studies" / "MyProject" / folder).is_dir()
+
+    assert model.close_project() is True
+    assert model.load_project(os.path.join("studies", "MyProject") + os.sep) is True
+    assert model.get_project_path() == expected
+    assert model.get_project_name() == "MyProject"
+
+
+def test_add_files_logs_one_summary_line(tmp_path: Path, qt_app, caplog):
+    model = ProjectModel(FileManager())
+    assert model.create_project(str(tmp_path), "MyProject") is True
+    sources = []
+    for index in range(3):
+        source = tmp_path / f"analysis_{index}.csv"
+        source.write_text("a,b\n", encoding="utf-8")
+        sources.append(str(source))
+
+    with caplog.at_level("DEBUG", logger="models.project_model"):
+        assert model.add_files(sources, "analyses", copy_to_project=False) == [True] * 3
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert not any(message.startswith("Added analysis to project") for message in messages)
+    assert "Added 3 of 3 analyses to project" in messages
@@ -0,0 +1,74 @@
+"""File-list edits in the Project tab are saved on a debounce, not per file."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from controllers.project_controller import ProjectController
+from models.project_model import ProjectModel
+from utils.file_manager import FileManager
+from views.project_view import ProjectView
+
+
+def _controller(tmp_path):
+    model = ProjectModel(FileManager())
+    model.create_project(str(tmp_path), "P")
+    view = ProjectView()
+    action_maps = SimpleNamespace(refresh_scope_display=lambda _name: None)
+    controller = ProjectController(model, view, None, action_maps, None, None)
+    return controller, model, view
+
+
+def _video(tmp_path, name):
+    path = tmp_path / name
+    path.write_bytes(b"video-bytes")
+    return str(path)
+
+
+def test_add_file_defers_save_until_flush(tmp_path, qt_app):
+    controller, model, view = _controller(tmp_path)
+    try:
+        controller.on_add_file_requested("videos", _video(tmp_path, "a.mp4"), False)
+        controller.on_add_file_requested("videos", _video(tmp_path, "b.mp4"), False)
+
+        assert model.is_modified()  # not written yet
+        assert controller._save_debounce.isActive()
+
+        controller.flush_pending_save()
+        assert not model.is_modified()
+        assert not controller._save_debounce.isActive()
+        assert len(model.get_videos()) == 2
+    finally:
+        view.deleteLater()
+
+
+def test_flush_without_pending_save_is_a_no_op(tmp_path, qt_app):
+    controller, model, view = _controller(tmp_path)
+    try:
+        saved = []
+        model.project_saved.connect(lambda: saved.append(True))
+        controller.flush_pending_save()
+        assert saved == []
+    finally:
+        view.deleteLater()
+
+
+def test_add_files_refreshes_lists_once_and_defers_save(tmp_path, qt_app, monkeypatch):
+    controller, model, view = _controller(tmp_path)
+    try:
+        refreshes = []
+        original = controller._update_file_lists
+        monkeypatch.setattr(
+            controller, "_update_file_lists",
+            lambda: refreshes.append(True) or original(),
+        )
+        paths = [_video(tmp_path, f"{name}.mp4") for name in ("a", "b", "c")]
+
+        view.add_files_requested.emit("videos", paths, False)
+
+        assert model.get_videos() == paths
+        assert refreshes == [True]
+        assert model.is_modified()
+        assert controller._save_debounce.isActive()
+    finally:
+        view.deleteLater()
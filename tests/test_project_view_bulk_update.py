@@ -0,0 +1,53 @@
+"""ProjectView bulk setters used by ProjectController."""
+
+from __future__ import annotations
+
+from views.project_view import ProjectView
+
+
+def test_update_all_files_fills_and_clears_every_tree(qt_app):
+    view = ProjectView()
+    try:
+        view.update_all_files(
+            {
+                "videos": ["videos/a.mp4", "videos/b.mp4"],
+                "annotations": ["annotations/a.csv"],
+                "action_maps": ["action_maps/map.json"],
+                "analyses": ["analyses/summary.csv"],
+            },
+            {"videos/a.mp4": "annotated"},
+        )
+        assert view.videos_tree.topLevelItemCount() == 2
+        assert view.videos_tree.topLevelItem(0).text(2) == "Annotated"
+        assert view.videos_tree.topLevelItem(1).text(2) == "Not Annotated"
+        assert view.annotations_tree.topLevelItemCount() == 1
+        assert view.action_maps_tree.topLevelItemCount() == 1
+        assert view.analyses_tree.topLevelItemCount() == 1
+
+        view.update_all_files({})
+        assert view.videos_tree.topLevelItemCount() == 0
+        assert view.annotations_tree.topLevelItemCount() == 0
+        assert view.action_maps_tree.topLevelItemCount() == 0
+        assert view.analyses_tree.topLevelItemCount() == 0
+        assert view.updatesEnabled()
+    finally:
+        view.deleteLater()
+
+
+def test_set_project_metadata_sets_all_fields(qt_app):
+    view = ProjectView()
+    try:
+        view.set_project_metadata(
+            "Study", "/tmp/study", "desc", "2026-01-02T03:04:05", ""
+        )
+        assert view.project_name_label.text() == "Study"
+        assert view.project_path_label.text() == "/tmp/study"
+        assert view.description_text.toPlainText() == "desc"
+        assert view.created_date_label.text() == "Created: 2026-01-02 03:04"
+        assert view.modified_date_label.text() == "Modified: -"
+
+        view.set_project_metadata("", "", "", "", "")
+        assert view.project_name_label.text() == "No Project Open"
+        assert not view.save_button.isEnabled()
+    finally:
+        view.deleteLater()
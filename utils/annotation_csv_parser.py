@@ -46,13 +46,22 @@ def extract_event_dataframe(content, logger=None):
     event table. This helper centralizes the extraction logic so analysis and
     visualization parse files consistently.
     """
+    return extract_event_dataframe_from_lines(content.splitlines(), logger=logger)
+
+
+def extract_event_dataframe_from_lines(lines, logger=None):
+    """
+    Same as :func:`extract_event_dataframe`, for content already split into lines.
+
+    Lets a caller that scans the lines itself (e.g. for metadata) parse the
+    event table without splitting the file content a second time.
+    """
     logger = logger or logging.getLogger(__name__)
 
     # Strip a leading UTF-8 BOM so the first header line is recognised.
-    if content.startswith(_BOM):
-        content = content[len(_BOM):]
+    if lines and lines[0].startswith(_BOM):
+        lines = [lines[0][len(_BOM):], *lines[1:]]
 
-    lines = content.splitlines()
     start_line = -1
     end_line = len(lines)
 
@@ -69,9 +78,24 @@ def extract_event_dataframe(content, logger=None):
                 break
 
         csv_content = '\n'.join(lines[start_line:end_line])
-        df = pd.read_csv(io.StringIO(csv_content), dtype=str)
+        # Every column but Onset/Offset stays text. Those two are left to the
+        # C parser, which writes floats straight into the column instead of
+        # materialising a string per cell for ``pd.to_numeric`` to convert;
+        # ``round_trip`` keeps the values bit-identical to Python's float().
+        # A column holding non-numeric junk still comes back as text and is
+        # coerced by ``normalize_event_dataframe`` as before.
+        text_columns = {
+            index: str
+            for index in range(len(_row_fields(lines[start_line])))
+            if index not in (1, 2)
+        }
+        df = pd.read_csv(
+            io.StringIO(csv_content),
+            dtype=text_columns,
+            float_precision='round_trip',
+        )
     else:
-        df = pd.read_csv(io.StringIO(content), dtype=str)
+        df = pd.read_csv(io.StringIO('\n'.join(lines)), dtype=str)
 
     # Normalise column names (strip whitespace / stray BOM) so a header cell
     # with trailing spaces or a stray BOM still maps to the canonical name.
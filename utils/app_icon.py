@@ -2,48 +2,88 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
 
-def _icon_names_for_platform() -> list[str]:
+def _icon_names_for_platform() -> tuple[str, ...]:
     if sys.platform == "darwin":
-        return ["RABET.icns", "RABET.png", "RABET.ico", "icon.ico"]
+        return ("RABET.icns", "RABET.png", "RABET.ico", "icon.ico")
     if sys.platform.startswith("linux"):
-        return ["RABET.png", "RABET.ico", "RABET.icns", "icon.ico"]
-    return ["RABET.ico", "RABET.png", "RABET.icns", "icon.ico"]
+        return ("RABET.png", "RABET.ico", "RABET.icns", "icon.ico")
+    return ("RABET.ico", "RABET.png", "RABET.icns", "icon.ico")
 
 
-def _base_dirs() -> list[Path]:
-    bases = [Path.cwd()]
-
-    if getattr(sys, "frozen", False):
-        exe_dir = Path(sys.executable).resolve().parent
-        bases.extend(
-            [
-                exe_dir,
-                exe_dir.parent,
-                exe_dir.parent / "Resources",
-            ]
-        )
-
-        meipass = getattr(sys, "_MEIPASS", None)
-        if meipass:
-            bases.append(Path(meipass))
-
-    return bases
-
-
-def find_app_icon_path() -> str | None:
-    """Return the first existing icon path suitable for the current platform."""
-    names = _icon_names_for_platform()
+def _icon_relative_paths(names: tuple[str, ...]) -> tuple[Path, ...]:
     relative_paths: list[Path] = []
     for name in names:
         relative_paths.append(Path("resources") / name)
         if name.endswith(".png"):
             relative_paths.append(Path("images") / name)
         relative_paths.append(Path(name))
+    return tuple(relative_paths)
+
+
+# The platform never changes within a process, so the icon candidates
+# (relative to each base directory) are built once at import.
+_ICON_RELATIVE_PATHS = _icon_relative_paths(_icon_names_for_platform())
+
+
+def _frozen_base_dirs() -> tuple[Path, ...]:
+    """Bundle directories of a frozen (PyInstaller) build; empty from source."""
+    if not getattr(sys, "frozen", False):
+        return ()
+
+    exe_dir = Path(sys.executable).resolve().parent
+    bases = [
+        exe_dir,
+        exe_dir.parent,
+        exe_dir.parent / "Resources",
+    ]
+
+    meipass = getattr(sys, "_MEIPASS", None)
+    if meipass:
+        bases.append(Path(meipass))
+
+    return tuple(bases)
+
+
+# The executable location is fixed for the life of the process, so the
+# bundle directories are resolved once; only the working directory is
+# looked up per call.
+_FROZEN_BASE_DIRS = _frozen_base_dirs()
+
+
+def _base_dirs() -> list[Path]:
+    return [Path.cwd(), *_FROZEN_BASE_DIRS]
 
+
+def _dir_entry_names(directory: Path) -> tuple[frozenset[str], frozenset[str]]:
+    """Return the entry names of ``directory`` and their casefolded forms.
+
+    Both sets are empty if the directory cannot be read.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            names = frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset(), frozenset()
+    return names, frozenset(name.casefold() for name in names)
+
+
+def _find_first_existing(relative_paths) -> str | None:
+    """Return the first resolved ``base_dir / relative_path`` that exists.
+
+    Candidates in a resource subfolder (``resources/``, ``images/``) are
+    checked against one ``os.scandir`` listing per folder instead of one
+    stat each. A name that only matches when case is ignored is confirmed
+    with ``exists()``, so case-insensitive filesystems (Windows, macOS)
+    still find it. Bare names in the base directory itself are checked
+    with ``exists()``: listing the working directory on every call would
+    cost more than the stat it saves.
+    """
+    listings: dict[Path, tuple[frozenset[str], frozenset[str]]] = {}
     seen: set[Path] = set()
     for base_dir in _base_dirs():
         for relative_path in relative_paths:
@@ -51,12 +91,28 @@ def find_app_icon_path() -> str | None:
             if candidate in seen:
                 continue
             seen.add(candidate)
-            if candidate.exists():
+            if relative_path.parent == Path("."):
+                if candidate.exists():
+                    return str(candidate)
+                continue
+            directory = base_dir / relative_path.parent
+            listing = listings.get(directory)
+            if listing is None:
+                listing = listings[directory] = _dir_entry_names(directory)
+            names, folded_names = listing
+            name = relative_path.name
+            if name in names or (
+                name.casefold() in folded_names and candidate.exists()
+            ):
                 return str(candidate)
-
     return None
 
 
+def find_app_icon_path() -> str | None:
+    """Return the first existing icon path suitable for the current platform."""
+    return _find_first_existing(_ICON_RELATIVE_PATHS)
+
+
 def find_resource_path(filename: str) -> str | None:
     """Return the path to a bundled resource file, or None if missing.
 
@@ -64,14 +120,4 @@ def find_resource_path(filename: str) -> str | None:
     the same base directories used for the app icon, so it resolves both
     in a source checkout and inside a PyInstaller bundle (``sys._MEIPASS``).
     """
-    relative_paths = [Path("resources") / filename, Path(filename)]
-    seen: set[Path] = set()
-    for base_dir in _base_dirs():
-        for relative_path in relative_paths:
-            candidate = (base_dir / relative_path).resolve()
-            if candidate in seen:
-                continue
-            seen.add(candidate)
-            if candidate.exists():
-                return str(candidate)
-    return None
+    return _find_first_existing((Path("resources") / filename, Path(filename)))
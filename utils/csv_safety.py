@@ -60,5 +60,6 @@ class SafeCsvWriter:
         self._writer.writerow([sanitize_csv_cell(cell) for cell in row])
 
     def writerows(self, rows: Iterable[Iterable]) -> None:
-        for row in rows:
-            self.writerow(row)
+        self._writer.writerows(
+            [sanitize_csv_cell(cell) for cell in row] for row in rows
+        )
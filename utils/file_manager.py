@@ -4,8 +4,59 @@ import json
 import csv
 import logging
 import shutil
+import tempfile
 from pathlib import Path
 
+
+def atomic_write_text(file_path, text, backup=False):
+    """Write ``text`` to ``file_path`` atomically (BUG-019).
+
+    The text goes to a temporary file in the same directory, is flushed and
+    ``fsync``'d where supported, then ``os.replace``'d over the target, so a
+    failed write never leaves a truncated file behind. With ``backup=True``
+    the previous file is kept as ``<name>.bak``.
+
+    Raises:
+        OSError: If the temporary file cannot be written or moved into place.
+    """
+    file_path = Path(file_path)
+    tmp_path = None
+    try:
+        # Temp file in the SAME directory so os.replace is atomic (same
+        # filesystem). delete=False because we close then replace.
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{file_path.name}.", suffix=".tmp", dir=str(file_path.parent)
+        )
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            try:
+                os.fsync(f.fileno())
+            except OSError:
+                # Not all filesystems support fsync; the os.replace below
+                # still gives crash-consistency on common platforms.
+                pass
+
+        if backup and file_path.exists():
+            try:
+                backup_path = file_path.with_name(file_path.name + ".bak")
+                os.replace(str(file_path), str(backup_path))
+            except OSError as exc:
+                logging.getLogger(__name__).warning(
+                    f"Could not write backup for {file_path}: {exc}"
+                )
+
+        os.replace(tmp_path, str(file_path))
+        tmp_path = None  # consumed by replace
+    finally:
+        # Clean up the temp file if replace never happened.
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
 class FileManager:
     """
     Utility class for handling file operations throughout the application.
@@ -143,7 +194,8 @@ class FileManager:
             bool: True if the file exists, False otherwise
         """
         file_path = Path(file_path)
-        exists = file_path.exists() and file_path.is_file()
+        # is_file() is False for a missing path, so one stat suffices.
+        exists = file_path.is_file()
         
         if not exists:
             self.logger.warning(f"File not found: {file_path}")
@@ -255,47 +307,13 @@ class FileManager:
                 self.logger.error(f"Failed to save JSON to {file_path}: {str(e)}")
                 return False
 
-        import os
-        import tempfile
-
-        tmp_path = None
         try:
-            # Temp file in the SAME directory so os.replace is atomic (same
-            # filesystem). delete=False because we close then replace.
-            fd, tmp_path = tempfile.mkstemp(
-                prefix=f".{file_path.name}.", suffix=".tmp", dir=str(file_path.parent)
-            )
-            with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                f.write(payload)
-                f.flush()
-                try:
-                    os.fsync(f.fileno())
-                except OSError:
-                    # Not all filesystems support fsync; the os.replace below
-                    # still gives crash-consistency on common platforms.
-                    pass
-
-            if backup and file_path.exists():
-                try:
-                    backup_path = file_path.with_name(file_path.name + ".bak")
-                    os.replace(str(file_path), str(backup_path))
-                except OSError as exc:
-                    self.logger.warning(f"Could not write backup for {file_path}: {exc}")
-
-            os.replace(tmp_path, str(file_path))
-            tmp_path = None  # consumed by replace
+            atomic_write_text(file_path, payload, backup=backup)
             self.logger.debug(f"Atomically saved JSON to {file_path}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to save JSON to {file_path}: {str(e)}")
             return False
-        finally:
-            # Clean up the temp file if replace never happened.
-            if tmp_path is not None:
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
     
     def load_csv(self, file_path):
         """
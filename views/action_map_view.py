@@ -258,7 +258,7 @@ class ActionMapView(QWidget):
         """
         self.active_behaviors.setRowCount(0)
         
-        self.logger.debug(f"Updating active behaviors: {active_behaviors}")
+        self.logger.debug("Updating active behaviors: %s", active_behaviors)
         
         # Set a distinctive font for active behaviors (instead of background color)
         font = QFont()
@@ -63,10 +63,8 @@ class AnalysisView(QWidget):
     @staticmethod
     def _animal_id_from_path(file_path):
         """Return the display animal_id for an annotation path."""
-        animal_id = os.path.splitext(os.path.basename(file_path))[0]
-        if animal_id.endswith('_annotations'):
-            animal_id = animal_id[: -len('_annotations')]
-        return animal_id
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        return stem.removesuffix('_annotations')
 
     @staticmethod
     def _animal_sort_key(animal_id):
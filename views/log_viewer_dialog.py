@@ -159,6 +159,22 @@ class LogViewerDialog(QDialog):
             self.file_table.setItem(row, 1, QTableWidgetItem(section['size']))
             self.file_table.setItem(row, 2, QTableWidgetItem(section['date']))
     
+    def refresh(self):
+        """Reload sections and content when a reused dialog is shown again.
+
+        Keeps the selected section, line limit and filter, and re-arms
+        auto-refresh (the timer is stopped while the dialog is hidden).
+        """
+        section_index = self.file_combo.currentIndex()
+        self.file_combo.blockSignals(True)
+        try:
+            self.load_log_files()
+            if 0 <= section_index < self.file_combo.count():
+                self.file_combo.setCurrentIndex(section_index)
+        finally:
+            self.file_combo.blockSignals(False)
+        self.refresh_log_content()
+
     def refresh_log_content(self):
         """Refresh the log content display."""
         try:
@@ -337,6 +353,11 @@ class LogViewerDialog(QDialog):
                 self.file_combo.setCurrentIndex(i)
                 break
     
+    def hideEvent(self, event):
+        """Stop auto-refresh while hidden (reject/Escape skip closeEvent)."""
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
     def closeEvent(self, event):
         """Handle window close event."""
         # Stop timer when window is closed
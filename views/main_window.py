@@ -708,6 +708,8 @@ class MainWindow(QMainWindow):
         
         # If we have a project view, set it as current
         if "Project" in self._view_index:
+            # The Project view is registered lazily by AppController.
+            self._ensure_lazy_view_built("Project")
             self.stacked_widget.setCurrentIndex(self._view_index["Project"])
             
             # Update checkable actions
@@ -28,6 +28,7 @@ class ProjectView(QWidget):
         close_project_requested: Emitted when close project is requested
         description_changed: Emitted when project description is changed
         add_file_requested: Emitted when add file is requested (file_type, path, copy_to_project)
+        add_files_requested: Emitted when several files are added at once (file_type, paths, copy_to_project)
         remove_file_requested: Emitted when remove file is requested (file_type, path)
         open_file_requested: Emitted when open file is requested (file_type, path)
         annotate_video_requested: Emitted when video annotation is requested (video_path)
@@ -42,6 +43,7 @@ class ProjectView(QWidget):
     description_changed = Signal(str)
     
     add_file_requested = Signal(str, str, bool)     # file_type, path, copy_to_project
+    add_files_requested = Signal(str, list, bool)   # file_type, paths, copy_to_project
     remove_file_requested = Signal(str, str)        # file_type, path
     open_file_requested = Signal(str, str)          # file_type, path
     annotate_video_requested = Signal(str)          # video_path
@@ -433,8 +435,7 @@ class ProjectView(QWidget):
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 copy_to_project = dialog.copy_checkbox.isChecked()
                 
-                for file_path in file_paths:
-                    self.add_file_requested.emit("videos", file_path, copy_to_project)
+                self.add_files_requested.emit("videos", file_paths, copy_to_project)
     
     def on_add_annotation_clicked(self):
         """Handle add annotation button clicked."""
@@ -448,8 +449,7 @@ class ProjectView(QWidget):
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 copy_to_project = dialog.copy_checkbox.isChecked()
                 
-                for file_path in file_paths:
-                    self.add_file_requested.emit("annotations", file_path, copy_to_project)
+                self.add_files_requested.emit("annotations", file_paths, copy_to_project)
     
     def on_add_action_map_clicked(self):
         """Handle add action map button clicked."""
@@ -463,8 +463,7 @@ class ProjectView(QWidget):
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 copy_to_project = dialog.copy_checkbox.isChecked()
                 
-                for file_path in file_paths:
-                    self.add_file_requested.emit("action_maps", file_path, copy_to_project)
+                self.add_files_requested.emit("action_maps", file_paths, copy_to_project)
     
     def on_add_analysis_clicked(self):
         """Handle add analysis button clicked."""
@@ -478,8 +477,7 @@ class ProjectView(QWidget):
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 copy_to_project = dialog.copy_checkbox.isChecked()
                 
-                for file_path in file_paths:
-                    self.add_file_requested.emit("analyses", file_path, copy_to_project)
+                self.add_files_requested.emit("analyses", file_paths, copy_to_project)
     
     def on_annotate_selected_clicked(self):
         """Handle annotate selected video button clicked."""
@@ -680,6 +678,29 @@ class ProjectView(QWidget):
         else:
             self.modified_date_label.setText("Modified: -")
     
+    def set_project_metadata(self, name, path, description, created_date, modified_date):
+        """
+        Set all project information fields in one update.
+
+        Repaints are suspended while the labels change so the panel is
+        redrawn once rather than once per field.
+
+        Args:
+            name (str): Name of the project
+            path (str): Path to the project directory
+            description (str): Project description
+            created_date (str): Creation date
+            modified_date (str): Modification date
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.set_project_name(name)
+            self.set_project_path(path)
+            self.set_project_description(description)
+            self.set_project_dates(created_date, modified_date)
+        finally:
+            self.setUpdatesEnabled(True)
+    
     def enable_project_controls(self, enabled):
         """
         Enable or disable project-specific controls.
@@ -716,6 +737,7 @@ class ProjectView(QWidget):
         if annotation_status is None:
             annotation_status = {}
         
+        items = []
         for video_path in videos:
             name = os.path.basename(video_path)
             video_id = os.path.splitext(name)[0]
@@ -734,7 +756,9 @@ class ProjectView(QWidget):
                 # Use bright red for "Not Annotated" to stand out against dark background
                 item.setForeground(2, Qt.GlobalColor.red)
                 
-            self.videos_tree.addTopLevelItem(item)
+            items.append(item)
+
+        self.videos_tree.addTopLevelItems(items)
             
         # Update annotate selected button state
         self.update_annotate_selected_button_state()
@@ -748,11 +772,10 @@ class ProjectView(QWidget):
             annotations (list): List of annotation paths
         """
         self.annotations_tree.clear()
-        
-        for annotation_path in annotations:
-            name = os.path.basename(annotation_path)
-            item = QTreeWidgetItem([name, annotation_path])
-            self.annotations_tree.addTopLevelItem(item)
+        self.annotations_tree.addTopLevelItems([
+            QTreeWidgetItem([os.path.basename(annotation_path), annotation_path])
+            for annotation_path in annotations
+        ])
     
     @Slot(list)
     def update_action_maps(self, action_maps):
@@ -763,11 +786,10 @@ class ProjectView(QWidget):
             action_maps (list): List of action map paths
         """
         self.action_maps_tree.clear()
-        
-        for action_map_path in action_maps:
-            name = os.path.basename(action_map_path)
-            item = QTreeWidgetItem([name, action_map_path])
-            self.action_maps_tree.addTopLevelItem(item)
+        self.action_maps_tree.addTopLevelItems([
+            QTreeWidgetItem([os.path.basename(action_map_path), action_map_path])
+            for action_map_path in action_maps
+        ])
     
     @Slot(list)
     def update_analyses(self, analyses):
@@ -778,11 +800,32 @@ class ProjectView(QWidget):
             analyses (list): List of analysis paths
         """
         self.analyses_tree.clear()
-        
-        for analysis_path in analyses:
-            name = os.path.basename(analysis_path)
-            item = QTreeWidgetItem([name, analysis_path])
-            self.analyses_tree.addTopLevelItem(item)
+        self.analyses_tree.addTopLevelItems([
+            QTreeWidgetItem([os.path.basename(analysis_path), analysis_path])
+            for analysis_path in analyses
+        ])
+    
+    def update_all_files(self, files, annotation_status=None):
+        """
+        Update all four file trees in one update.
+
+        Repaints are suspended while the trees are rebuilt so the panel is
+        redrawn once rather than once per tree.
+
+        Args:
+            files (dict): ``{"videos": [...], "annotations": [...],
+                "action_maps": [...], "analyses": [...]}``; missing keys
+                clear the corresponding tree.
+            annotation_status (dict, optional): Dictionary of video annotation status
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.update_videos(files.get("videos", []), annotation_status)
+            self.update_annotations(files.get("annotations", []))
+            self.update_action_maps(files.get("action_maps", []))
+            self.update_analyses(files.get("analyses", []))
+        finally:
+            self.setUpdatesEnabled(True)
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """
@@ -833,8 +876,7 @@ class ProjectView(QWidget):
                 copy_to_project = dialog.copy_checkbox.isChecked()
                 
                 # Add videos to project
-                for file_path in file_paths:
-                    self.add_file_requested.emit("videos", file_path, copy_to_project)
+                self.add_files_requested.emit("videos", file_paths, copy_to_project)
         else:
             event.ignore()
 